@@ -1,7 +1,10 @@
 """Confluence reader."""
+import functools
 import logging
 import os
-from typing import Dict, List, Optional
+import threading
+from concurrent.futures import Executor, ProcessPoolExecutor, ThreadPoolExecutor
+from typing import Callable, Dict, List, Optional
 from urllib.parse import unquote
 
 from llama_index.readers.base import BaseReader
@@ -15,6 +18,53 @@ CONFLUENCE_USERNAME = "CONFLUENCE_USERNAME"
 logger = logging.getLogger(__name__)
 
 
+def _pdf_to_text(content: bytes) -> str:
+    import pytesseract  # type: ignore
+    from pdf2image import convert_from_bytes  # type: ignore
+
+    text = ""
+    try:
+        images = convert_from_bytes(content)
+    except ValueError:
+        return text
+
+    for i, image in enumerate(images):
+        image_text = pytesseract.image_to_string(image)
+        text += f"Page {i + 1}:\n{image_text}\n\n"
+
+    return text
+
+
+def _image_to_text(content: bytes) -> str:
+    from io import BytesIO  # type: ignore
+
+    import pytesseract  # type: ignore
+    from PIL import Image  # type: ignore
+
+    try:
+        image = Image.open(BytesIO(content))
+    except OSError:
+        return ""
+
+    return pytesseract.image_to_string(image)
+
+
+def _xls_to_text(content: bytes) -> str:
+    import xlrd  # type: ignore
+
+    text = ""
+    workbook = xlrd.open_workbook(file_contents=content)
+    for sheet in workbook.sheets():
+        text += f"{sheet.name}:\n"
+        for row in range(sheet.nrows):
+            for col in range(sheet.ncols):
+                text += f"{sheet.cell_value(row, col)}\t"
+            text += "\n"
+        text += "\n"
+
+    return text
+
+
 class ConfluenceReader(BaseReader):
     """Confluence reader.
 
@@ -28,11 +78,20 @@ class ConfluenceReader(BaseReader):
         oauth2 (dict): Atlassian OAuth 2.0, minimum fields are `client_id` and `token`, where `token` is a dict and must at least contain "access_token" and "token_type".
         base_url (str): 'base_url' for confluence cloud instance, this is suffixed with '/wiki', eg 'https://yoursite.atlassian.com/wiki'
         cloud (bool): connecting to Confluence Cloud or self-hosted instance
+        num_workers (int): Number of threads fetching pages, child page ids and attachments concurrently, each with a Confluence client of its own.
+        page_batch_size (int): Number of pages looked up per CQL `id in (...)` query when loading by `page_ids`.
+        num_attachment_workers (int): Number of processes converting PDF, image and Excel attachments to text. With 0, attachments are converted in the thread that downloads them.
 
     """
 
     def __init__(
-        self, base_url: str = None, oauth2: Optional[Dict] = None, cloud: bool = True
+        self,
+        base_url: str = None,
+        oauth2: Optional[Dict] = None,
+        cloud: bool = True,
+        num_workers: int = 8,
+        page_batch_size: int = 25,
+        num_attachment_workers: int = 0,
     ) -> None:
         if base_url is None:
             raise ValueError("Must provide `base_url`")
@@ -46,13 +105,12 @@ class ConfluenceReader(BaseReader):
                 "`atlassian` package not found, please run `pip install"
                 " atlassian-python-api`"
             )
-        self.confluence: Confluence = None
         if oauth2:
-            self.confluence = Confluence(url=base_url, oauth2=oauth2, cloud=cloud)
+            client_kwargs = dict(url=base_url, oauth2=oauth2, cloud=cloud)
         else:
             api_token = os.getenv(CONFLUENCE_API_TOKEN)
             if api_token is not None:
-                self.confluence = Confluence(url=base_url, token=api_token, cloud=cloud)
+                client_kwargs = dict(url=base_url, token=api_token, cloud=cloud)
             else:
                 user_name = os.getenv(CONFLUENCE_USERNAME)
                 if user_name is None:
@@ -66,10 +124,20 @@ class ConfluenceReader(BaseReader):
                         "Must set environment variable `CONFLUENCE_PASSWORD` if oauth,"
                         " oauth2, or `CONFLUENCE_API_TOKEN` are not provided."
                     )
-                self.confluence = Confluence(
+                client_kwargs = dict(
                     url=base_url, username=user_name, password=password, cloud=cloud
                 )
 
+        # the session of a client is not thread safe, each thread gets a client
+        self._new_confluence = functools.partial(Confluence, **client_kwargs)
+        self._confluences = threading.local()
+        self._confluences.client = self._new_confluence()
+
+        self.num_workers = num_workers
+        self.page_batch_size = page_batch_size
+        self.num_attachment_workers = num_attachment_workers
+        self._attachment_executor: Optional[Executor] = None
+        self._text_makers = threading.local()
         self._next_cursor = None
 
     def load_data(
@@ -145,83 +213,205 @@ class ConfluenceReader(BaseReader):
             )
 
         try:
-            import html2text  # type: ignore
+            import html2text  # type: ignore # noqa: F401
         except ImportError:
             raise ImportError(
                 "`html2text` package not found, please run `pip install html2text`"
             )
 
-        text_maker = html2text.HTML2Text()
-        text_maker.ignore_links = True
-        text_maker.ignore_images = True
-
         if not start:
             start = 0
 
-        pages: List = []
-        if space_key:
-            pages.extend(
-                self._get_data_with_paging(
-                    self.confluence.get_all_pages_from_space,
-                    start=start,
-                    max_num_results=max_num_results,
-                    space=space_key,
-                    status=page_status,
-                    expand="body.export_view.value",
-                    content_type="page",
-                )
+        executor = ThreadPoolExecutor(max_workers=self.num_workers)
+        if include_attachments and self.num_attachment_workers > 0:
+            self._attachment_executor = ProcessPoolExecutor(
+                max_workers=self.num_attachment_workers
             )
-        elif label:
-            pages.extend(
-                self._get_cql_data_with_paging(
-                    start=start,
-                    cursor=cursor,
-                    cql=f'type="page" AND label="{label}"',
-                    max_num_results=max_num_results,
-                    expand="body.export_view.value",
-                )
-            )
-        elif cql:
-            pages.extend(
-                self._get_cql_data_with_paging(
-                    start=start,
-                    cursor=cursor,
-                    cql=cql,
-                    max_num_results=max_num_results,
-                    expand="body.export_view.value",
+        try:
+            pages: List = []
+            if space_key:
+                pages.extend(
+                    self._get_data_with_paging(
+                        self.confluence.get_all_pages_from_space,
+                        start=start,
+                        max_num_results=max_num_results,
+                        space=space_key,
+                        status=page_status,
+                        expand="body.export_view.value",
+                        content_type="page",
+                    )
                 )
-            )
-        elif page_ids:
-            if include_children:
-                dfs_page_ids = []
-                max_num_remaining = max_num_results
-                for page_id in page_ids:
-                    current_dfs_page_ids = self._dfs_page_ids(
-                        page_id, max_num_remaining
+            elif label:
+                pages.extend(
+                    self._get_cql_data_with_paging(
+                        start=start,
+                        cursor=cursor,
+                        cql=f'type="page" AND label="{label}"',
+                        max_num_results=max_num_results,
+                        expand="body.export_view.value",
                     )
-                    dfs_page_ids.extend(current_dfs_page_ids)
-                    if max_num_results is not None:
-                        max_num_remaining -= len(current_dfs_page_ids)
-                        if max_num_remaining <= 0:
-                            break
-                page_ids = dfs_page_ids
-            for page_id in (
-                page_ids[:max_num_results] if max_num_results is not None else page_ids
-            ):
-                pages.append(
-                    self._get_data_with_retry(
-                        self.confluence.get_page_by_id,
-                        page_id=page_id,
+                )
+            elif cql:
+                pages.extend(
+                    self._get_cql_data_with_paging(
+                        start=start,
+                        cursor=cursor,
+                        cql=cql,
+                        max_num_results=max_num_results,
                         expand="body.export_view.value",
                     )
                 )
+            elif page_ids:
+                if include_children:
+                    dfs_page_ids = []
+                    max_num_remaining = max_num_results
+                    for page_id in page_ids:
+                        if max_num_results is None:
+                            current_dfs_page_ids = self._get_descendant_page_ids(
+                                page_id, executor
+                            )
+                        else:
+                            current_dfs_page_ids = self._dfs_page_ids(
+                                page_id, max_num_remaining
+                            )
+                        dfs_page_ids.extend(current_dfs_page_ids)
+                        if max_num_results is not None:
+                            max_num_remaining -= len(current_dfs_page_ids)
+                            if max_num_remaining <= 0:
+                                break
+                    page_ids = dfs_page_ids
+                if max_num_results is not None:
+                    page_ids = page_ids[:max_num_results]
+                pages.extend(self._get_pages_by_id(page_ids, executor))
+
+            if include_attachments:
+                # attachments are downloaded concurrently, each thread
+                # converting its pages with its own `HTML2Text`
+                return list(
+                    executor.map(
+                        lambda page: self.process_page(
+                            page, include_attachments, self._get_text_maker()
+                        ),
+                        pages,
+                    )
+                )
+
+            text_maker = self._get_text_maker()
+            return [
+                self.process_page(page, include_attachments, text_maker)
+                for page in pages
+            ]
+        finally:
+            executor.shutdown()
+            if self._attachment_executor is not None:
+                self._attachment_executor.shutdown()
+                self._attachment_executor = None
+
+    @property
+    def confluence(self):
+        """The Confluence client of the current thread."""
+        client = getattr(self._confluences, "client", None)
+        if client is None:
+            client = self._confluences.client = self._new_confluence()
+        return client
+
+    @confluence.setter
+    def confluence(self, client) -> None:
+        # a client set by the caller is shared by all threads
+        self._new_confluence = lambda: client
+        self._confluences = threading.local()
+
+    def _get_text_maker(self):
+        """Get the `HTML2Text` of the current thread, as it is not thread safe."""
+        import html2text  # type: ignore
+
+        if not hasattr(self._text_makers, "text_maker"):
+            text_maker = html2text.HTML2Text()
+            text_maker.ignore_links = True
+            text_maker.ignore_images = True
+            self._text_makers.text_maker = text_maker
+        return self._text_makers.text_maker
+
+    def _get_child_page_ids(self, page_id) -> List:
+        return self._get_data_with_paging(
+            self.confluence.get_child_id_list,
+            page_id=page_id,
+            type="page",
+            max_num_results=None,
+        )
+
+    def _get_descendant_page_ids(self, page_id, executor: Executor) -> List:
+        """Get a page id and the ids of all its descendants, in DFS order.
+
+        The children of all the pages of a level of the tree are listed
+        concurrently, then the DFS order is rebuilt from the listed children.
+        """
+        child_page_ids: Dict = {}
+        level = [page_id]
+        while level:
+            next_level = []
+            for parent_id, child_ids in zip(
+                level, executor.map(self._get_child_page_ids, level)
+            ):
+                child_page_ids[parent_id] = child_ids
+                next_level.extend(child_ids)
+            level = next_level
 
-        docs = []
-        for page in pages:
-            doc = self.process_page(page, include_attachments, text_maker)
-            docs.append(doc)
+        ret = []
+        stack = [page_id]
+        while stack:
+            current_page_id = stack.pop()
+            ret.append(current_page_id)
+            stack.extend(reversed(child_page_ids.get(current_page_id, [])))
+        return ret
 
-        return docs
+    def _get_pages_by_id(self, page_ids: List, executor: Executor) -> List:
+        """Get pages by id, keeping the order and repetitions of `page_ids`.
+
+        Pages are looked up `page_batch_size` at a time with CQL `id in (...)`
+        queries. Pages the search does not return, such as drafts, are then
+        fetched one by one.
+        """
+        unique_page_ids = list(dict.fromkeys(str(page_id) for page_id in page_ids))
+        numeric_page_ids = [page_id for page_id in unique_page_ids if page_id.isdigit()]
+        batches = [
+            numeric_page_ids[i : i + self.page_batch_size]
+            for i in range(0, len(numeric_page_ids), max(self.page_batch_size, 1))
+        ]
+
+        pages_by_id = {}
+        for batch_pages in executor.map(self._get_page_batch, batches):
+            for page in batch_pages:
+                pages_by_id[str(page["id"])] = page
+
+        missing_page_ids = [
+            page_id for page_id in unique_page_ids if page_id not in pages_by_id
+        ]
+        for page_id, page in zip(
+            missing_page_ids, executor.map(self._get_page, missing_page_ids)
+        ):
+            pages_by_id[page_id] = page
+
+        return [pages_by_id[str(page_id)] for page_id in page_ids]
+
+    def _get_page_batch(self, page_ids: List[str]) -> List:
+        try:
+            return self._get_cql_data_with_paging(
+                cql=f"id in ({','.join(page_ids)})",
+                max_num_results=None,
+                expand="body.export_view.value",
+                update_cursor=False,
+            )
+        except Exception as e:
+            logger.warning(f"Could not search pages {page_ids}: {e}")
+            return []
+
+    def _get_page(self, page_id: str):
+        return self._get_data_with_retry(
+            self.confluence.get_page_by_id,
+            page_id=page_id,
+            expand="body.export_view.value",
+        )
 
     def _dfs_page_ids(self, page_id, max_num_results):
         ret = [page_id]
@@ -275,6 +465,7 @@ class ConfluenceReader(BaseReader):
         cursor=None,
         max_num_results=50,
         expand="body.export_view.value",
+        update_cursor=True,
     ):
         max_num_remaining = max_num_results
         ret = []
@@ -296,7 +487,8 @@ class ConfluenceReader(BaseReader):
                 results["_links"]["next"] if "next" in results["_links"] else None
             )
             if not next_url:
-                self._next_cursor = None
+                if update_cursor:
+                    self._next_cursor = None
                 break
 
             if "cursor=" in next_url:  # On confluence Server this is not set
@@ -306,7 +498,8 @@ class ConfluenceReader(BaseReader):
             if max_num_results is not None:
                 params["limit"] -= len(results["results"])
                 if params["limit"] <= 0:
-                    self._next_cursor = cursor
+                    if update_cursor:
+                        self._next_cursor = cursor
                     break
 
         return ret
@@ -379,66 +572,53 @@ class ConfluenceReader(BaseReader):
 
         return texts
 
-    def process_pdf(self, link):
-        try:
-            import pytesseract  # type: ignore
-            from pdf2image import convert_from_bytes  # type: ignore
-        except ImportError:
-            raise ImportError(
-                "`pytesseract` or `pdf2image` package not found, please run `pip"
-                " install pytesseract pdf2image`"
-            )
-
-        import pytesseract  # type: ignore
-        from pdf2image import convert_from_bytes  # type: ignore
-
+    def _download_attachment(self, link: str) -> Optional[bytes]:
         response = self.confluence.request(path=link, absolute=True)
-        text = ""
-
         if (
             response.status_code != 200
             or response.content == b""
             or response.content is None
         ):
-            return text
-        try:
-            images = convert_from_bytes(response.content)
-        except ValueError:
-            return text
+            return None
+        return response.content
 
-        for i, image in enumerate(images):
-            image_text = pytesseract.image_to_string(image)
-            text += f"Page {i + 1}:\n{image_text}\n\n"
+    def _convert_attachment(
+        self, converter: Callable[[bytes], str], content: bytes
+    ) -> str:
+        """Run a converter in the attachment process pool, if there is one."""
+        if self._attachment_executor is None:
+            return converter(content)
+        return self._attachment_executor.submit(converter, content).result()
 
-        return text
+    def process_pdf(self, link):
+        try:
+            import pytesseract  # type: ignore # noqa: F401
+            from pdf2image import convert_from_bytes  # type: ignore # noqa: F401
+        except ImportError:
+            raise ImportError(
+                "`pytesseract` or `pdf2image` package not found, please run `pip"
+                " install pytesseract pdf2image`"
+            )
+
+        content = self._download_attachment(link)
+        if content is None:
+            return ""
+        return self._convert_attachment(_pdf_to_text, content)
 
     def process_image(self, link):
         try:
-            from io import BytesIO  # type: ignore
-
-            import pytesseract  # type: ignore
-            from PIL import Image  # type: ignore
+            import pytesseract  # type: ignore # noqa: F401
+            from PIL import Image  # type: ignore # noqa: F401
         except ImportError:
             raise ImportError(
                 "`pytesseract` or `Pillow` package not found, please run `pip install"
                 " pytesseract Pillow`"
             )
 
-        response = self.confluence.request(path=link, absolute=True)
-        text = ""
-
-        if (
-            response.status_code != 200
-            or response.content == b""
-            or response.content is None
-        ):
-            return text
-        try:
-            image = Image.open(BytesIO(response.content))
-        except OSError:
-            return text
-
-        return pytesseract.image_to_string(image)
+        content = self._download_attachment(link)
+        if content is None:
+            return ""
+        return self._convert_attachment(_image_to_text, content)
 
     def process_doc(self, link):
         try:
@@ -465,30 +645,14 @@ class ConfluenceReader(BaseReader):
 
     def process_xls(self, link):
         try:
-            import xlrd  # type: ignore
+            import xlrd  # type: ignore # noqa: F401
         except ImportError:
             raise ImportError("`xlrd` package not found, please run `pip install xlrd`")
 
-        response = self.confluence.request(path=link, absolute=True)
-        text = ""
-
-        if (
-            response.status_code != 200
-            or response.content == b""
-            or response.content is None
-        ):
-            return text
-
-        workbook = xlrd.open_workbook(file_contents=response.content)
-        for sheet in workbook.sheets():
-            text += f"{sheet.name}:\n"
-            for row in range(sheet.nrows):
-                for col in range(sheet.ncols):
-                    text += f"{sheet.cell_value(row, col)}\t"
-                text += "\n"
-            text += "\n"
-
-        return text
+        content = self._download_attachment(link)
+        if content is None:
+            return ""
+        return self._convert_attachment(_xls_to_text, content)
 
     def process_svg(self, link):
         try:
@@ -1,12 +1,12 @@
 """Database Reader."""
 
-from typing import Any, List, Optional
+from typing import Any, Iterator, List, Optional, Sequence
 
 from llama_index.utilities.sql_wrapper import SQLDatabase
 from llama_index.readers.base import BaseReader
 from llama_index.readers.schema.base import Document
-from sqlalchemy import text
-from sqlalchemy.engine import Engine
+from sqlalchemy import bindparam, column, literal_column, select, text
+from sqlalchemy.engine import Connection, Engine, Row
 
 
 class DatabaseReader(BaseReader):
@@ -72,6 +72,7 @@ class DatabaseReader(BaseReader):
                 "a SQL Alchemy Engine, a valid connection URI, or a valid "
                 "set of credentials."
             )
+        self._last_value: Any = None
 
     def load_data(self, query: str) -> List[Document]:
         """Query and load data from the Database, returning a list of Documents.
@@ -82,15 +83,113 @@ class DatabaseReader(BaseReader):
         Returns:
             List[Document]: A list of Document objects.
         """
-        documents = []
+        return list(self.lazy_load_data(query))
+
+    def lazy_load_data(
+        self,
+        query: str,
+        batch_size: int = 1000,
+        text_template: Optional[str] = None,
+        incremental_column: Optional[str] = None,
+        last_value: Optional[Any] = None,
+    ) -> Iterator[Document]:
+        """Query and lazily load data from the Database, one Document per row.
+
+        Rows are streamed from a server-side cursor `batch_size` at a time,
+        so memory does not grow with the number of rows.
+
+        With `incremental_column`, the query is instead read with keyset
+        pagination: each batch is a separate query for the next `batch_size`
+        rows ordered by that column, which must be monotonic and unique
+        (e.g. an auto-increment id). Loading can then resume after the last
+        value returned by `get_last_value`.
+
+        Args:
+            query (str): Query parameter to filter tables and rows.
+            batch_size (int): Number of rows fetched at a time.
+            text_template (Optional[str]): Template of the document text,
+                formatted with the columns of the row, e.g.
+                "{name} is {age} years old.". By default, the values of the
+                row are joined with ", ".
+            incremental_column (Optional[str]): Column of the query to
+                paginate on.
+            last_value (Optional[Any]): Only load rows whose
+                `incremental_column` is greater than this value.
+
+        Returns:
+            Iterator[Document]: Documents, one per row.
+        """
+        if query is None:
+            raise ValueError("A query parameter is necessary to filter the data")
+        if last_value is not None and incremental_column is None:
+            raise ValueError("`last_value` requires an `incremental_column`.")
+
+        self._last_value = last_value
         with self.sql_database.engine.connect() as connection:
-            if query is None:
-                raise ValueError("A query parameter is necessary to filter the data")
+            if incremental_column is None:
+                batches = self._stream_batches(connection, query, batch_size)
             else:
-                result = connection.execute(text(query))
+                batches = self._keyset_batches(
+                    connection, query, batch_size, incremental_column, last_value
+                )
+
+            for rows in batches:
+                documents = self._rows_to_documents(rows, text_template)
+                for row, document in zip(rows, documents):
+                    yield document
+                    if incremental_column is not None:
+                        # set once the next document is requested, so that an
+                        # interrupted document is loaded again on resume
+                        self._last_value = row._mapping[incremental_column]
+
+    def get_last_value(self) -> Any:
+        """
+        Returns: The `incremental_column` value of the last document of
+        `lazy_load_data` after which the next document was requested, to pass
+        as `last_value` to resume loading. The document being processed when
+        loading stopped is thus loaded again.
+        """
+        return self._last_value
+
+    def _stream_batches(
+        self, connection: Connection, query: str, batch_size: int
+    ) -> Iterator[Sequence[Row]]:
+        result = connection.execution_options(
+            stream_results=True, max_row_buffer=batch_size
+        ).execute(text(query))
+        yield from result.partitions(batch_size)
 
-            for item in result.fetchall():
-                # fetch each item
-                doc_str = ", ".join([str(entry) for entry in item])
-                documents.append(Document(text=doc_str))
-        return documents
+    def _keyset_batches(
+        self,
+        connection: Connection,
+        query: str,
+        batch_size: int,
+        incremental_column: str,
+        last_value: Optional[Any],
+    ) -> Iterator[Sequence[Row]]:
+        subquery = text(query).columns(column(incremental_column)).subquery("q")
+        key = subquery.c[incremental_column]
+        page_query = select(literal_column("*")).select_from(subquery)
+        while True:
+            batch_query = page_query
+            if last_value is not None:
+                batch_query = batch_query.where(key > bindparam("last_value"))
+            rows = connection.execute(
+                batch_query.order_by(key).limit(batch_size),
+                {"last_value": last_value},
+            ).fetchall()
+            if not rows:
+                return
+            yield rows
+            if len(rows) < batch_size:
+                return
+            last_value = rows[-1]._mapping[incremental_column]
+
+    def _rows_to_documents(
+        self, rows: Sequence[Row], text_template: Optional[str]
+    ) -> List[Document]:
+        if text_template is None:
+            return [
+                Document(text=", ".join([str(entry) for entry in row])) for row in rows
+            ]
+        return [Document(text=text_template.format(**row._mapping)) for row in rows]
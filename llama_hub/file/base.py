@@ -1,8 +1,22 @@
 """Simple reader that reads files of different formats from a directory."""
 
+import hashlib
+import json
 import logging
+import os
+from concurrent.futures import FIRST_COMPLETED, ProcessPoolExecutor, wait
+from fnmatch import fnmatch
 from pathlib import Path
-from typing import Callable, Dict, List, Optional, Union
+from typing import (
+    Callable,
+    Dict,
+    Iterable,
+    Iterator,
+    List,
+    Optional,
+    Tuple,
+    Union,
+)
 
 from llama_index.readers.base import BaseReader
 from llama_index.readers.download import download_loader
@@ -28,6 +42,54 @@ DEFAULT_FILE_EXTRACTOR: Dict[str, str] = {
 }
 
 
+def _file_hash(input_file: Path, chunk_size: int = 1 << 20) -> str:
+    """Compute the sha256 hex digest of a file's contents."""
+    digest = hashlib.sha256()
+    with open(input_file, "rb") as f:
+        for chunk in iter(lambda: f.read(chunk_size), b""):
+            digest.update(chunk)
+    return digest.hexdigest()
+
+
+# readers resolved inside worker processes, keyed by loader name
+_WORKER_READERS: Dict[str, BaseReader] = {}
+
+
+def _resolve_reader(reader_str: str) -> BaseReader:
+    """Import (or download) a loader by name and instantiate it."""
+    try:
+        from llama_hub.utils import import_loader
+
+        return import_loader(reader_str)()
+    except ImportError:
+        return download_loader(reader_str)()
+
+
+def _load_file(
+    input_file: Path,
+    reader: Optional[Union[str, BaseReader]],
+    metadata: Optional[Dict],
+    errors: str,
+) -> List[Document]:
+    """Extract documents from a single file.
+
+    Defined at module level so it can be shipped to worker processes.
+    """
+    if reader is not None:
+        if isinstance(reader, str):
+            if reader not in _WORKER_READERS:
+                _WORKER_READERS[reader] = _resolve_reader(reader)
+            reader = _WORKER_READERS[reader]
+
+        return reader.load_data(file=input_file, extra_info=metadata)
+
+    data = ""
+    # do standard read
+    with open(input_file, "r", errors=errors) as f:
+        data = f.read()
+    return [Document(text=data, extra_info=metadata or {})]
+
+
 class SimpleDirectoryReader(BaseReader):
     """Simple directory reader.
 
@@ -51,6 +113,23 @@ class SimpleDirectoryReader(BaseReader):
         file_metadata (Optional[Callable[str, Dict]]): A function that takes
             in a filename and returns a Dict of metadata for the Document.
             Default is None.
+        num_workers (Optional[int]): Number of worker processes used to
+            extract files in parallel. Readers passed in `file_extractor` must
+            be picklable when this is set. Default is None (serial).
+        max_in_flight (Optional[int]): Maximum number of files being extracted
+            at once when `num_workers` is set, which bounds memory usage.
+            Defaults to twice `num_workers`.
+        manifest_path (Optional[str]): Path to a JSON manifest recording the
+            size, mtime and content hash of every file loaded. When set, files
+            that are unchanged since the last run are skipped, and files that
+            disappeared are listed in `deleted_files`. Default is None.
+        include (Optional[List[str]]): Glob patterns a file's path relative to
+            `input_dir`, or its name, must match to be read. Default is None.
+        exclude (Optional[List[str]]): Glob patterns for files and directories
+            to skip, matched like `include`. Default is None.
+        lazy_listing (bool): Whether to defer walking `input_dir` until files
+            are needed. `lazy_load_data` then starts yielding documents before
+            the walk completes. False by default.
     """
 
     def __init__(
@@ -63,6 +142,12 @@ class SimpleDirectoryReader(BaseReader):
         file_extractor: Optional[Dict[str, Union[str, BaseReader]]] = None,
         num_files_limit: Optional[int] = None,
         file_metadata: Optional[Callable[[str], Dict]] = None,
+        num_workers: Optional[int] = None,
+        max_in_flight: Optional[int] = None,
+        manifest_path: Optional[str] = None,
+        include: Optional[List[str]] = None,
+        exclude: Optional[List[str]] = None,
+        lazy_listing: bool = False,
     ) -> None:
         """Initialize with parameters."""
         super().__init__()
@@ -74,35 +159,94 @@ class SimpleDirectoryReader(BaseReader):
         self.required_exts = required_exts
         self.num_files_limit = num_files_limit
 
-        self.input_files = self._add_files(self.input_dir)
+        self.include = include
+        self.exclude = exclude
+
+        self._input_files: Optional[List[Path]] = None
+        if not lazy_listing:
+            self._input_files = self._add_files(self.input_dir)
         self.file_extractor = file_extractor or DEFAULT_FILE_EXTRACTOR
         self.file_metadata = file_metadata
+        self.num_workers = num_workers
+        self.max_in_flight = max_in_flight or 2 * (num_workers or 1)
+        self._readers: Dict[str, BaseReader] = {}
+        self.manifest_path = Path(manifest_path) if manifest_path else None
+        self.deleted_files: List[str] = []
 
-    def _add_files(self, input_dir: Path) -> List[Path]:
-        """Add files."""
-        input_files = sorted(input_dir.iterdir())
-        new_input_files = []
-        dirs_to_explore = []
-        for input_file in input_files:
-            if self.exclude_hidden and input_file.stem.startswith("."):
-                continue
-            elif input_file.is_dir():
-                if self.recursive:
-                    dirs_to_explore.append(input_file)
-            elif (
-                self.required_exts is not None
-                and input_file.suffix not in self.required_exts
-            ):
-                continue
-            else:
-                new_input_files.append(input_file)
+    @property
+    def input_files(self) -> List[Path]:
+        """All input files, enumerated on first access."""
+        if self._input_files is None:
+            self._input_files = self._add_files(self.input_dir)
+        return self._input_files
+
+    def _is_excluded(self, rel_path: str, name: str) -> bool:
+        """Check a path relative to `input_dir` against the exclude patterns."""
+        return any(
+            fnmatch(rel_path, pattern) or fnmatch(name, pattern)
+            for pattern in self.exclude or []
+        )
+
+    def _is_included(self, rel_path: str, name: str) -> bool:
+        """Check a path relative to `input_dir` against the include patterns."""
+        if self.include is None:
+            return True
+        return any(
+            fnmatch(rel_path, pattern) or fnmatch(name, pattern)
+            for pattern in self.include
+        )
 
-        for dir_to_explore in dirs_to_explore:
-            sub_input_files = self._add_files(dir_to_explore)
-            new_input_files.extend(sub_input_files)
+    def iter_input_files(self, input_dir: Optional[Path] = None) -> Iterator[Path]:
+        """Lazily walk the input directory and yield matching files.
 
-        if self.num_files_limit is not None and self.num_files_limit > 0:
-            new_input_files = new_input_files[0 : self.num_files_limit]
+        Files of each directory are yielded in sorted order before descending
+        into its subdirectories. Directories matching an exclude pattern are
+        not entered, and the walk stops as soon as `num_files_limit` files
+        have been yielded.
+
+        Args:
+            input_dir (Optional[Path]): Directory to walk. Defaults to
+                `input_dir` of the reader.
+        """
+        input_dir = input_dir or self.input_dir
+        limit = self.num_files_limit
+        if limit is not None and limit <= 0:
+            limit = None
+
+        num_files = 0
+        dirs_to_explore = [input_dir]
+        while dirs_to_explore:
+            current_dir = dirs_to_explore.pop()
+            with os.scandir(current_dir) as it:
+                entries = sorted(it, key=lambda entry: entry.name)
+
+            sub_dirs = []
+            for entry in entries:
+                if self.exclude_hidden and entry.name.startswith("."):
+                    continue
+                input_file = Path(entry.path)
+                rel_path = input_file.relative_to(input_dir).as_posix()
+                if self._is_excluded(rel_path, entry.name):
+                    continue
+                if entry.is_dir():
+                    if self.recursive:
+                        sub_dirs.append(input_file)
+                elif (
+                    self.required_exts is not None
+                    and input_file.suffix not in self.required_exts
+                ):
+                    continue
+                elif self._is_included(rel_path, entry.name):
+                    yield input_file
+                    num_files += 1
+                    if limit is not None and num_files >= limit:
+                        return
+
+            dirs_to_explore.extend(reversed(sub_dirs))
+
+    def _add_files(self, input_dir: Path) -> List[Path]:
+        """Add files."""
+        new_input_files = list(self.iter_input_files(input_dir))
 
         # print total number of files added
         logging.debug(
@@ -111,46 +255,134 @@ class SimpleDirectoryReader(BaseReader):
 
         return new_input_files
 
-    def load_data(self) -> List[Document]:
-        """Load data from the input directory.
+    def _load_manifest(self) -> Dict[str, Dict]:
+        """Load the manifest of previously ingested files, if any."""
+        if self.manifest_path is None or not self.manifest_path.exists():
+            return {}
+        with open(self.manifest_path, "r") as f:
+            return json.load(f)
 
-        Args:
-            concatenate (bool): whether to concatenate all files into one document.
-                If set to True, file metadata is ignored.
-                False by default.
+    def _save_manifest(self, manifest: Dict[str, Dict]) -> None:
+        """Atomically write the manifest of ingested files."""
+        tmp_path = self.manifest_path.with_name(self.manifest_path.name + ".tmp")
+        with open(tmp_path, "w") as f:
+            json.dump(manifest, f)
+        os.replace(tmp_path, self.manifest_path)
+
+    def _changed_files(
+        self, manifest: Dict[str, Dict]
+    ) -> Tuple[List[Path], Dict[str, Dict]]:
+        """Find input files that are new or modified since the manifest.
+
+        The content hash is only computed when size or mtime differ, so
+        unchanged files cost a single stat call.
 
         Returns:
-            List[Document]: A list of documents.
+            Tuple[List[Path], Dict[str, Dict]]: the files to load, and the
+                manifest describing the current input files.
+        """
+        changed_files = []
+        new_manifest = {}
+        for input_file in self.input_files:
+            key = str(input_file)
+            stat = input_file.stat()
+            entry = {"size": stat.st_size, "mtime": stat.st_mtime}
+            old_entry = manifest.get(key)
+            if (
+                old_entry is not None
+                and old_entry["size"] == entry["size"]
+                and old_entry["mtime"] == entry["mtime"]
+            ):
+                new_manifest[key] = old_entry
+                continue
+
+            entry["hash"] = _file_hash(input_file)
+            new_manifest[key] = entry
+            if old_entry is None or old_entry["hash"] != entry["hash"]:
+                changed_files.append(input_file)
+
+        return changed_files, new_manifest
+
+    def _get_reader(self, suffix: str) -> Optional[BaseReader]:
+        """Return the reader for a file extension, resolving it only once."""
+        if suffix not in self.file_extractor:
+            return None
+        if suffix not in self._readers:
+            reader = self.file_extractor[suffix]
+            if isinstance(reader, str):
+                reader = _resolve_reader(reader)
+            self._readers[suffix] = reader
+        return self._readers[suffix]
 
+    def _file_args(self, input_file: Path, resolve: bool = True) -> tuple:
+        """Build the arguments passed to `_load_file` for one file.
+
+        With `resolve=False`, loader names are left for the worker process to
+        resolve, so reader instances don't need to be pickled per file.
         """
+        metadata = None
+        if self.file_metadata is not None:
+            metadata = self.file_metadata(str(input_file))
+        if resolve:
+            reader = self._get_reader(input_file.suffix)
+        else:
+            reader = self.file_extractor.get(input_file.suffix)
+        return input_file, reader, metadata, self.errors
 
-        documents = []
-        for input_file in self.input_files:
-            metadata = None
-            if self.file_metadata is not None:
-                metadata = self.file_metadata(str(input_file))
+    def lazy_load_data(self) -> Iterator[Document]:
+        """Lazily load data from the input directory.
 
-            if input_file.suffix in self.file_extractor:
-                reader = self.file_extractor[input_file.suffix]
+        When `num_workers` is set, files are extracted in a process pool and
+        documents are yielded as each file completes, so their order is not
+        guaranteed. At most `max_in_flight` files are pending at any time.
 
-                if isinstance(reader, str):
-                    try:
-                        from llama_hub.utils import import_loader
+        When `manifest_path` is set, only new or modified files are loaded,
+        and the manifest is updated once every document has been yielded.
 
-                        reader = import_loader(reader)()
-                    except ImportError:
-                        reader = download_loader(reader)()
+        Yields:
+            Document: documents extracted from the input files.
 
-                extracted_documents = reader.load_data(
-                    file=input_file, extra_info=metadata
-                )
-                documents.extend(extracted_documents)
+        """
+        if self.manifest_path is None:
+            if self._input_files is None:
+                yield from self._lazy_load_files(self.iter_input_files())
             else:
-                data = ""
-                # do standard read
-                with open(input_file, "r", errors=self.errors) as f:
-                    data = f.read()
-                document = Document(text=data, extra_info=metadata or {})
-                documents.append(document)
-
-        return documents
+                yield from self._lazy_load_files(self._input_files)
+            return
+
+        manifest = self._load_manifest()
+        input_files, new_manifest = self._changed_files(manifest)
+        self.deleted_files = sorted(set(manifest) - set(new_manifest))
+        yield from self._lazy_load_files(input_files)
+        self._save_manifest(new_manifest)
+
+    def _lazy_load_files(self, input_files: Iterable[Path]) -> Iterator[Document]:
+        """Extract documents from the given files, serially or in a pool."""
+        if not self.num_workers or self.num_workers <= 1:
+            for input_file in input_files:
+                yield from _load_file(*self._file_args(input_file))
+            return
+
+        with ProcessPoolExecutor(max_workers=self.num_workers) as executor:
+            pending = set()
+            for input_file in input_files:
+                if len(pending) >= self.max_in_flight:
+                    done, pending = wait(pending, return_when=FIRST_COMPLETED)
+                    for future in done:
+                        yield from future.result()
+                args = self._file_args(input_file, resolve=False)
+                pending.add(executor.submit(_load_file, *args))
+
+            while pending:
+                done, pending = wait(pending, return_when=FIRST_COMPLETED)
+                for future in done:
+                    yield from future.result()
+
+    def load_data(self) -> List[Document]:
+        """Load data from the input directory.
+
+        Returns:
+            List[Document]: A list of documents.
+
+        """
+        return list(self.lazy_load_data())
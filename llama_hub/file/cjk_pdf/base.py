@@ -1,11 +1,13 @@
 """Read PDF files."""
 
 from pathlib import Path
-from typing import Any, Dict, List, Optional
+from typing import Any, Dict, Iterator, List, Optional
 
 from llama_index.readers.base import BaseReader
 from llama_index.readers.schema.base import Document
 
+from llama_hub.file.pdf_engines import PDFMinerEngine, PDFPageCache, extract_pages
+
 
 class CJKPDFReader(BaseReader):
     """CJK PDF reader.
@@ -16,52 +18,42 @@ class CJKPDFReader(BaseReader):
         concat_pages (bool): whether to concatenate all pages into one document.
             If set to False, a Document will be created for each page.
             True by default.
+        num_workers (int): Number of worker processes extracting ranges of
+            pages of a file. With 0, pages are extracted in the calling process.
+        pages_per_task (int): Number of consecutive pages extracted by a
+            worker process at once.
+        cache (Optional[PDFPageCache]): Cache of the extracted pages, so that
+            unchanged files are not parsed again.
     """
 
-    def __init__(self, *args: Any, concat_pages: bool = True, **kwargs: Any) -> None:
+    def __init__(
+        self,
+        *args: Any,
+        concat_pages: bool = True,
+        num_workers: int = 0,
+        pages_per_task: int = 50,
+        cache: Optional[PDFPageCache] = None,
+        **kwargs: Any,
+    ) -> None:
         """Init params."""
         super().__init__(*args, **kwargs)
         self._concat_pages = concat_pages
+        self._num_workers = num_workers
+        self._pages_per_task = pages_per_task
+        self._cache = cache
+        # text in drawing order, without layout analysis
+        self._engine = PDFMinerEngine(layout=False)
 
-    # Define a function to extract text from PDF
-    def _extract_text_by_page(self, pdf_path: Path) -> List[str]:
-        # Import pdfminer
-        from io import StringIO
-
-        from pdfminer.converter import TextConverter
-        from pdfminer.pdfinterp import PDFPageInterpreter, PDFResourceManager
-        from pdfminer.pdfpage import PDFPage
-
-        # Create a resource manager
-        rsrcmgr = PDFResourceManager()
-        # Create an object to store the text
-        retstr = StringIO()
-        # Create a text converter
-        codec = "utf-8"
-
-        device = TextConverter(rsrcmgr, retstr, codec=codec)
-        # Create a PDF interpreter
-        interpreter = PDFPageInterpreter(rsrcmgr, device)
-        # Open the PDF file
-        fp = open(pdf_path, "rb")
-        # Create a list to store the text of each page
-        text_list = []
-        # Extract text from each page
-        for page in PDFPage.get_pages(fp):
-            interpreter.process_page(page)
-            # Get the text
-            text = retstr.getvalue()
-            # Add the text to the list
-            text_list.append(text)
-            # Clear the text
-            retstr.truncate(0)
-            retstr.seek(0)
-        # Close the file
-        fp.close()
-        # Close the device
-        device.close()
-        # Return the text list
-        return text_list
+    def _extract_text_by_page(self, pdf_path: Path) -> Iterator[str]:
+        pages = extract_pages(
+            self._engine,
+            pdf_path,
+            num_workers=self._num_workers,
+            pages_per_task=self._pages_per_task,
+            cache=self._cache,
+        )
+        for page in pages:
+            yield page.text
 
     def load_data(
         self, file: Path, extra_info: Optional[Dict] = None
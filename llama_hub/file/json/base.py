@@ -2,12 +2,17 @@
 
 import json
 import re
+from collections import deque
+from concurrent.futures import Future, ProcessPoolExecutor
 from pathlib import Path
-from typing import Dict, Generator, List, Optional
+from typing import IO, Any, Deque, Dict, Generator, Iterator, List, Optional
 
 from llama_index.readers.base import BaseReader
 from llama_index.readers.schema.base import Document
 
+# lines of `json.dumps` output dropped from the documents
+_FILTERED_LINE = re.compile(r"^[{}\\[\\],]*$")
+
 
 def _depth_first_yield(
     json_data: Dict, levels_back: int, path: List[str]
@@ -33,6 +38,79 @@ def _depth_first_yield(
         yield " ".join(new_path)
 
 
+def _json_to_text(json_data: Any, levels_back: Optional[int]) -> str:
+    """Format a JSON object as the text of a document."""
+    if levels_back is None:
+        json_output = json.dumps(json_data, indent=0)
+        match = _FILTERED_LINE.match
+        return "\n".join(line for line in json_output.split("\n") if not match(line))
+    return "\n".join(_depth_first_yield(json_data, levels_back, []))
+
+
+def _json_batch_to_text(batch: List[Any], levels_back: Optional[int]) -> List[str]:
+    return [_json_to_text(json_data, levels_back) for json_data in batch]
+
+
+# longest end of a number the decoder may leave when the number is cut by
+# a read, e.g. `e-` of `1e-3`
+_MAX_UNDECODED_END = 2
+
+
+def _iter_json_array(
+    f: IO[str], buffer: str, chunk_size: int = 64 * 1024
+) -> Iterator[Any]:
+    """Incrementally decode the items of a JSON array.
+
+    Args:
+        f (IO[str]): The file, positioned after `buffer`.
+        buffer (str): Data read from the file after the opening `[`.
+        chunk_size (int): Number of characters read at once, doubled while
+            an item does not fit in the buffer.
+
+    Returns:
+        Iterator[Any]: The items of the array.
+    """
+    decoder = json.JSONDecoder()
+    position = 0
+    read_size = chunk_size
+    eof = False
+
+    def read_more() -> None:
+        nonlocal buffer, position, eof
+        chunk = f.read(read_size)
+        eof = not chunk
+        buffer = buffer[position:] + chunk
+        position = 0
+
+    while True:
+        while position < len(buffer) and buffer[position] in " \t\r\n,":
+            position += 1
+        if position == len(buffer):
+            if eof:
+                raise ValueError("Unterminated JSON array.")
+            read_more()
+            continue
+        if buffer[position] == "]":
+            return
+
+        try:
+            json_data, end = decoder.raw_decode(buffer, position)
+        except json.JSONDecodeError:
+            if eof:
+                raise
+            end = None
+        # an item ending near the end of the buffer may continue in the file,
+        # e.g. `1.` decodes as `1` until `1.5` is read
+        if end is None or (not eof and len(buffer) - end <= _MAX_UNDECODED_END):
+            read_more()
+            read_size *= 2
+            continue
+
+        yield json_data
+        position = end
+        read_size = chunk_size
+
+
 class JSONReader(BaseReader):
     """JSON reader.
 
@@ -42,13 +120,23 @@ class JSONReader(BaseReader):
         levels_back (int): the number of levels to go back in the JSON tree, 0
         if you want all levels. If levels_back is None, then we just format the
         JSON and make each line an embedding
+        num_workers (int): number of worker processes formatting JSON objects,
+        0 to format them in the calling process
+        batch_size (int): number of JSON objects sent to a worker process at once
 
     """
 
-    def __init__(self, levels_back: Optional[int] = None) -> None:
+    def __init__(
+        self,
+        levels_back: Optional[int] = None,
+        num_workers: int = 0,
+        batch_size: int = 256,
+    ) -> None:
         """Initialize with arguments."""
         super().__init__()
         self.levels_back = levels_back
+        self.num_workers = num_workers
+        self.batch_size = batch_size
 
     def _parse_jsonobj_to_document(
         self, json_data_object: Dict, extra_info: Optional[Dict] = None
@@ -62,25 +150,76 @@ class JSONReader(BaseReader):
         Returns:
             Document: The document.
         """
-        if self.levels_back is None:
-            json_output = json.dumps(json_data_object, indent=0)
-            lines = json_output.split("\n")
-            useful_lines = [
-                line for line in lines if not re.match(r"^[{}\\[\\],]*$", line)
-            ]
-            return Document(text="\n".join(useful_lines), extra_info=extra_info or {})
-
+        return Document(
+            text=_json_to_text(json_data_object, self.levels_back),
+            extra_info=extra_info or {},
+        )
+
+    def _iter_json_objects(self, f: IO[str], is_jsonl: Optional[bool]) -> Iterator[Any]:
+        """Yield the JSON objects of a file, each becoming a document."""
+        if is_jsonl:
+            for line in f:
+                line = line.strip()
+                if line:
+                    yield json.loads(line)
+            return
+
+        buffer = f.read(64 * 1024).lstrip()
+        if buffer.startswith("["):
+            yield from _iter_json_array(f, buffer[1:])
+            return
+
+        data = json.loads(buffer + f.read())
+        # For a dictionary JSON object, pass the entire data to be parsed as document
+        if isinstance(data, dict):
+            yield data
+        # For a Non-Dictionary JSON object loop through and pass each item
         else:
-            lines = [*_depth_first_yield(json_data_object, self.levels_back, [])]
-            return Document(text="\n".join(lines), extra_info=extra_info or {})
+            yield from data
+
+    def _iter_texts(self, json_objects: Iterator[Any]) -> Iterator[str]:
+        """Format JSON objects, in worker processes if `num_workers` is set."""
+        if self.num_workers <= 0:
+            for json_data in json_objects:
+                yield _json_to_text(json_data, self.levels_back)
+            return
+
+        def batches() -> Iterator[List[Any]]:
+            batch = []
+            for json_data in json_objects:
+                batch.append(json_data)
+                if len(batch) >= self.batch_size:
+                    yield batch
+                    batch = []
+            if batch:
+                yield batch
+
+        pending: Deque[Future] = deque()
+        with ProcessPoolExecutor(max_workers=self.num_workers) as executor:
+            try:
+                for batch in batches():
+                    # keep workers busy, without reading the whole file ahead
+                    if len(pending) >= 2 * self.num_workers:
+                        yield from pending.popleft().result()
+                    pending.append(
+                        executor.submit(_json_batch_to_text, batch, self.levels_back)
+                    )
+                while pending:
+                    yield from pending.popleft().result()
+            finally:
+                for future in pending:
+                    future.cancel()
 
-    def load_data(
+    def lazy_load_data(
         self,
         file: Path,
         is_jsonl: Optional[bool] = False,
         extra_info: Optional[Dict] = None,
-    ) -> List[Document]:
-        """Load data from the input file.
+    ) -> Iterator[Document]:
+        """Lazily load data from the input file.
+
+        JSONL files are read line by line, and the items of a top-level JSON
+        array as they are decoded, so large files are read in bounded memory.
 
         Args:
             file (Path): Path to the input file.
@@ -88,27 +227,28 @@ class JSONReader(BaseReader):
             extra_info (Optional[Dict]): Additional information. Default is None.
 
         Returns:
-            List[Document]: List of documents.
+            Iterator[Document]: Documents, in the order of the JSON objects.
         """
         if not isinstance(file, Path):
             file = Path(file)
         with open(file, "r") as f:
-            data = []
-            if is_jsonl:
-                for line in f:
-                    data.append(json.loads(line.strip()))
-            else:
-                data = json.load(f)
-            documents = []
-
-            # For a dictionary JSON object, pass the entire data to be parsed as document
-            if isinstance(data, dict):
-                documents.append(self._parse_jsonobj_to_document(data, extra_info))
-            # For a List or Non-Dictionary JSON object loop through and pass each item
-            else:
-                for json_object in data:
-                    documents.append(
-                        self._parse_jsonobj_to_document(json_object, extra_info)
-                    )
+            for text in self._iter_texts(self._iter_json_objects(f, is_jsonl)):
+                yield Document(text=text, extra_info=extra_info or {})
 
-            return documents
+    def load_data(
+        self,
+        file: Path,
+        is_jsonl: Optional[bool] = False,
+        extra_info: Optional[Dict] = None,
+    ) -> List[Document]:
+        """Load data from the input file.
+
+        Args:
+            file (Path): Path to the input file.
+            is_jsonl (Optional[bool]): If True, indicates that the file is in JSONL format. Defaults to False.
+            extra_info (Optional[Dict]): Additional information. Default is None.
+
+        Returns:
+            List[Document]: List of documents.
+        """
+        return list(self.lazy_load_data(file, is_jsonl, extra_info))
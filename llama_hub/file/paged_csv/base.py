@@ -5,7 +5,7 @@ A parser for tabular data files.
 """
 
 from pathlib import Path
-from typing import Any, Dict, List, Optional
+from typing import Any, Dict, Iterator, List, Optional
 
 from llama_index.readers.base import BaseReader
 from llama_index.readers.schema.base import Document
@@ -19,12 +19,87 @@ class PagedCSVReader(BaseReader):
     Args:
         encoding (str): Encoding used to open the file.
             utf-8 by default.
+        rows_per_document (int): Number of rows displayed in each document,
+            separated by an empty line. 1 by default.
+        chunksize (Optional[int]): If set, the file is read with pandas, this
+            many rows at a time, and the rows of each chunk are formatted
+            column by column instead of row by row. Requires `pandas`.
+            None by default.
     """
 
-    def __init__(self, *args: Any, encoding: str = "utf-8", **kwargs: Any) -> None:
+    def __init__(
+        self,
+        *args: Any,
+        encoding: str = "utf-8",
+        rows_per_document: int = 1,
+        chunksize: Optional[int] = None,
+        **kwargs: Any,
+    ) -> None:
         """Init params."""
         super().__init__(*args, **kwargs)
         self._encoding = encoding
+        self._rows_per_document = rows_per_document
+        self._chunksize = chunksize
+
+    def _iter_row_texts(
+        self, file: Path, delimiter: str, quotechar: str
+    ) -> Iterator[str]:
+        import csv
+
+        with open(file, "r", encoding=self._encoding) as fp:
+            csv_reader = csv.DictReader(f=fp, delimiter=delimiter, quotechar=quotechar)  # type: ignore
+            for row in csv_reader:
+                yield "\n".join(f"{k.strip()}: {v.strip()}" for k, v in row.items())
+
+    def _iter_chunk_row_texts(
+        self, file: Path, delimiter: str, quotechar: str
+    ) -> Iterator[str]:
+        try:
+            import pandas as pd
+        except ImportError:
+            raise ImportError(
+                "`pandas` package not found, please run `pip install pandas`"
+            )
+
+        with pd.read_csv(
+            file,
+            sep=delimiter,
+            quotechar=quotechar,
+            encoding=self._encoding,
+            dtype=str,
+            keep_default_na=False,
+            chunksize=self._chunksize,
+        ) as chunks:
+            for chunk in chunks:
+                texts = None
+                for column in chunk.columns:
+                    # formats every row of the chunk at once
+                    line = f"{column.strip()}: " + chunk[column].str.strip()
+                    texts = line if texts is None else texts + "\n" + line
+                if texts is not None:
+                    yield from texts.tolist()
+
+    def lazy_load_data(
+        self,
+        file: Path,
+        extra_info: Optional[Dict] = None,
+        delimiter: str = ",",
+        quotechar: str = '"',
+    ) -> Iterator[Document]:
+        """Parse file, yielding documents as rows are read."""
+        if self._chunksize:
+            texts = self._iter_chunk_row_texts(file, delimiter, quotechar)
+        else:
+            texts = self._iter_row_texts(file, delimiter, quotechar)
+
+        rows: List[str] = []
+        for text in texts:
+            rows.append(text)
+            if len(rows) >= self._rows_per_document:
+                yield Document(text="\n\n".join(rows), extra_info=extra_info or {})
+                rows = []
+        if rows:
+            yield Document(text="\n\n".join(rows), extra_info=extra_info or {})
 
     def load_data(
         self,
@@ -34,18 +109,8 @@ class PagedCSVReader(BaseReader):
         quotechar: str = '"',
     ) -> List[Document]:
         """Parse file."""
-        import csv
-
-        docs = []
-        with open(file, "r", encoding=self._encoding) as fp:
-            csv_reader = csv.DictReader(f=fp, delimiter=delimiter, quotechar=quotechar)  # type: ignore
-            for row in csv_reader:
-                docs.append(
-                    Document(
-                        text="\n".join(
-                            f"{k.strip()}: {v.strip()}" for k, v in row.items()
-                        ),
-                        extra_info=extra_info or {},
-                    )
-                )
-        return docs
+        return list(
+            self.lazy_load_data(
+                file, extra_info=extra_info, delimiter=delimiter, quotechar=quotechar
+            )
+        )
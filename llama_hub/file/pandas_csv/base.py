@@ -4,7 +4,7 @@ A parser for tabular data files using pandas.
 
 """
 from pathlib import Path
-from typing import Any, Dict, List, Optional
+from typing import Any, Dict, Iterator, List, Optional
 
 from llama_index.readers.base import BaseReader
 from llama_index.readers.schema.base import Document
@@ -34,6 +34,14 @@ class PandasCSVReader(BaseReader):
             Set to empty dict by default, this means pandas will try to figure
             out the separators, table head, etc. on its own.
 
+        chunksize (Optional[int]): If set, the file is read this many rows at
+            a time, so that documents are yielded without loading the whole
+            file. Set to None by default.
+
+        rows_per_document (int): Number of rows joined with `row_joiner` in
+            each document. Only used when `concat_rows=False`.
+            Set to 1 by default.
+
     """
 
     def __init__(
@@ -43,6 +51,8 @@ class PandasCSVReader(BaseReader):
         col_joiner: str = ", ",
         row_joiner: str = "\n",
         pandas_config: dict = {},
+        chunksize: Optional[int] = None,
+        rows_per_document: int = 1,
         **kwargs: Any
     ) -> None:
         """Init params."""
@@ -51,26 +61,64 @@ class PandasCSVReader(BaseReader):
         self._col_joiner = col_joiner
         self._row_joiner = row_joiner
         self._pandas_config = pandas_config
-
-    def load_data(
-        self, file: Path, extra_info: Optional[Dict] = None
-    ) -> List[Document]:
-        """Parse file."""
+        self._chunksize = chunksize
+        self._rows_per_document = rows_per_document
+
+    def _format_rows(self, df: Any) -> List[str]:
+        import numpy as np
+
+        # join the rows column by column, instead of row by row
+        text_array = None
+        for column in df.columns:
+            # numpy formats missing values as "nan", as `str` does
+            values = df[column].to_numpy().astype(str)
+            text_array = (
+                values
+                if text_array is None
+                else np.char.add(np.char.add(text_array, self._col_joiner), values)
+            )
+        return [] if text_array is None else text_array.tolist()
+
+    def _iter_row_texts(self, file: Path) -> Iterator[str]:
         import pandas as pd
 
-        df = pd.read_csv(file, **self._pandas_config)
+        if self._chunksize is None:
+            yield from self._format_rows(pd.read_csv(file, **self._pandas_config))
+            return
 
-        text_list = df.apply(
-            lambda row: (self._col_joiner).join(row.astype(str).tolist()), axis=1
-        ).tolist()
+        with pd.read_csv(
+            file, chunksize=self._chunksize, **self._pandas_config
+        ) as chunks:
+            for df in chunks:
+                yield from self._format_rows(df)
+
+    def lazy_load_data(
+        self, file: Path, extra_info: Optional[Dict] = None
+    ) -> Iterator[Document]:
+        """Parse file, yielding documents as rows are read."""
+        text_iter = self._iter_row_texts(file)
 
         if self._concat_rows:
-            return [
-                Document(
+            yield Document(
+                text=self._row_joiner.join(text_iter), extra_info=extra_info or {}
+            )
+            return
+
+        text_list: List[str] = []
+        for text in text_iter:
+            text_list.append(text)
+            if len(text_list) >= self._rows_per_document:
+                yield Document(
                     text=self._row_joiner.join(text_list), extra_info=extra_info or {}
                 )
-            ]
-        else:
-            return [
-                Document(text=text, extra_info=extra_info or {}) for text in text_list
-            ]
+                text_list = []
+        if text_list:
+            yield Document(
+                text=self._row_joiner.join(text_list), extra_info=extra_info or {}
+            )
+
+    def load_data(
+        self, file: Path, extra_info: Optional[Dict] = None
+    ) -> List[Document]:
+        """Parse file."""
+        return list(self.lazy_load_data(file, extra_info))
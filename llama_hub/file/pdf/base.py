@@ -1,52 +1,66 @@
 """Read PDF files."""
 
 from pathlib import Path
-from typing import IO, Dict, List, Optional, Union
+from typing import IO, Dict, Iterator, List, Optional, Union
 
 from llama_index.readers.base import BaseReader
 from llama_index.readers.schema.base import Document
 
+from llama_hub.file.pdf_engines import PDFPageCache, PyPDFEngine, extract_pages
+
 
 class PDFReader(BaseReader):
-    """PDF reader."""
+    """PDF reader.
 
-    def load_data(
-        self, file: Union[IO[bytes], str, Path], extra_info: Optional[Dict] = None
-    ) -> List[Document]:
-        """Parse file."""
-        import pypdf
+    Args:
+        num_workers (int): Number of worker processes extracting ranges of
+            pages of a file. With 0, pages are extracted in the calling process.
+        pages_per_task (int): Number of consecutive pages extracted by a
+            worker process at once.
+        cache (Optional[PDFPageCache]): Cache of the extracted pages, so that
+            unchanged files are not parsed again.
+    """
+
+    def __init__(
+        self,
+        num_workers: int = 0,
+        pages_per_task: int = 50,
+        cache: Optional[PDFPageCache] = None,
+    ) -> None:
+        """Initialize with parameters."""
+        self.num_workers = num_workers
+        self.pages_per_task = pages_per_task
+        self.cache = cache
+        self._engine = PyPDFEngine()
 
+    def lazy_load_data(
+        self, file: Union[IO[bytes], str, Path], extra_info: Optional[Dict] = None
+    ) -> Iterator[Document]:
+        """Parse file, yielding a document per page as pages are extracted."""
         # Check if the file is already a Path object, if not, create a Path object from the string
         if not isinstance(file, Path) and isinstance(file, str):
             file = Path(file)
 
-        # Open the file if it's not already open, else use it as it is
         if isinstance(file, Path):
-            context = open(file, "rb")
-            if extra_info:
-                extra_info.update({"file_name": file.name})
-            else:
-                extra_info = {"file_name": file.name}
-        else:
-            context = file
-
-        with context as fp:
-            # Create a PDF object
-            pdf = pypdf.PdfReader(fp)
-
-            # Get the number of pages in the PDF document
-            num_pages = len(pdf.pages)
-
-            # Iterate over every page
-            docs = []
-            for page in range(num_pages):
-                # Extract the text from the page
-                page_text = pdf.pages[page].extract_text()
-                page_label = pdf.page_labels[page]
-                metadata = {"page_label": page_label}
-
-                if extra_info is not None:
-                    metadata.update(extra_info)
-
-                docs.append(Document(text=page_text, extra_info=metadata))
-            return docs
+            extra_info = dict(extra_info or {}, file_name=file.name)
+
+        pages = extract_pages(
+            self._engine,
+            file,
+            num_workers=self.num_workers,
+            pages_per_task=self.pages_per_task,
+            cache=self.cache,
+        )
+        for page in pages:
+            metadata = {"page_label": page.label}
+
+            if extra_info is not None:
+                metadata.update(extra_info)
+
+            yield Document(text=page.text, extra_info=metadata)
+
+    def load_data(
+        self, file: Union[IO[bytes], str, Path], extra_info: Optional[Dict] = None
+    ) -> List[Document]:
+        """Parse file."""
+        return list(self.lazy_load_data(file, extra_info=extra_info))
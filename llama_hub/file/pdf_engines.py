@@ -0,0 +1,319 @@
+"""PDF text extraction engines shared by the PDF readers.
+
+An engine extracts the text of a range of pages of a PDF file with one
+library (pypdf, pdfminer.six or PyMuPDF). `extract_pages` runs any engine,
+either in the calling process or by splitting the pages into ranges
+extracted by worker processes, each opening its own handle on the file.
+Extracted pages can be cached on disk, keyed by the hash of the file
+content, so unchanged files are not parsed again.
+"""
+
+import hashlib
+import json
+import os
+from abc import ABC, abstractmethod
+from collections import deque
+from concurrent.futures import Future, ProcessPoolExecutor
+from dataclasses import asdict, dataclass
+from pathlib import Path
+from typing import IO, Deque, Iterable, Iterator, List, Optional, Union
+
+PDFFile = Union[str, Path, IO[bytes]]
+
+
+@dataclass
+class PDFPage:
+    """A page extracted by a `PDFEngine`.
+
+    Attributes:
+        number (int): Index of the page in the file, from 0.
+        text (str): Text of the page.
+        label (Optional[str]): Label of the page, e.g. `iv`, if the engine
+            reads page labels.
+    """
+
+    number: int
+    text: str
+    label: Optional[str] = None
+
+
+class PDFEngine(ABC):
+    """Extracts the text of the pages of PDF files.
+
+    Engines are pickled to worker processes, so their attributes must be
+    picklable, and `cache_key` must change with any attribute changing the
+    extracted text.
+    """
+
+    @property
+    @abstractmethod
+    def cache_key(self) -> str:
+        """Name of the engine and its options in the page cache."""
+
+    @abstractmethod
+    def count_pages(self, file: PDFFile) -> int:
+        """Number of pages of a PDF file."""
+
+    @abstractmethod
+    def iter_pages(
+        self, file: PDFFile, start: int = 0, stop: Optional[int] = None
+    ) -> Iterator[PDFPage]:
+        """Yield the pages `start` to `stop` (excluded) of a PDF file, in order."""
+
+
+class PyPDFEngine(PDFEngine):
+    """Engine based on pypdf, reading page labels."""
+
+    cache_key = "pypdf"
+
+    def _open(self, file: PDFFile):  # type: ignore[no-untyped-def]
+        try:
+            import pypdf
+        except ImportError:
+            raise ImportError(
+                "`pypdf` package not found, please run `pip install pypdf`"
+            )
+        return pypdf.PdfReader(file)
+
+    def count_pages(self, file: PDFFile) -> int:
+        return len(self._open(file).pages)
+
+    def iter_pages(
+        self, file: PDFFile, start: int = 0, stop: Optional[int] = None
+    ) -> Iterator[PDFPage]:
+        pdf = self._open(file)
+        stop = len(pdf.pages) if stop is None else min(stop, len(pdf.pages))
+        # labels are computed for all the pages at once
+        labels = pdf.page_labels
+        for number in range(start, stop):
+            yield PDFPage(
+                number=number,
+                text=pdf.pages[number].extract_text(),
+                label=labels[number],
+            )
+
+
+class PDFMinerEngine(PDFEngine):
+    """Engine based on pdfminer.six.
+
+    Args:
+        layout (bool): Whether to analyze the layout of pages, which orders
+            text by columns and lines. Without it, text is extracted in the
+            order it is drawn, which suits CJK documents.
+    """
+
+    def __init__(self, layout: bool = True) -> None:
+        """Initialize with parameters."""
+        self.layout = layout
+
+    @property
+    def cache_key(self) -> str:
+        return "pdfminer-layout" if self.layout else "pdfminer"
+
+    def count_pages(self, file: PDFFile) -> int:
+        return sum(1 for _ in self._iter_raw_pages(file))
+
+    def _iter_raw_pages(self, file: PDFFile) -> Iterator:
+        try:
+            from pdfminer.pdfpage import PDFPage as PDFMinerPage
+        except ImportError:
+            raise ImportError(
+                "`pdfminer.six` package not found, please run `pip install pdfminer.six`"
+            )
+        if isinstance(file, (str, Path)):
+            with open(file, "rb") as fp:
+                yield from PDFMinerPage.get_pages(fp)
+        else:
+            yield from PDFMinerPage.get_pages(file)
+
+    def iter_pages(
+        self, file: PDFFile, start: int = 0, stop: Optional[int] = None
+    ) -> Iterator[PDFPage]:
+        from io import StringIO
+
+        from pdfminer.converter import TextConverter
+        from pdfminer.layout import LAParams
+        from pdfminer.pdfinterp import PDFPageInterpreter, PDFResourceManager
+
+        resource_manager = PDFResourceManager()
+        output_string = StringIO()
+        device = TextConverter(
+            resource_manager,
+            output_string,
+            codec="utf-8",
+            laparams=LAParams() if self.layout else None,
+        )
+        interpreter = PDFPageInterpreter(resource_manager, device)
+        try:
+            for number, page in enumerate(self._iter_raw_pages(file)):
+                if stop is not None and number >= stop:
+                    break
+                if number < start:
+                    continue
+                interpreter.process_page(page)
+                text = output_string.getvalue()
+                output_string.truncate(0)
+                output_string.seek(0)
+                yield PDFPage(number=number, text=text)
+        finally:
+            device.close()
+
+
+class PyMuPDFEngine(PDFEngine):
+    """Engine based on PyMuPDF."""
+
+    cache_key = "pymupdf"
+
+    def _open(self, file: PDFFile):  # type: ignore[no-untyped-def]
+        try:
+            import fitz
+        except ImportError:
+            raise ImportError(
+                "`PyMuPDF` package not found, please run `pip install pymupdf`"
+            )
+        if isinstance(file, (str, Path)):
+            return fitz.open(file)
+        return fitz.open(stream=file.read(), filetype="pdf")
+
+    def count_pages(self, file: PDFFile) -> int:
+        with self._open(file) as doc:
+            return len(doc)
+
+    def iter_pages(
+        self, file: PDFFile, start: int = 0, stop: Optional[int] = None
+    ) -> Iterator[PDFPage]:
+        with self._open(file) as doc:
+            stop = len(doc) if stop is None else min(stop, len(doc))
+            for number in range(start, stop):
+                yield PDFPage(number=number, text=doc[number].get_text())
+
+
+def file_hash(file_path: Union[str, Path]) -> str:
+    """SHA-256 of the content of a file."""
+    digest = hashlib.sha256()
+    with open(file_path, "rb") as f:
+        for chunk in iter(lambda: f.read(1024 * 1024), b""):
+            digest.update(chunk)
+    return digest.hexdigest()
+
+
+class PDFPageCache:
+    """On-disk cache of the pages extracted from PDF files.
+
+    Pages are stored per file content hash and engine, so a modified file
+    or a different engine is extracted again.
+
+    Args:
+        cache_dir (str): Directory of the cache, created if needed.
+    """
+
+    def __init__(self, cache_dir: str) -> None:
+        """Initialize with parameters."""
+        self.cache_dir = cache_dir
+        os.makedirs(cache_dir, exist_ok=True)
+
+    def _path(self, content_hash: str, engine: PDFEngine) -> str:
+        return os.path.join(self.cache_dir, f"{content_hash}.{engine.cache_key}.jsonl")
+
+    def load(self, content_hash: str, engine: PDFEngine) -> Optional[Iterator[PDFPage]]:
+        """Get the cached pages of a file, or None if it is not cached."""
+        path = self._path(content_hash, engine)
+        if not os.path.exists(path):
+            return None
+
+        def iter_cached() -> Iterator[PDFPage]:
+            with open(path) as f:
+                for line in f:
+                    yield PDFPage(**json.loads(line))
+
+        return iter_cached()
+
+    def store(
+        self, content_hash: str, engine: PDFEngine, pages: Iterable[PDFPage]
+    ) -> Iterator[PDFPage]:
+        """Yield pages while storing them, once all of them are extracted."""
+        path = self._path(content_hash, engine)
+        tmp_path = f"{path}.{os.getpid()}.tmp"
+        try:
+            with open(tmp_path, "w") as f:
+                for page in pages:
+                    f.write(json.dumps(asdict(page)) + "\n")
+                    yield page
+            os.replace(tmp_path, path)
+        finally:
+            if os.path.exists(tmp_path):
+                os.remove(tmp_path)
+
+
+def _extract_page_range(
+    engine: PDFEngine, file_path: str, start: int, stop: int
+) -> List[PDFPage]:
+    return list(engine.iter_pages(file_path, start, stop))
+
+
+def _extract_in_processes(
+    engine: PDFEngine, file_path: str, num_workers: int, pages_per_task: int
+) -> Iterator[PDFPage]:
+    total_pages = engine.count_pages(file_path)
+    pending: Deque[Future] = deque()
+    with ProcessPoolExecutor(max_workers=num_workers) as executor:
+        try:
+            for start in range(0, total_pages, pages_per_task):
+                # keep workers busy, without extracting the whole file ahead
+                if len(pending) >= 2 * num_workers:
+                    yield from pending.popleft().result()
+                stop = min(start + pages_per_task, total_pages)
+                pending.append(
+                    executor.submit(_extract_page_range, engine, file_path, start, stop)
+                )
+            while pending:
+                yield from pending.popleft().result()
+        finally:
+            for future in pending:
+                future.cancel()
+
+
+def extract_pages(
+    engine: PDFEngine,
+    file: PDFFile,
+    num_workers: int = 0,
+    pages_per_task: int = 50,
+    cache: Optional[PDFPageCache] = None,
+) -> Iterator[PDFPage]:
+    """Yield the pages of a PDF file, in order, as they are extracted.
+
+    Args:
+        engine (PDFEngine): Engine extracting the pages.
+        file (Union[str, Path, IO[bytes]]): Path of the file, or the opened
+            file, which is then read in the calling process and not cached.
+        num_workers (int): Number of worker processes extracting ranges of
+            `pages_per_task` pages. With 0, pages are extracted in the calling
+            process.
+        pages_per_task (int): Number of consecutive pages extracted by a
+            worker process at once.
+        cache (Optional[PDFPageCache]): Cache of the extracted pages.
+
+    Returns:
+        Iterator[PDFPage]: The pages.
+    """
+    if not isinstance(file, (str, Path)):
+        yield from engine.iter_pages(file)
+        return
+
+    file_path = str(file)
+    content_hash = None
+    if cache is not None:
+        content_hash = file_hash(file_path)
+        cached = cache.load(content_hash, engine)
+        if cached is not None:
+            yield from cached
+            return
+
+    if num_workers > 0:
+        pages = _extract_in_processes(engine, file_path, num_workers, pages_per_task)
+    else:
+        pages = engine.iter_pages(file_path)
+
+    if cache is not None and content_hash is not None:
+        pages = cache.store(content_hash, engine, pages)
+    yield from pages
@@ -1,58 +1,58 @@
 """Read PDF files."""
 
 from pathlib import Path
-from typing import Dict, List, Optional
+from typing import Dict, Iterator, List, Optional
 
 from llama_index.readers.base import BaseReader
 from llama_index.readers.schema.base import Document
 
+from llama_hub.file.pdf_engines import PDFMinerEngine, PDFPageCache, extract_pages
+
 
 class PDFMinerReader(BaseReader):
-    """PDF parser based on pdfminer.six."""
+    """PDF parser based on pdfminer.six.
+
+    Args:
+        num_workers (int): Number of worker processes extracting ranges of
+            pages of a file. With 0, pages are extracted in the calling process.
+        pages_per_task (int): Number of consecutive pages extracted by a
+            worker process at once.
+        cache (Optional[PDFPageCache]): Cache of the extracted pages, so that
+            unchanged files are not parsed again.
+    """
+
+    def __init__(
+        self,
+        num_workers: int = 0,
+        pages_per_task: int = 50,
+        cache: Optional[PDFPageCache] = None,
+    ) -> None:
+        """Initialize with parameters."""
+        self.num_workers = num_workers
+        self.pages_per_task = pages_per_task
+        self.cache = cache
+        self._engine = PDFMinerEngine(layout=True)
+
+    def lazy_load_data(
+        self, file: Path, extra_info: Optional[Dict] = None
+    ) -> Iterator[Document]:
+        """Parse file, yielding a document per page as pages are extracted."""
+        pages = extract_pages(
+            self._engine,
+            file,
+            num_workers=self.num_workers,
+            pages_per_task=self.pages_per_task,
+            cache=self.cache,
+        )
+        for page in pages:
+            metadata = {"page_label": page.number, "file_name": file.name}
+            if extra_info is not None:
+                metadata.update(extra_info)
+
+            yield Document(text=page.text, extra_info=metadata)
 
     def load_data(
         self, file: Path, extra_info: Optional[Dict] = None
     ) -> List[Document]:
         """Parse file."""
-        try:
-            from io import StringIO
-
-            from pdfminer.converter import TextConverter
-            from pdfminer.layout import LAParams
-            from pdfminer.pdfinterp import PDFPageInterpreter, PDFResourceManager
-            from pdfminer.pdfpage import PDFPage as PDF_Page
-
-            def _extract_text_from_page(page):
-                resource_manager = PDFResourceManager()
-                output_string = StringIO()
-                codec = "utf-8"
-                laparams = LAParams()
-                device = TextConverter(
-                    resource_manager, output_string, codec=codec, laparams=laparams
-                )
-                interpreter = PDFPageInterpreter(resource_manager, device)
-                interpreter.process_page(page)
-                text = output_string.getvalue()
-                device.close()
-                output_string.close()
-                return text
-
-        except ImportError:
-            raise ImportError(
-                "pdfminer.six is required to read PDF files: `pip install pypdf`"
-            )
-        with open(file, "rb") as fp:
-            reader = PDF_Page.get_pages(fp)
-
-            # Iterate over every page
-            docs = []
-            for i, page in enumerate(reader):
-                # Extract the text from the page
-                page_text = _extract_text_from_page(page)
-
-                metadata = {"page_label": i, "file_name": file.name}
-                if extra_info is not None:
-                    metadata.update(extra_info)
-
-                docs.append(Document(text=page_text, extra_info=metadata))
-            return docs
+        return list(self.lazy_load_data(file, extra_info=extra_info))
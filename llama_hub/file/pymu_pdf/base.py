@@ -1,83 +1,153 @@
 """Read PDF files using PyMuPDF library."""
 
 from pathlib import Path
-from typing import Dict, List, Optional, Union
+from typing import Dict, Iterator, List, Optional, Union
 
 from llama_index.readers.base import BaseReader
 from llama_index.readers.schema.base import Document
 
+from llama_hub.file.pdf_engines import PDFPageCache, PyMuPDFEngine, extract_pages
+
 
 class PyMuPDFReader(BaseReader):
-    """Read PDF files using PyMuPDF library."""
+    """Read PDF files using PyMuPDF library.
+
+    Args:
+        num_workers (int): Number of worker processes extracting pages, each
+            opening its own handle on the file. With 0, pages are extracted
+            in the calling process.
+        pages_per_task (int): Number of consecutive pages extracted by a
+            worker process at once.
+        cache (Optional[PDFPageCache]): Cache of the extracted pages, so that
+            unchanged files are not parsed again.
+    """
+
+    def __init__(
+        self,
+        num_workers: int = 0,
+        pages_per_task: int = 50,
+        cache: Optional[PDFPageCache] = None,
+    ) -> None:
+        """Initialize with parameters."""
+        self.num_workers = num_workers
+        self.pages_per_task = pages_per_task
+        self.cache = cache
+        self._engine = PyMuPDFEngine()
 
     def load_data(
         self,
         file_path: Union[Path, str],
         metadata: bool = True,
         extra_info: Optional[Dict] = None,
+        max_chars: int = 0,
     ) -> List[Document]:
         """Loads list of documents from PDF file and also accepts extra information in dict format."""
-        return self.load(file_path, metadata=metadata, extra_info=extra_info)
+        return self.load(
+            file_path, metadata=metadata, extra_info=extra_info, max_chars=max_chars
+        )
 
-    def load(
+    def lazy_load(
         self,
         file_path: Union[Path, str],
         metadata: bool = True,
         extra_info: Optional[Dict] = None,
-    ) -> List[Document]:
-        """Loads list of documents from PDF file and also accepts extra information in dict format.
+        max_chars: int = 0,
+    ) -> Iterator[Document]:
+        """Lazily load documents from PDF file, one per page as pages are extracted.
 
         Args:
             file_path (Union[Path, str]): file path of PDF file (accepts string or Path).
             metadata (bool, optional): if metadata to be included or not. Defaults to True.
             extra_info (Optional[Dict], optional): extra information related to each document in dict format. Defaults to None.
+            max_chars (int, optional): if positive, consecutive pages are merged into
+                documents of at most this many characters, a longer page being a document
+                of its own. Their `source` is then the range of their pages, e.g. `3-5`.
+                Defaults to 0.
 
         Raises:
             TypeError: if extra_info is not a dictionary.
             TypeError: if file_path is not a string or Path.
 
         Returns:
-            List[Document]: list of documents.
+            Iterator[Document]: documents.
         """
-        import fitz
-
         # check if file_path is a string or Path
         if not isinstance(file_path, str) and not isinstance(file_path, Path):
             raise TypeError("file_path must be a string or Path.")
 
-        # open PDF file
-        doc = fitz.open(file_path)
-
         # if extra_info is not None, check if it is a dictionary
         if extra_info:
             if not isinstance(extra_info, dict):
                 raise TypeError("extra_info must be a dictionary.")
+        extra_info = dict(extra_info or {})
+
+        total_pages = self._engine.count_pages(file_path)
 
         # if metadata is True, add metadata to each document
         if metadata:
-            if not extra_info:
-                extra_info = {}
-            extra_info["total_pages"] = len(doc)
+            extra_info["total_pages"] = total_pages
             extra_info["file_path"] = str(file_path)
 
-            # return list of documents
-            return [
-                Document(
-                    text=page.get_text().encode("utf-8"),
-                    extra_info=dict(
-                        extra_info,
-                        **{
-                            "source": f"{page.number+1}",
-                        },
-                    ),
-                )
-                for page in doc
-            ]
-
-        else:
-            return [
-                Document(
-                    text=page.get_text().encode("utf-8"), extra_info=extra_info or {}
-                )
-                for page in doc
-            ]
+        def make_document(texts: List[str], first_page: int) -> Document:
+            if not metadata:
+                return Document(text="".join(texts), extra_info=dict(extra_info))
+            last_page = first_page + len(texts) - 1
+            source = (
+                f"{first_page}"
+                if last_page == first_page
+                else f"{first_page}-{last_page}"
+            )
+            return Document(
+                text="".join(texts), extra_info=dict(extra_info, source=source)
+            )
+
+        texts: List[str] = []
+        num_chars = 0
+        first_page = 1
+        pages = extract_pages(
+            self._engine,
+            file_path,
+            num_workers=self.num_workers,
+            pages_per_task=self.pages_per_task,
+            cache=self.cache,
+        )
+        for page in pages:
+            text = page.text
+            if texts and (max_chars <= 0 or num_chars + len(text) > max_chars):
+                yield make_document(texts, first_page)
+                texts, num_chars = [], 0
+            if not texts:
+                first_page = page.number + 1
+            texts.append(text)
+            num_chars += len(text)
+        if texts:
+            yield make_document(texts, first_page)
+
+    def load(
+        self,
+        file_path: Union[Path, str],
+        metadata: bool = True,
+        extra_info: Optional[Dict] = None,
+        max_chars: int = 0,
+    ) -> List[Document]:
+        """Loads list of documents from PDF file and also accepts extra information in dict format.
+
+        Args:
+            file_path (Union[Path, str]): file path of PDF file (accepts string or Path).
+            metadata (bool, optional): if metadata to be included or not. Defaults to True.
+            extra_info (Optional[Dict], optional): extra information related to each document in dict format. Defaults to None.
+            max_chars (int, optional): if positive, consecutive pages are merged into
+                documents of at most this many characters, see `lazy_load`. Defaults to 0.
+
+        Raises:
+            TypeError: if extra_info is not a dictionary.
+            TypeError: if file_path is not a string or Path.
+
+        Returns:
+            List[Document]: list of documents.
+        """
+        return list(
+            self.lazy_load(
+                file_path, metadata=metadata, extra_info=extra_info, max_chars=max_chars
+            )
+        )
@@ -2,7 +2,7 @@
 
 import re
 from pathlib import Path
-from typing import Dict, List, Optional
+from typing import Dict, Iterator, List, Optional
 
 from llama_index.readers.base import BaseReader
 from llama_index.readers.schema.base import Document
@@ -34,6 +34,46 @@ def _get_leaf_nodes_up_to_level(root: ET.Element, level: int) -> List[ET.Element
     return nodes
 
 
+def _iter_leaf_nodes_up_to_level(file: Path, level: int) -> Iterator[ET.Element]:
+    """Stream the nodes of `_get_leaf_nodes_up_to_level` from an XML file.
+
+    Nodes are yielded as soon as they are parsed, then removed from the tree,
+    so memory is bounded by the size of one node.
+
+    Args:
+        file (Path): Path to the XML file
+        level (int): Levels to traverse in the tree
+
+    Returns:
+        Iterator[ET.Element]: Target nodes
+    """
+    # open elements, and whether they had children before these were removed
+    stack: List[List] = []
+    pending = None
+    for event, element in ET.iterparse(file, events=("start", "end")):
+        if pending is not None:
+            # the tail of a node is parsed with the next event
+            yield pending
+            pending.clear()
+            pending = None
+
+        if event == "start":
+            if stack:
+                stack[-1][1] = True
+            stack.append([element, False])
+            continue
+
+        _, has_children = stack.pop()
+        depth = len(stack)
+        if depth == level or (depth < level and not has_children):
+            pending = element
+            if stack:
+                stack[-1][0].remove(element)
+
+    if pending is not None:
+        yield pending
+
+
 class XMLReader(BaseReader):
     """XML reader.
 
@@ -63,33 +103,51 @@ class XMLReader(BaseReader):
             Document: The documents.
         """
         nodes = _get_leaf_nodes_up_to_level(root, self.tree_level_split)
-        documents = []
-        for node in nodes:
-            content = ET.tostring(node, encoding="utf8").decode("utf-8")
-            content = re.sub(r"^<\?xml.*", "", content)
-            content = content.strip()
-            documents.append(Document(text=content, extra_info=extra_info or {}))
+        return [self._node_to_document(node, extra_info) for node in nodes]
 
-        return documents
+    def _node_to_document(
+        self, node: ET.Element, extra_info: Optional[Dict] = None
+    ) -> Document:
+        content = ET.tostring(node, encoding="utf8").decode("utf-8")
+        content = re.sub(r"^<\?xml.*", "", content)
+        content = content.strip()
+        return Document(text=content, extra_info=extra_info or {})
 
-    def load_data(
+    def lazy_load_data(
         self,
         file: Path,
         extra_info: Optional[Dict] = None,
-    ) -> List[Document]:
-        """Load data from the input file.
+    ) -> Iterator[Document]:
+        """Lazily load data from the input file.
+
+        The file is parsed incrementally, and a Document is yielded as soon as
+        its node is parsed, so large files are read in bounded memory.
 
         Args:
             file (Path): Path to the input file.
             extra_info (Optional[Dict]): Additional information. Default is None.
 
         Returns:
-            List[Document]: List of documents.
+            Iterator[Document]: Documents, in the order of their nodes.
         """
         if not isinstance(file, Path):
             file = Path(file)
 
-        tree = ET.parse(file)
-        documents = self._parse_xmlelt_to_document(tree.getroot(), extra_info)
+        for node in _iter_leaf_nodes_up_to_level(file, self.tree_level_split):
+            yield self._node_to_document(node, extra_info)
 
-        return documents
+    def load_data(
+        self,
+        file: Path,
+        extra_info: Optional[Dict] = None,
+    ) -> List[Document]:
+        """Load data from the input file.
+
+        Args:
+            file (Path): Path to the input file.
+            extra_info (Optional[Dict]): Additional information. Default is None.
+
+        Returns:
+            List[Document]: List of documents.
+        """
+        return list(self.lazy_load_data(file, extra_info))
@@ -10,23 +10,31 @@ from llama_hub.github_repo.github_client import (
     GitTreeResponseModel,
     GithubClient,
 )
+from llama_hub.github_repo.local_git_client import LocalGitClient
 from llama_hub.github_repo.utils import (
+    BlobCache,
+    BlobFetchMetrics,
     BufferedAsyncIterator,
     BufferedGitBlobDataIterator,
+    GitBlobFetchPipeline,
     get_file_extension,
     print_if_verbose,
 )
 
 __all__ = [
     "BaseGithubClient",
+    "BlobCache",
+    "BlobFetchMetrics",
     "BufferedAsyncIterator",
     "BufferedGitBlobDataIterator",
+    "GitBlobFetchPipeline",
     "GitBlobResponseModel",
     "GitBranchResponseModel",
     "GitCommitResponseModel",
     "GitTreeResponseModel",
     "GithubClient",
     "GithubRepositoryReader",
+    "LocalGitClient",
     "get_file_extension",
     "print_if_verbose",
 ]
@@ -6,14 +6,12 @@ The documents are either the contents of the files in the repository or
 the text extracted from the files using the parser.
 """
 import asyncio
-import base64
-import binascii
 import enum
 import logging
 import os
 import pathlib
 import tempfile
-from typing import Any, Callable, Dict, List, Optional, Tuple
+from typing import Any, AsyncIterable, Callable, Dict, List, Optional, Tuple, Union
 
 from llama_index.readers.base import BaseReader
 from llama_index.readers.file.base import DEFAULT_FILE_READER_CLS
@@ -27,7 +25,9 @@ from llama_hub.github_repo.github_client import (
     GitTreeResponseModel,
 )
 from llama_hub.github_repo.utils import (
-    BufferedGitBlobDataIterator,
+    BlobCache,
+    BlobFetchMetrics,
+    GitBlobFetchPipeline,
     get_file_extension,
     print_if_verbose,
 )
@@ -47,6 +47,9 @@ class GithubRepositoryReader(BaseReader):
         >>> reader = GithubRepositoryReader("owner", "repo")
         >>> branch_documents = reader.load_data(branch="branch")
         >>> commit_documents = reader.load_data(commit_sha="commit_sha")
+        >>> changed_documents = reader.load_data(
+        ...     branch="branch", base_commit_sha="commit_sha"
+        ... )
 
     """
 
@@ -75,6 +78,7 @@ class GithubRepositoryReader(BaseReader):
         timeout: Optional[int] = 5,
         filter_directories: Optional[Tuple[List[str], FilterType]] = None,
         filter_file_extensions: Optional[Tuple[List[str], FilterType]] = None,
+        blob_cache_dir: Optional[str] = None,
     ):
         """
         Initialize params.
@@ -87,7 +91,9 @@ class GithubRepositoryReader(BaseReader):
                 the text from the files.
             - verbose (bool): Whether to print verbose messages.
             - concurrent_requests (int): Number of concurrent requests to
-                make to the Github API.
+                make to the Github API. Trees are walked and blobs are fetched
+                concurrently, and throughput of the last load is available
+                in `metrics`.
             - timeout (int or None): Timeout for the requests to the Github API. Default is 5.
             - filter_directories (Optional[Tuple[List[str], FilterType]]): Tuple
                 containing a list of directories and a FilterType. If the FilterType
@@ -99,6 +105,9 @@ class GithubRepositoryReader(BaseReader):
                 FilterType is INCLUDE, only the files with the extensions in the list
                 will be included. If the FilterType is EXCLUDE, the files with the
                 extensions in the list will be excluded.
+            - blob_cache_dir (Optional[str]): Directory of a persistent cache of
+                blob contents keyed by their SHA. Cached blobs are not fetched
+                again on later loads.
 
         Raises:
             - `ValueError`: If the github_token is not provided and
@@ -114,6 +123,13 @@ class GithubRepositoryReader(BaseReader):
         self._timeout = timeout
         self._filter_directories = filter_directories
         self._filter_file_extensions = filter_file_extensions
+        self._blob_cache = BlobCache(blob_cache_dir) if blob_cache_dir else None
+
+        # paths removed since `base_commit_sha` in the last load
+        self.deleted_paths: List[str] = []
+        # blob fetch throughput of the last load
+        self.metrics: Optional[BlobFetchMetrics] = None
+        self._tree_semaphore: Optional[asyncio.Semaphore] = None
 
         # Set up the event loop
         try:
@@ -216,38 +232,122 @@ class GithubRepositoryReader(BaseReader):
 
         return True
 
-    def _load_data_from_commit(self, commit_sha: str) -> List[Document]:
+    async def _get_blobs_and_paths(
+        self,
+        tree_sha: str,
+        base_tree_sha: Optional[str] = None,
+        blob_queue: Optional[asyncio.Queue] = None,
+    ) -> List[Tuple[GitTreeResponseModel.GitTreeObject, str]]:
         """
-        Load data from a commit.
+        Get the blobs to load from a tree.
 
-        Loads github repository data from a specific commit sha.
+        :param `tree_sha`: sha of the root tree
+        :param `base_tree_sha`: sha of a root tree to diff against, if any
+        :param `blob_queue`: queue to put blobs in as soon as they are found
 
-        :param `commit`: commit sha
+        :return: list of tuples of
+            (tree object, file's full path realtive to the root of the repo)
+        """
+        self.deleted_paths = []
+        if base_tree_sha is None:
+            return await self._recurse_tree(tree_sha, blob_queue=blob_queue)
+        return await self._diff_tree(base_tree_sha, tree_sha, blob_queue=blob_queue)
+
+    async def _load_documents(
+        self, tree_sha: str, base_tree_sha: Optional[str] = None, id: str = ""
+    ) -> List[Document]:
+        """
+        Walk a tree and generate the documents of its blobs.
+
+        Blobs are fetched while the tree is still being walked, and the
+        documents are returned in tree order.
+
+        :param `tree_sha`: sha of the root tree
+        :param `base_tree_sha`: sha of a root tree to diff against, if any
+        :param `id`: the branch name or commit sha used when loading the repo
 
         :return: list of documents
         """
+        self._tree_semaphore = asyncio.Semaphore(self._concurrent_requests)
+        # the walk waits for the fetch workers rather than queueing every blob
+        blob_queue: asyncio.Queue = asyncio.Queue(
+            maxsize=2 * max(1, self._concurrent_requests)
+        )
+
+        async def walk() -> List[Tuple[GitTreeResponseModel.GitTreeObject, str]]:
+            try:
+                return await self._get_blobs_and_paths(
+                    tree_sha, base_tree_sha, blob_queue=blob_queue
+                )
+            finally:
+                await blob_queue.put(None)
+
+        async def found_blobs() -> Any:
+            while True:
+                item = await blob_queue.get()
+                if item is None:
+                    return
+                yield item
+
+        walk_task = asyncio.ensure_future(walk())
+        try:
+            documents = await self._generate_documents(found_blobs(), id=id)
+            blobs_and_paths = await walk_task
+        finally:
+            walk_task.cancel()
+            self._tree_semaphore = None
+
+        print_if_verbose(self._verbose, f"got {len(blobs_and_paths)} blobs")
+        return self._sort_documents(documents, blobs_and_paths)
+
+    async def _get_tree(self, tree_sha: str) -> GitTreeResponseModel:
+        """Get a tree, limiting the number of concurrent tree requests."""
+        if self._tree_semaphore is None:
+            return await self._github_client.get_tree(
+                self._owner, self._repo, tree_sha, timeout=self._timeout
+            )
+        async with self._tree_semaphore:
+            return await self._github_client.get_tree(
+                self._owner, self._repo, tree_sha, timeout=self._timeout
+            )
+
+    def _get_tree_sha_from_commit(self, commit_sha: str) -> str:
+        """Get the sha of the root tree of a commit."""
         commit_response: GitCommitResponseModel = self._loop.run_until_complete(
             self._github_client.get_commit(
                 self._owner, self._repo, commit_sha, timeout=self._timeout
             )
         )
+        return commit_response.commit.tree.sha
 
-        tree_sha = commit_response.commit.tree.sha
-        blobs_and_paths = self._loop.run_until_complete(self._recurse_tree(tree_sha))
+    def _load_data_from_commit(
+        self, commit_sha: str, base_tree_sha: Optional[str] = None
+    ) -> List[Document]:
+        """
+        Load data from a commit.
 
-        print_if_verbose(self._verbose, f"got {len(blobs_and_paths)} blobs")
+        Loads github repository data from a specific commit sha.
+
+        :param `commit`: commit sha
+        :param `base_tree_sha`: only load blobs changed since this tree
 
+        :return: list of documents
+        """
+        tree_sha = self._get_tree_sha_from_commit(commit_sha)
         return self._loop.run_until_complete(
-            self._generate_documents(blobs_and_paths=blobs_and_paths, id=commit_sha)
+            self._load_documents(tree_sha, base_tree_sha, id=commit_sha)
         )
 
-    def _load_data_from_branch(self, branch: str) -> List[Document]:
+    def _load_data_from_branch(
+        self, branch: str, base_tree_sha: Optional[str] = None
+    ) -> List[Document]:
         """
         Load data from a branch.
 
         Loads github repository data from a specific branch.
 
         :param `branch`: branch name
+        :param `base_tree_sha`: only load blobs changed since this tree
 
         :return: list of documents
         """
@@ -258,26 +358,27 @@ class GithubRepositoryReader(BaseReader):
         )
 
         tree_sha = branch_data.commit.commit.tree.sha
-        blobs_and_paths = self._loop.run_until_complete(self._recurse_tree(tree_sha))
-
-        print_if_verbose(self._verbose, f"got {len(blobs_and_paths)} blobs")
-
         return self._loop.run_until_complete(
-            self._generate_documents(blobs_and_paths=blobs_and_paths, id=branch)
+            self._load_documents(tree_sha, base_tree_sha, id=branch)
         )
 
     def load_data(
         self,
         commit_sha: Optional[str] = None,
         branch: Optional[str] = None,
+        base_commit_sha: Optional[str] = None,
     ) -> List[Document]:
         """
         Load data from a commit or a branch.
 
         Loads github repository data from a specific commit sha or a branch.
+        If `base_commit_sha` is given, only the files added or modified since
+        that commit are loaded, and the paths of deleted files are stored in
+        `deleted_paths`.
 
         :param `commit`: commit sha
         :param `branch`: branch name
+        :param `base_commit_sha`: commit sha to load changes since
 
         :return: list of documents
         """
@@ -287,11 +388,15 @@ class GithubRepositoryReader(BaseReader):
         if commit_sha is None and branch is None:
             raise ValueError("You must specify one of commit or branch.")
 
+        base_tree_sha = None
+        if base_commit_sha is not None:
+            base_tree_sha = self._get_tree_sha_from_commit(base_commit_sha)
+
         if commit_sha is not None:
-            return self._load_data_from_commit(commit_sha)
+            return self._load_data_from_commit(commit_sha, base_tree_sha)
 
         if branch is not None:
-            return self._load_data_from_branch(branch)
+            return self._load_data_from_branch(branch, base_tree_sha)
 
         raise ValueError("You must specify one of commit or branch.")
 
@@ -301,6 +406,7 @@ class GithubRepositoryReader(BaseReader):
         current_path: str = "",
         current_depth: int = 0,
         max_depth: int = -1,
+        blob_queue: Optional[asyncio.Queue] = None,
     ) -> Any:
         """
         Recursively get all blob tree objects in a tree.
@@ -308,10 +414,12 @@ class GithubRepositoryReader(BaseReader):
         And construct their full path relative to the root of the repository.
         (see GitTreeResponseModel.GitTreeObject in
             github_api_client.py for more information)
+        Subtrees are fetched concurrently.
 
         :param `tree_sha`: sha of the tree to recurse
         :param `current_path`: current path of the tree
         :param `current_depth`: current depth of the tree
+        :param `blob_queue`: queue to put blobs in as soon as they are found
         :return: list of tuples of
             (tree object, file's full path realtive to the root of the repo)
         """
@@ -325,15 +433,15 @@ class GithubRepositoryReader(BaseReader):
             "\t" * current_depth + f"current path: {current_path}",
         )
 
-        tree_data: GitTreeResponseModel = await self._github_client.get_tree(
-            self._owner, self._repo, tree_sha, timeout=self._timeout
-        )
+        tree_data: GitTreeResponseModel = await self._get_tree(tree_sha)
         print_if_verbose(
             self._verbose, "\t" * current_depth + f"tree data: {tree_data}"
         )
         print_if_verbose(
             self._verbose, "\t" * current_depth + f"processing tree {tree_sha}"
         )
+        # blobs of this tree, and the index in it where each subtree goes
+        subtrees = []
         for tree_obj in tree_data.tree:
             file_path = os.path.join(current_path, tree_obj.path)
             if not self._allow_tree_obj(file_path, tree_obj.type):
@@ -354,9 +462,16 @@ class GithubRepositoryReader(BaseReader):
                     "\t" * current_depth + f"recursing into {tree_obj.path}",
                 )
 
-                blobs_and_full_paths.extend(
-                    await self._recurse_tree(
-                        tree_obj.sha, file_path, current_depth + 1, max_depth
+                subtrees.append(
+                    (
+                        len(blobs_and_full_paths),
+                        self._recurse_tree(
+                            tree_obj.sha,
+                            file_path,
+                            current_depth + 1,
+                            max_depth,
+                            blob_queue,
+                        ),
                     )
                 )
             elif tree_obj.type == "blob":
@@ -366,96 +481,278 @@ class GithubRepositoryReader(BaseReader):
                 )
 
                 blobs_and_full_paths.append((tree_obj, file_path))
+                if blob_queue is not None:
+                    await blob_queue.put((tree_obj, file_path))
 
-            print_if_verbose(
-                self._verbose,
-                "\t" * current_depth + f"blob and full paths: {blobs_and_full_paths}",
-            )
+        subtree_results = await asyncio.gather(*[coro for _, coro in subtrees])
+        # insert subtree blobs back to front so the indices stay valid
+        for (index, _), subtree_blobs in reversed(list(zip(subtrees, subtree_results))):
+            blobs_and_full_paths[index:index] = subtree_blobs
+
+        print_if_verbose(
+            self._verbose,
+            "\t" * current_depth + f"blob and full paths: {blobs_and_full_paths}",
+        )
         return blobs_and_full_paths
 
+    async def _diff_tree(
+        self,
+        base_tree_sha: str,
+        tree_sha: str,
+        current_path: str = "",
+        current_depth: int = 0,
+        blob_queue: Optional[asyncio.Queue] = None,
+    ) -> List[Tuple[GitTreeResponseModel.GitTreeObject, str]]:
+        """
+        Get the blobs added or modified between two trees.
+
+        Subtrees with the same sha in both trees are identical and are not
+        fetched. Paths of blobs that only exist in the base tree are added
+        to `deleted_paths`.
+
+        :param `base_tree_sha`: sha of the tree to compare against
+        :param `tree_sha`: sha of the tree to get the changed blobs of
+        :param `current_path`: current path of the trees
+        :param `current_depth`: current depth of the trees
+        :param `blob_queue`: queue to put blobs in as soon as they are found
+        :return: list of tuples of
+            (tree object, file's full path realtive to the root of the repo)
+        """
+        if base_tree_sha == tree_sha:
+            return []
+
+        base_tree_data, tree_data = await asyncio.gather(
+            self._get_tree(base_tree_sha), self._get_tree(tree_sha)
+        )
+        base_objs = {tree_obj.path: tree_obj for tree_obj in base_tree_data.tree}
+
+        blobs_and_full_paths: List[Tuple[GitTreeResponseModel.GitTreeObject, str]] = []
+        for tree_obj in tree_data.tree:
+            base_obj = base_objs.pop(tree_obj.path, None)
+            file_path = os.path.join(current_path, tree_obj.path)
+            if not self._allow_tree_obj(file_path, tree_obj.type):
+                continue
+            if base_obj is not None and base_obj.sha == tree_obj.sha:
+                continue
+
+            if base_obj is not None and base_obj.type != tree_obj.type:
+                await self._add_deleted_paths(base_obj, file_path, current_depth)
+                base_obj = None
+
+            if tree_obj.type == "tree":
+                if base_obj is None:
+                    blobs_and_full_paths.extend(
+                        await self._recurse_tree(
+                            tree_obj.sha,
+                            file_path,
+                            current_depth + 1,
+                            blob_queue=blob_queue,
+                        )
+                    )
+                else:
+                    blobs_and_full_paths.extend(
+                        await self._diff_tree(
+                            base_obj.sha,
+                            tree_obj.sha,
+                            file_path,
+                            current_depth + 1,
+                            blob_queue,
+                        )
+                    )
+            elif tree_obj.type == "blob":
+                print_if_verbose(
+                    self._verbose,
+                    "\t" * current_depth + f"changed blob {file_path}",
+                )
+                blobs_and_full_paths.append((tree_obj, file_path))
+                if blob_queue is not None:
+                    await blob_queue.put((tree_obj, file_path))
+
+        for base_obj in base_objs.values():
+            file_path = os.path.join(current_path, base_obj.path)
+            if self._allow_tree_obj(file_path, base_obj.type):
+                await self._add_deleted_paths(base_obj, file_path, current_depth)
+
+        return blobs_and_full_paths
+
+    async def _add_deleted_paths(
+        self,
+        tree_obj: GitTreeResponseModel.GitTreeObject,
+        file_path: str,
+        current_depth: int,
+    ) -> None:
+        """Record a deleted blob, or every blob of a deleted tree."""
+        if tree_obj.type == "blob":
+            self.deleted_paths.append(file_path)
+        elif tree_obj.type == "tree":
+            self.deleted_paths.extend(
+                path
+                for _, path in await self._recurse_tree(
+                    tree_obj.sha, file_path, current_depth + 1
+                )
+            )
+
+    def _add_cached_document(
+        self,
+        blob: GitTreeResponseModel.GitTreeObject,
+        full_path: str,
+        id: str,
+        documents: List[Document],
+    ) -> bool:
+        """
+        Create the document of a blob from the blob cache.
+
+        :return: True if the blob was cached, False if it has to be fetched
+        """
+        if self._blob_cache is None:
+            return False
+        cached_bytes = self._blob_cache.get(blob.sha)
+        if cached_bytes is None:
+            return False
+        print_if_verbose(self._verbose, f"using cached blob for {full_path}")
+        document = self._create_document(cached_bytes, blob.sha, full_path, id)
+        if document is not None:
+            documents.append(document)
+        return True
+
     async def _generate_documents(
         self,
-        blobs_and_paths: List[Tuple[GitTreeResponseModel.GitTreeObject, str]],
+        blobs_and_paths: Union[
+            List[Tuple[GitTreeResponseModel.GitTreeObject, str]],
+            AsyncIterable[Tuple[GitTreeResponseModel.GitTreeObject, str]],
+        ],
         id: str = "",
     ) -> List[Document]:
         """
         Generate documents from a list of blobs and their full paths.
 
-        :param `blobs_and_paths`: list of tuples of
+        Blobs are fetched and decoded by `concurrent_requests` workers. The
+        documents are in the order of `blobs_and_paths` if it is a list, and
+        in completion order if it is an async iterable.
+
+        :param `blobs_and_paths`: list or async iterable of tuples of
             (tree object, file's full path in the repo realtive to the root of the repo)
         :param `id`: the branch name or commit sha used when loading the repo
         :return: list of documents
         """
-        buffered_iterator = BufferedGitBlobDataIterator(
-            blobs_and_paths=blobs_and_paths,
+        documents: List[Document] = []
+
+        blobs_to_fetch: Any
+        if hasattr(blobs_and_paths, "__aiter__"):
+
+            async def uncached_blobs() -> Any:
+                async for blob, full_path in blobs_and_paths:  # type: ignore
+                    if not self._add_cached_document(blob, full_path, id, documents):
+                        yield blob, full_path
+
+            blobs_to_fetch = uncached_blobs()
+        else:
+            blobs_to_fetch = [
+                (blob, full_path)
+                for blob, full_path in blobs_and_paths  # type: ignore
+                if not self._add_cached_document(blob, full_path, id, documents)
+            ]
+
+        pipeline = GitBlobFetchPipeline(
             github_client=self._github_client,
             owner=self._owner,
             repo=self._repo,
-            loop=self._loop,
-            buffer_size=self._concurrent_requests,  # TODO: make this configurable
+            concurrent_requests=self._concurrent_requests,
             verbose=self._verbose,
         )
+        self.metrics = pipeline.metrics
 
-        documents = []
-        async for blob_data, full_path in buffered_iterator:
+        async for sha, decoded_bytes, full_path in pipeline.run(blobs_to_fetch):
             print_if_verbose(self._verbose, f"generating document for {full_path}")
-            assert (
-                blob_data.encoding == "base64"
-            ), f"blob encoding {blob_data.encoding} not supported"
-            decoded_bytes = None
-            try:
-                decoded_bytes = base64.b64decode(blob_data.content)
-                del blob_data.content
-            except binascii.Error:
+            if decoded_bytes is None:
                 print_if_verbose(
                     self._verbose, f"could not decode {full_path} as base64"
                 )
                 continue
 
-            if self._use_parser:
-                document = self._parse_supported_file(
-                    file_path=full_path,
-                    file_content=decoded_bytes,
-                    tree_sha=blob_data.sha,
-                    tree_path=full_path,
-                )
-                if document is not None:
-                    documents.append(document)
-                    continue
-                print_if_verbose(
-                    self._verbose,
-                    f"could not parse {full_path} as a supported file type"
-                    + " - falling back to decoding as utf-8 raw text",
-                )
+            if self._blob_cache is not None:
+                self._blob_cache.put(sha, decoded_bytes)
 
-            try:
-                if decoded_bytes is None:
-                    raise ValueError("decoded_bytes is None")
-                decoded_text = decoded_bytes.decode("utf-8")
-            except UnicodeDecodeError:
-                print_if_verbose(
-                    self._verbose, f"could not decode {full_path} as utf-8"
-                )
-                continue
+            document = self._create_document(decoded_bytes, sha, full_path, id)
+            if document is not None:
+                documents.append(document)
+
+        print_if_verbose(
+            self._verbose,
+            f"fetched {self.metrics.blobs_fetched} blobs"
+            + f" ({self.metrics.blobs_per_second:.1f} blobs/s)",
+        )
+        if isinstance(blobs_and_paths, list):
+            return self._sort_documents(documents, blobs_and_paths)
+        return documents
+
+    @staticmethod
+    def _sort_documents(
+        documents: List[Document],
+        blobs_and_paths: List[Tuple[GitTreeResponseModel.GitTreeObject, str]],
+    ) -> List[Document]:
+        """Sort documents in the order of the blobs they were generated from."""
+        order = {full_path: i for i, (_, full_path) in enumerate(blobs_and_paths)}
+        return sorted(
+            documents,
+            key=lambda doc: order.get(doc.extra_info.get("file_path"), len(order)),
+        )
+
+    def _create_document(
+        self,
+        decoded_bytes: bytes,
+        sha: str,
+        full_path: str,
+        id: str = "",
+    ) -> Optional[Document]:
+        """
+        Create a document from the decoded contents of a blob.
+
+        :param `decoded_bytes`: decoded contents of the blob
+        :param `sha`: sha of the blob
+        :param `full_path`: file's full path in the repo
+        :param `id`: the branch name or commit sha used when loading the repo
+        :return: Document, or None if the blob could not be decoded
+        """
+        if self._use_parser:
+            document = self._parse_supported_file(
+                file_path=full_path,
+                file_content=decoded_bytes,
+                tree_sha=sha,
+                tree_path=full_path,
+            )
+            if document is not None:
+                return document
             print_if_verbose(
                 self._verbose,
-                f"got {len(decoded_text)} characters"
-                + f"- adding to documents - {full_path}",
+                f"could not parse {full_path} as a supported file type"
+                + " - falling back to decoding as utf-8 raw text",
             )
-            url = os.path.join(
-                "https://github.com/", self._owner, self._repo, "blob/", id, full_path
-            )
-            document = Document(
-                text=decoded_text,
-                doc_id=blob_data.sha,
-                extra_info={
-                    "file_path": full_path,
-                    "file_name": full_path.split("/")[-1],
-                    "url": url,
-                },
-            )
-            documents.append(document)
-        return documents
+
+        try:
+            if decoded_bytes is None:
+                raise ValueError("decoded_bytes is None")
+            decoded_text = decoded_bytes.decode("utf-8")
+        except UnicodeDecodeError:
+            print_if_verbose(self._verbose, f"could not decode {full_path} as utf-8")
+            return None
+        print_if_verbose(
+            self._verbose,
+            f"got {len(decoded_text)} characters"
+            + f"- adding to documents - {full_path}",
+        )
+        url = os.path.join(
+            "https://github.com/", self._owner, self._repo, "blob/", id, full_path
+        )
+        return Document(
+            text=decoded_text,
+            doc_id=sha,
+            extra_info={
+                "file_path": full_path,
+                "file_name": full_path.split("/")[-1],
+                "url": url,
+            },
+        )
 
     def _parse_supported_file(
         self,
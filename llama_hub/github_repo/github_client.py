@@ -5,10 +5,12 @@ This module contains the Github API client for the GPT-Index library.
 It is used by the Github readers to retrieve the data from Github.
 """
 
+import asyncio
 import os
-
+import time
+from collections import OrderedDict
 from dataclasses import dataclass
-from typing import Any, Dict, List, Optional, Protocol
+from typing import Any, Dict, List, Optional, Protocol, Tuple
 
 from dataclasses_json import DataClassJsonMixin
 
@@ -214,6 +216,7 @@ class GithubClient:
 
     DEFAULT_BASE_URL = "https://api.github.com"
     DEFAULT_API_VERSION = "2022-11-28"
+    RATE_LIMIT_STATUS_CODES = (403, 429)
 
     def __init__(
         self,
@@ -221,6 +224,11 @@ class GithubClient:
         base_url: str = DEFAULT_BASE_URL,
         api_version: str = DEFAULT_API_VERSION,
         verbose: bool = False,
+        max_connections: int = 20,
+        use_etag_cache: bool = True,
+        max_cached_responses: int = 1024,
+        max_retries: int = 3,
+        max_rate_limit_wait: float = 60.0,
     ) -> None:
         """
         Initialize the GithubClient.
@@ -232,6 +240,17 @@ class GithubClient:
             - base_url (str): Base URL for the Github API
                 (defaults to "https://api.github.com").
             - api_version (str): Github API version (defaults to "2022-11-28").
+            - max_connections (int): Size of the connection pool shared by all
+                requests made by this client (defaults to 20).
+            - use_etag_cache (bool): Whether to keep GET responses and revalidate
+                them with `If-None-Match`. Github does not count `304 Not Modified`
+                responses against the rate limit (defaults to True).
+            - max_cached_responses (int): Number of responses kept in the ETag
+                cache, least recently used first out (defaults to 1024).
+            - max_retries (int): Number of times a rate limited request is
+                retried (defaults to 3).
+            - max_rate_limit_wait (float): Maximum number of seconds to sleep
+                waiting for the rate limit to reset (defaults to 60).
 
         Raises:
             ValueError: If no Github token is provided.
@@ -262,10 +281,120 @@ class GithubClient:
             "X-GitHub-Api-Version": f"{self._api_version}",
         }
 
+        self._max_connections = max_connections
+        self._use_etag_cache = use_etag_cache
+        self._max_cached_responses = max_cached_responses
+        self._max_retries = max_retries
+        self._max_rate_limit_wait = max_rate_limit_wait
+
+        self._client: Any = None
+        self._client_loop: Optional[asyncio.AbstractEventLoop] = None
+        # url -> (etag, response headers, response body)
+        self._etag_cache: "OrderedDict[str, Tuple[str, Dict[str, str], bytes]]" = (
+            OrderedDict()
+        )
+        self._rate_limit_remaining: Optional[int] = None
+        self._rate_limit_reset: Optional[float] = None
+
     def get_all_endpoints(self) -> Dict[str, str]:
         """Get all available endpoints."""
         return {**self._endpoints}
 
+    async def _get_client(self) -> Any:
+        """
+        Get the pooled `httpx.AsyncClient`, creating it on first use.
+
+        The client is bound to the event loop it was created on, so it is
+        closed and a new one is created if the client is used from a
+        different loop.
+        HTTP/2 is used when the `h2` package is installed.
+        """
+        import httpx
+
+        loop = asyncio.get_running_loop()
+        if self._client is not None and self._client_loop is not loop:
+            await self.aclose()
+        if self._client is None:
+            try:
+                import h2  # noqa: F401
+
+                http2 = True
+            except ImportError:
+                http2 = False
+
+            self._client = httpx.AsyncClient(
+                headers=self._headers,
+                base_url=self._base_url,
+                http2=http2,
+                limits=httpx.Limits(
+                    max_connections=self._max_connections,
+                    max_keepalive_connections=self._max_connections,
+                ),
+            )
+            self._client_loop = loop
+        return self._client
+
+    async def aclose(self) -> None:
+        """Close the pooled HTTP client."""
+        if self._client is not None:
+            await self._client.aclose()
+            self._client = None
+            self._client_loop = None
+
+    async def __aenter__(self) -> "GithubClient":
+        return self
+
+    async def __aexit__(self, *args: Any) -> None:
+        await self.aclose()
+
+    def _update_rate_limit(self, response: Any) -> None:
+        """Record the rate limit state reported by the API."""
+        remaining = response.headers.get("X-RateLimit-Remaining")
+        reset = response.headers.get("X-RateLimit-Reset")
+        if remaining is not None:
+            self._rate_limit_remaining = int(remaining)
+        if reset is not None:
+            self._rate_limit_reset = float(reset)
+
+    def _rate_limit_wait(self, response: Optional[Any] = None) -> float:
+        """
+        Seconds to wait before the next request.
+
+        Uses the `Retry-After` header of a rate limited response if present,
+        otherwise waits for `X-RateLimit-Reset` once the remaining quota is 0.
+        """
+        if response is not None and "Retry-After" in response.headers:
+            wait = float(response.headers["Retry-After"])
+        elif self._rate_limit_remaining == 0 and self._rate_limit_reset is not None:
+            wait = self._rate_limit_reset - time.time()
+        else:
+            return 0.0
+        return min(max(wait, 0.0), self._max_rate_limit_wait)
+
+    def _is_rate_limited(self, response: Any) -> bool:
+        """Check whether a response was rejected because of the rate limit."""
+        return response.status_code in self.RATE_LIMIT_STATUS_CODES and (
+            "Retry-After" in response.headers
+            or response.headers.get("X-RateLimit-Remaining") == "0"
+        )
+
+    def _cache_response(self, url: str, response: Any) -> None:
+        """Store a response in the ETag cache."""
+        etag = response.headers.get("ETag")
+        if etag is None:
+            return
+        # the body is stored decoded, so drop headers describing the encoding
+        headers = {
+            key: value
+            for key, value in response.headers.items()
+            if key.lower()
+            not in ("content-encoding", "content-length", "transfer-encoding")
+        }
+        self._etag_cache[url] = (etag, headers, response.content)
+        self._etag_cache.move_to_end(url)
+        while len(self._etag_cache) > self._max_cached_responses:
+            self._etag_cache.popitem(last=False)
+
     async def request(
         self,
         endpoint: str,
@@ -279,6 +408,9 @@ class GithubClient:
 
         This method is used for making API requests to the Github API.
         It is used internally by the other methods in the client.
+        Requests share one pooled connection, GET responses are revalidated
+        with their ETag, and rate limited requests are retried once the
+        limit resets.
 
         Args:
             - `endpoint (str)`: Name of the endpoint to make the request to.
@@ -307,22 +439,53 @@ class GithubClient:
                 "You can do so by running `pip install httpx`."
             )
 
-        _headers = {**self._headers, **headers}
+        _client: httpx.AsyncClient = await self._get_client()
+        url = self._endpoints[endpoint].format(**kwargs)
+        _headers = {**headers}
+
+        cached = None
+        if self._use_etag_cache and method.upper() == "GET":
+            cached = self._etag_cache.get(url)
+            if cached is not None:
+                _headers["If-None-Match"] = cached[0]
+
+        wait = self._rate_limit_wait()
+        for attempt in range(self._max_retries + 1):
+            if wait > 0:
+                if self._verbose:
+                    print(f"rate limited, sleeping {wait:.1f}s before requesting {url}")
+                await asyncio.sleep(wait)
 
-        _client: httpx.AsyncClient
-        async with httpx.AsyncClient(
-            headers=_headers,
-            base_url=self._base_url,
-            timeout=timeout,
-        ) as _client:
             try:
                 response = await _client.request(
-                    method, url=self._endpoints[endpoint].format(**kwargs)
+                    method, url=url, headers=_headers, timeout=timeout
                 )
             except httpx.HTTPError as excp:
                 print(f"HTTP Exception for {excp.request.url} - {excp}")
                 raise excp
-            return response
+
+            self._update_rate_limit(response)
+            if not self._is_rate_limited(response) or attempt == self._max_retries:
+                break
+
+            # slept at the start of the next attempt
+            wait = self._rate_limit_wait(response) or 2**attempt
+
+        if cached is not None and response.status_code == 304:
+            if self._verbose:
+                print(f"not modified: {url}")
+            self._etag_cache.move_to_end(url)
+            return httpx.Response(
+                status_code=200,
+                headers=cached[1],
+                content=cached[2],
+                request=response.request,
+            )
+
+        if self._use_etag_cache and method.upper() == "GET":
+            if response.status_code == 200:
+                self._cache_response(url, response)
+        return response
 
     async def get_branch(
         self,
@@ -471,7 +634,6 @@ class GithubClient:
 
 
 if __name__ == "__main__":
-    import asyncio
 
     async def main() -> None:
         """Test the GithubClient."""
@@ -0,0 +1,360 @@
+"""
+Local git client for the Github repository reader.
+
+Reads commits, trees and blobs from a local (bare) clone of a repository
+instead of the Github REST API, so large repositories can be loaded from
+their packfiles without one request per file, and without network access.
+It implements the same `BaseGithubClient` interface as `GithubClient`.
+"""
+
+import asyncio
+import base64
+import os
+import subprocess
+import threading
+from typing import Any, Dict, Optional, Tuple
+
+from llama_hub.github_repo.github_client import (
+    GitBlobResponseModel,
+    GitBranchResponseModel,
+    GitCommitResponseModel,
+    GitTreeResponseModel,
+)
+
+
+class LocalGitClient:
+    """
+    A client reading git objects from a local clone.
+
+    Objects are read through a single long running `git cat-file --batch`
+    process, so the `git` executable must be installed.
+    The `owner` and `repo` arguments of the methods are only used to build
+    the urls of the returned objects.
+
+    Examples:
+        >>> client = LocalGitClient.from_remote(
+        ...     "https://github.com/owner/repo.git", "/tmp/repo.git"
+        ... )
+        >>> reader = GithubRepositoryReader(client, "owner", "repo")
+        >>> documents = reader.load_data(branch="main")
+    """
+
+    def __init__(self, repo_path: str, verbose: bool = False) -> None:
+        """
+        Initialize the LocalGitClient.
+
+        Args:
+            - repo_path (str): Path to a bare clone, or to the working tree
+                of a regular clone.
+            - verbose (bool): Whether to print verbose messages.
+
+        Raises:
+            ValueError: If `repo_path` does not exist.
+        """
+        if not os.path.exists(repo_path):
+            raise ValueError(f"Repository path {repo_path} does not exist.")
+
+        self._repo_path = repo_path
+        self._verbose = verbose
+        self._process: Optional[subprocess.Popen] = None
+        self._lock = threading.Lock()
+
+        self._endpoints = {
+            "getTree": "/repos/{owner}/{repo}/git/trees/{tree_sha}",
+            "getBranch": "/repos/{owner}/{repo}/branches/{branch}",
+            "getBlob": "/repos/{owner}/{repo}/git/blobs/{file_sha}",
+            "getCommit": "/repos/{owner}/{repo}/commits/{commit_sha}",
+        }
+        self._endpoint_methods = {
+            "getTree": self.get_tree,
+            "getBranch": self.get_branch,
+            "getBlob": self.get_blob,
+            "getCommit": self.get_commit,
+        }
+
+    @classmethod
+    def from_remote(
+        cls, url: str, repo_path: str, verbose: bool = False
+    ) -> "LocalGitClient":
+        """
+        Create a client from a remote repository.
+
+        Makes a bare clone of `url` at `repo_path`, or fetches the latest
+        changes if the clone already exists.
+
+        Args:
+            - url (str): Url of the remote repository.
+            - repo_path (str): Path of the bare clone.
+            - verbose (bool): Whether to print verbose messages.
+        """
+        if os.path.exists(repo_path):
+            command = ["git", "--git-dir", repo_path, "fetch", "--quiet", "origin"]
+            command.append("+refs/heads/*:refs/heads/*")
+        else:
+            command = ["git", "clone", "--bare", "--quiet", url, repo_path]
+        if verbose:
+            print(" ".join(command))
+        subprocess.run(command, check=True)
+        return cls(repo_path, verbose=verbose)
+
+    def _start_process(self) -> subprocess.Popen:
+        if self._process is None or self._process.poll() is not None:
+            self._process = subprocess.Popen(
+                ["git", "cat-file", "--batch"],
+                cwd=self._repo_path,
+                stdin=subprocess.PIPE,
+                stdout=subprocess.PIPE,
+            )
+        return self._process
+
+    def _read_object(self, rev: str) -> Tuple[str, str, bytes]:
+        """
+        Read an object from the repository.
+
+        Args:
+            - rev (str): SHA or revision expression of the object.
+
+        Returns:
+            - `(sha, type, content)` of the object.
+
+        Raises:
+            ValueError: If the object does not exist.
+        """
+        with self._lock:
+            process = self._start_process()
+            assert process.stdin is not None and process.stdout is not None
+            process.stdin.write(f"{rev}\n".encode())
+            process.stdin.flush()
+            header = process.stdout.readline().decode().split()
+            if len(header) != 3:
+                raise ValueError(f"Object {rev} not found in {self._repo_path}.")
+            sha, obj_type, size = header
+            content = process.stdout.read(int(size))
+            # each object is followed by a newline
+            process.stdout.read(1)
+        return sha, obj_type, content
+
+    async def _aread_object(self, rev: str) -> Tuple[str, str, bytes]:
+        loop = asyncio.get_running_loop()
+        return await loop.run_in_executor(None, self._read_object, rev)
+
+    def close(self) -> None:
+        """Stop the `git cat-file` process."""
+        if self._process is not None:
+            if self._process.stdin is not None:
+                self._process.stdin.close()
+            self._process.wait()
+            self._process = None
+
+    async def aclose(self) -> None:
+        """Stop the `git cat-file` process."""
+        self.close()
+
+    async def __aenter__(self) -> "LocalGitClient":
+        return self
+
+    async def __aexit__(self, *args: Any) -> None:
+        self.close()
+
+    def get_all_endpoints(self) -> Dict[str, str]:
+        """Get all supported endpoints, those of `GithubClient` reading git objects."""
+        return {**self._endpoints}
+
+    async def request(
+        self,
+        endpoint: str,
+        method: str,
+        headers: Dict[str, Any] = {},
+        timeout: Optional[int] = None,
+        **kwargs: Any,
+    ) -> Any:
+        """
+        Read the object of an endpoint from the local clone.
+
+        Unlike `GithubClient.request`, the object is returned as a response
+        model, not as an HTTP response.
+
+        Args:
+            - `endpoint (str)`: Name of the endpoint, see `get_all_endpoints`.
+            - `method (str)`: HTTP method, only "GET" is supported.
+            - `headers (dict)`: Ignored, there is no HTTP request.
+            - `timeout (int or None)`: Ignored, there is no HTTP request.
+            - `**kwargs`: Keyword arguments of the endpoint, e.g. `owner`,
+                `repo` and `tree_sha` for "getTree".
+
+        Raises:
+            ValueError: If the endpoint or method is not supported.
+        """
+        if endpoint not in self._endpoints or method.upper() != "GET":
+            raise ValueError(
+                f"{method} {endpoint} is not supported by LocalGitClient, which"
+                f" only supports GET of {', '.join(self._endpoints)}."
+            )
+        return await self._endpoint_methods[endpoint](**kwargs)
+
+    async def get_branch(
+        self,
+        owner: str,
+        repo: str,
+        branch: Optional[str] = None,
+        branch_name: Optional[str] = None,
+        timeout: Optional[int] = None,
+    ) -> GitBranchResponseModel:
+        """
+        Get information about a branch.
+
+        Args:
+            - `owner (str)`: Owner of the repository.
+            - `repo (str)`: Name of the repository.
+            - `branch (str)`: Name of the branch.
+
+        Returns:
+            - `branch_info (GitBranchResponseModel)`: Information about the branch.
+        """
+        if branch is None:
+            if branch_name is None:
+                raise ValueError("Either branch or branch_name must be provided.")
+            branch = branch_name
+
+        commit_sha, _, content = await self._aread_object(
+            f"refs/heads/{branch}^{{commit}}"
+        )
+        return GitBranchResponseModel(
+            commit=GitBranchResponseModel.Commit(
+                commit=GitBranchResponseModel.Commit.Commit(
+                    tree=GitBranchResponseModel.Commit.Commit.Tree(
+                        sha=self._parse_commit_tree(content)
+                    )
+                )
+            ),
+            name=branch,
+            _links=GitBranchResponseModel.Links(
+                self=f"https://api.github.com/repos/{owner}/{repo}/branches/{branch}",
+                html=f"https://github.com/{owner}/{repo}/tree/{branch}",
+            ),
+        )
+
+    async def get_commit(
+        self,
+        owner: str,
+        repo: str,
+        commit_sha: str,
+        timeout: Optional[int] = None,
+    ) -> GitCommitResponseModel:
+        """
+        Get information about a commit.
+
+        Args:
+            - `owner (str)`: Owner of the repository.
+            - `repo (str)`: Name of the repository.
+            - `commit_sha (str)`: SHA of the commit.
+
+        Returns:
+            - `commit_info (GitCommitResponseModel)`: Information about the commit.
+        """
+        sha, _, content = await self._aread_object(f"{commit_sha}^{{commit}}")
+        return GitCommitResponseModel(
+            commit=GitCommitResponseModel.Commit(
+                tree=GitCommitResponseModel.Commit.Tree(
+                    sha=self._parse_commit_tree(content)
+                )
+            ),
+            url=f"https://api.github.com/repos/{owner}/{repo}/commits/{sha}",
+            sha=sha,
+        )
+
+    async def get_tree(
+        self,
+        owner: str,
+        repo: str,
+        tree_sha: str,
+        timeout: Optional[int] = None,
+    ) -> GitTreeResponseModel:
+        """
+        Get information about a tree.
+
+        Args:
+            - `owner (str)`: Owner of the repository.
+            - `repo (str)`: Name of the repository.
+            - `tree_sha (str)`: SHA of the tree.
+
+        Returns:
+            - `tree_info (GitTreeResponseModel)`: Information about the tree.
+        """
+        sha, obj_type, content = await self._aread_object(tree_sha)
+        if obj_type != "tree":
+            raise ValueError(f"Object {tree_sha} is a {obj_type}, not a tree.")
+
+        tree = []
+        index = 0
+        while index < len(content):
+            # entries are "<mode> <name>\0<20 byte sha>"
+            space = content.index(b" ", index)
+            nul = content.index(b"\0", space)
+            mode = content[index:space].decode().zfill(6)
+            path = content[space + 1 : nul].decode("utf-8", errors="replace")
+            entry_sha = content[nul + 1 : nul + 21].hex()
+            index = nul + 21
+
+            if mode == "040000":
+                entry_type = "tree"
+            elif mode == "160000":
+                entry_type = "commit"
+            else:
+                entry_type = "blob"
+            tree.append(
+                GitTreeResponseModel.GitTreeObject(
+                    path=path,
+                    mode=mode,
+                    type=entry_type,
+                    sha=entry_sha,
+                    url=f"https://api.github.com/repos/{owner}/{repo}/git/{entry_type}s/{entry_sha}",
+                )
+            )
+
+        return GitTreeResponseModel(
+            sha=sha,
+            url=f"https://api.github.com/repos/{owner}/{repo}/git/trees/{sha}",
+            tree=tree,
+            truncated=False,
+        )
+
+    async def get_blob(
+        self,
+        owner: str,
+        repo: str,
+        file_sha: str,
+        timeout: Optional[int] = None,
+    ) -> GitBlobResponseModel:
+        """
+        Get information about a blob.
+
+        The content is base64 encoded, like the responses of the Github API.
+
+        Args:
+            - `owner (str)`: Owner of the repository.
+            - `repo (str)`: Name of the repository.
+            - `file_sha (str)`: SHA of the file.
+
+        Returns:
+            - `blob_info (GitBlobResponseModel)`: Information about the blob.
+        """
+        sha, obj_type, content = await self._aread_object(file_sha)
+        if obj_type != "blob":
+            raise ValueError(f"Object {file_sha} is a {obj_type}, not a blob.")
+        return GitBlobResponseModel(
+            content=base64.b64encode(content).decode(),
+            encoding="base64",
+            url=f"https://api.github.com/repos/{owner}/{repo}/git/blobs/{sha}",
+            sha=sha,
+            size=len(content),
+            node_id="",
+        )
+
+    @staticmethod
+    def _parse_commit_tree(content: bytes) -> str:
+        """Get the tree sha from the content of a commit object."""
+        for line in content.decode("utf-8", errors="replace").splitlines():
+            if line.startswith("tree "):
+                return line.split()[1]
+        raise ValueError("Commit object has no tree.")
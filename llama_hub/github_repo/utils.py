@@ -4,11 +4,24 @@ Github readers utils.
 This module contains utility functions for the Github readers.
 """
 import asyncio
+import base64
+import binascii
 import os
 import sys
+import tempfile
 import time
 from abc import ABC, abstractmethod
-from typing import List, Tuple
+from dataclasses import dataclass
+from typing import (
+    Any,
+    AsyncIterable,
+    AsyncIterator,
+    Iterable,
+    List,
+    Optional,
+    Tuple,
+    Union,
+)
 
 if "pytest" in sys.modules:
     from llama_hub.github_repo.github_client import (
@@ -35,6 +48,51 @@ def get_file_extension(filename: str) -> str:
     return f".{os.path.splitext(filename)[1][1:].lower()}"
 
 
+class BlobCache:
+    """
+    On-disk cache of decoded blob contents keyed by their Git SHA.
+
+    Blob SHAs are content addresses, so an entry never needs to be
+    invalidated: a file whose contents change gets a new SHA.
+    Entries are stored as `<cache_dir>/<sha[:2]>/<sha>`.
+    """
+
+    def __init__(self, cache_dir: str):
+        """
+        Initialize params.
+
+        Args:
+            - `cache_dir (str)`: Directory to store the cached blobs in.
+                It is created if it does not exist.
+        """
+        self._cache_dir = cache_dir
+        os.makedirs(cache_dir, exist_ok=True)
+
+    def _path(self, sha: str) -> str:
+        return os.path.join(self._cache_dir, sha[:2], sha)
+
+    def __contains__(self, sha: str) -> bool:
+        return os.path.exists(self._path(sha))
+
+    def get(self, sha: str) -> Optional[bytes]:
+        """Get the decoded content of a blob, or None if it is not cached."""
+        try:
+            with open(self._path(sha), "rb") as f:
+                return f.read()
+        except FileNotFoundError:
+            return None
+
+    def put(self, sha: str, content: bytes) -> None:
+        """Store the decoded content of a blob."""
+        path = self._path(sha)
+        os.makedirs(os.path.dirname(path), exist_ok=True)
+        # write to a temporary file first so readers never see partial blobs
+        fd, tmp_path = tempfile.mkstemp(dir=os.path.dirname(path))
+        with os.fdopen(fd, "wb") as f:
+            f.write(content)
+        os.replace(tmp_path, path)
+
+
 class BufferedAsyncIterator(ABC):
     """
     Base class for buffered async iterators.
@@ -176,3 +234,195 @@ class BufferedGitBlobDataIterator(BufferedAsyncIterator):
             (result, path)
             for result, (_, path) in zip(results, self._blobs_and_paths[start:end])
         ]
+
+
+@dataclass
+class BlobFetchMetrics:
+    """
+    Throughput metrics of a GitBlobFetchPipeline run.
+
+    Attributes:
+        - blobs_fetched (int): Number of blobs downloaded.
+        - bytes_fetched (int): Number of decoded bytes downloaded.
+        - fetch_seconds (float): Time spent waiting on get_blob, summed
+            over all workers.
+        - decode_seconds (float): Time spent decoding blobs, summed over
+            all workers.
+        - elapsed_seconds (float): Wall clock time of the run.
+    """
+
+    blobs_fetched: int = 0
+    bytes_fetched: int = 0
+    fetch_seconds: float = 0.0
+    decode_seconds: float = 0.0
+    elapsed_seconds: float = 0.0
+
+    @property
+    def blobs_per_second(self) -> float:
+        """Blobs downloaded per second of wall clock time."""
+        if not self.elapsed_seconds:
+            return 0.0
+        return self.blobs_fetched / self.elapsed_seconds
+
+    @property
+    def bytes_per_second(self) -> float:
+        """Decoded bytes downloaded per second of wall clock time."""
+        if not self.elapsed_seconds:
+            return 0.0
+        return self.bytes_fetched / self.elapsed_seconds
+
+
+def decode_blob(blob_data: GitBlobResponseModel) -> Optional[bytes]:
+    """Decode the base64 content of a blob, or return None if it is invalid."""
+    assert (
+        blob_data.encoding == "base64"
+    ), f"blob encoding {blob_data.encoding} not supported"
+    try:
+        return base64.b64decode(blob_data.content)
+    except binascii.Error:
+        return None
+
+
+_DONE = object()
+
+
+class GitBlobFetchPipeline:
+    """
+    Bounded producer/consumer pipeline for fetching Git blobs.
+
+    A feeder task pushes (blob, path) pairs from a sync or async source into
+    a bounded queue, `concurrent_requests` workers pull from it, download the
+    blob and decode it in a thread, and push the results to a bounded output
+    queue. A slow blob only holds up its own worker, and the bounded queues
+    keep memory flat however large the repository is.
+    Results are yielded in completion order.
+    """
+
+    def __init__(
+        self,
+        github_client: GithubClient,
+        owner: str,
+        repo: str,
+        concurrent_requests: int = 5,
+        max_buffered: Optional[int] = None,
+        verbose: bool = False,
+    ):
+        """
+        Initialize params.
+
+        Args:
+            - github_client (GithubClient): Github client.
+            - owner (str): Owner of the repository.
+            - repo (str): Name of the repository.
+            - concurrent_requests (int): Number of blobs fetched at once.
+            - max_buffered (Optional[int]): Size of the input and output
+                queues. Defaults to twice `concurrent_requests`.
+            - verbose (bool): Whether to print verbose messages.
+        """
+        self._github_client = github_client
+        self._owner = owner
+        self._repo = repo
+        self._concurrent_requests = max(1, concurrent_requests)
+        self._max_buffered = max_buffered or 2 * self._concurrent_requests
+        self._verbose = verbose
+        self.metrics = BlobFetchMetrics()
+
+    async def _feed(
+        self,
+        source: Union[
+            Iterable[Tuple[GitTreeResponseModel.GitTreeObject, str]],
+            AsyncIterable[Tuple[GitTreeResponseModel.GitTreeObject, str]],
+        ],
+        in_queue: "asyncio.Queue[Any]",
+        out_queue: "asyncio.Queue[Any]",
+    ) -> None:
+        try:
+            if hasattr(source, "__aiter__"):
+                async for item in source:  # type: ignore
+                    await in_queue.put(item)
+            else:
+                for item in source:  # type: ignore
+                    await in_queue.put(item)
+        except Exception as excp:
+            await out_queue.put(excp)
+        finally:
+            for _ in range(self._concurrent_requests):
+                await in_queue.put(_DONE)
+
+    async def _work(
+        self, in_queue: "asyncio.Queue[Any]", out_queue: "asyncio.Queue[Any]"
+    ) -> None:
+        loop = asyncio.get_running_loop()
+        try:
+            while True:
+                item = await in_queue.get()
+                if item is _DONE:
+                    break
+                blob, path = item
+
+                start = time.perf_counter()
+                blob_data = await self._github_client.get_blob(
+                    self._owner, self._repo, blob.sha
+                )
+                fetched = time.perf_counter()
+                decoded_bytes = await loop.run_in_executor(None, decode_blob, blob_data)
+                decoded = time.perf_counter()
+                del blob_data.content
+
+                self.metrics.blobs_fetched += 1
+                self.metrics.bytes_fetched += len(decoded_bytes or b"")
+                self.metrics.fetch_seconds += fetched - start
+                self.metrics.decode_seconds += decoded - fetched
+                print_if_verbose(
+                    self._verbose,
+                    f"fetched {path} in {fetched - start:.2f} seconds",
+                )
+                await out_queue.put((blob_data.sha, decoded_bytes, path))
+        except Exception as excp:
+            await out_queue.put(excp)
+        else:
+            await out_queue.put(_DONE)
+
+    async def run(
+        self,
+        source: Union[
+            Iterable[Tuple[GitTreeResponseModel.GitTreeObject, str]],
+            AsyncIterable[Tuple[GitTreeResponseModel.GitTreeObject, str]],
+        ],
+    ) -> AsyncIterator[Tuple[str, Optional[bytes], str]]:
+        """
+        Fetch and decode the blobs of a source of (blob, path) pairs.
+
+        Args:
+            - source: Iterable or async iterable of (tree object, full path).
+
+        Yields:
+            - `(sha, decoded_bytes, path)`, where `decoded_bytes` is None if the
+                blob content is not valid base64.
+
+        Raises:
+            - Any exception raised by the source or by get_blob.
+        """
+        in_queue: "asyncio.Queue[Any]" = asyncio.Queue(maxsize=self._max_buffered)
+        out_queue: "asyncio.Queue[Any]" = asyncio.Queue(maxsize=self._max_buffered)
+        start = time.perf_counter()
+
+        tasks = [asyncio.ensure_future(self._feed(source, in_queue, out_queue))]
+        tasks.extend(
+            asyncio.ensure_future(self._work(in_queue, out_queue))
+            for _ in range(self._concurrent_requests)
+        )
+        try:
+            finished = 0
+            while finished < self._concurrent_requests:
+                item = await out_queue.get()
+                if isinstance(item, Exception):
+                    raise item
+                if item is _DONE:
+                    finished += 1
+                    continue
+                yield item
+        finally:
+            for task in tasks:
+                task.cancel()
+            self.metrics.elapsed_seconds += time.perf_counter() - start
@@ -15,77 +15,60 @@ from llama_index.embeddings import OpenAIEmbedding
 from llama_index import VectorStoreIndex
 
 
+import asyncio
+import hashlib
 import re
-from typing import Any, List, Optional
+from typing import Any, Coroutine, List, MutableMapping, Optional, Sequence, Tuple
 
 import numpy as np
 
-from llama_index.bridge.pydantic import Field
+from llama_index.async_utils import run_jobs
+from llama_index.bridge.pydantic import Field, PrivateAttr
 from llama_index.embeddings.base import BaseEmbedding
 from llama_index.node_parser.interface import MetadataAwareTextSplitter
+from llama_index.node_parser.node_utils import build_nodes_from_splits
+from llama_index.schema import BaseNode, MetadataMode
 
 
 def combine_sentences(sentences: List[str], buffer_size: int = 1) -> List[str]:
     """Combine sentences.
 
+    Each sentence is joined with up to `buffer_size` sentences on either side.
+
     Ported over from:
     https://github.com/FullStackRetrieval-com/RetrievalTutorials/blob/main/5_Levels_Of_Text_Splitting.ipynb
 
     """
-    # Go through each sentence dict
-    for i in range(len(sentences)):
-        # Create a string that will hold the sentences which are joined
-        combined_sentence = ""
-
-        # Add sentences before the current one, based on the buffer size.
-        for j in range(i - buffer_size, i):
-            # Check if the index j is not negative (to avoid index out of range like on the first one)
-            if j >= 0:
-                # Add the sentence at index j to the combined_sentence string
-                combined_sentence += sentences[j]["sentence"] + " "
-
-        # Add the current sentence
-        combined_sentence += sentences[i]["sentence"]
-
-        # Add sentences after the current one, based on the buffer size
-        for j in range(i + 1, i + 1 + buffer_size):
-            # Check if the index j is within the range of the sentences list
-            if j < len(sentences):
-                # Add the sentence at index j to the combined_sentence string
-                combined_sentence += " " + sentences[j]["sentence"]
-
-        # Then add the whole thing to your dict
-        # Store the combined sentence in the current sentence dict
-        sentences[i]["combined_sentence"] = combined_sentence
-
-    return sentences
+    return [
+        " ".join(sentences[max(i - buffer_size, 0) : i + 1 + buffer_size])
+        for i in range(len(sentences))
+    ]
 
 
-def calculate_cosine_distances(sentences: List[str]) -> List[float]:
-    """Calculate cosine distances."""
-    from sklearn.metrics.pairwise import cosine_similarity
+def calculate_cosine_distances(embeddings: np.ndarray) -> np.ndarray:
+    """Calculate cosine distances between adjacent embeddings.
 
-    distances: List[float] = []
-    for i in range(len(sentences) - 1):
-        embedding_current = sentences[i]["embedding"]
-        embedding_next = sentences[i + 1]["embedding"]
+    Args:
+        embeddings (np.ndarray): (num_sentences, dim) array of embeddings.
 
-        # Calculate cosine similarity
-        similarity = cosine_similarity([embedding_current], [embedding_next])[0][0]
+    Returns:
+        np.ndarray: distance of each embedding to the next one, with 0 for
+            the last one.
 
-        # Convert to cosine distance
-        distance = 1 - similarity
+    """
+    embeddings = np.asarray(embeddings, dtype=np.float32)
+    if len(embeddings) == 0:
+        return np.zeros(0, dtype=np.float32)
 
-        # Append cosine distance to the list
-        distances.append(distance)
+    norms = np.linalg.norm(embeddings, axis=1, keepdims=True)
+    normalized = embeddings / np.maximum(norms, np.finfo(np.float32).tiny)
+    similarities = np.einsum("ij,ij->i", normalized[:-1], normalized[1:])
 
     # add last distance (just put 0)
-    distances.append(0)
-
-    return distances
+    return np.append(1.0 - similarities, np.float32(0.0))
 
 
-def get_indices_above_threshold(distances: List[float], threshold: float) -> List[int]:
+def get_indices_above_threshold(distances: np.ndarray, threshold: float) -> List[int]:
     """Get indices above threshold."""
     # We need to get the distance threshold that we'll consider an outlier
     # We'll use numpy .percentile() for this
@@ -94,9 +77,9 @@ def get_indices_above_threshold(distances: List[float], threshold: float) -> Lis
     )  # If you want more chunks, lower the percentile cutoff
 
     # Then we'll get the index of the distances that are above the threshold. This will tell us where we should split our text
-    return [
-        i for i, x in enumerate(distances) if x > breakpoint_distance_threshold
-    ]  # The indices of those breakpoints on your list
+    return np.flatnonzero(
+        np.asarray(distances) > breakpoint_distance_threshold
+    ).tolist()  # The indices of those breakpoints on your list
 
 
 def make_chunks(sentences: List[str], indices_above_thresh: List[int]) -> List[str]:
@@ -109,8 +92,7 @@ def make_chunks(sentences: List[str], indices_above_thresh: List[int]) -> List[s
         end_index = index
 
         # Slice the sentence_dicts from the current start index to the end index
-        group = sentences[start_index : end_index + 1]
-        combined_text = " ".join([d["sentence"] for d in group])
+        combined_text = " ".join(sentences[start_index : end_index + 1])
         chunks.append(combined_text)
 
         # Update the start index for the next group
@@ -118,17 +100,38 @@ def make_chunks(sentences: List[str], indices_above_thresh: List[int]) -> List[s
 
     # The last group, if any sentences remain
     if start_index < len(sentences):
-        combined_text = " ".join([d["sentence"] for d in sentences[start_index:]])
+        combined_text = " ".join(sentences[start_index:])
         chunks.append(combined_text)
 
     return chunks
 
 
+def _run_async(coro: Coroutine) -> Any:
+    """Run a coroutine to completion, also from inside a running event loop."""
+    try:
+        asyncio.get_running_loop()
+    except RuntimeError:
+        return asyncio.run(coro)
+
+    # jupyter notebooks already have an event loop running
+    import nest_asyncio
+
+    nest_asyncio.apply()
+    return asyncio.get_event_loop().run_until_complete(coro)
+
+
 class SemanticChunker(MetadataAwareTextSplitter):
     """Semantic splitter.
 
     Inspired by Greg's semantic chunking.
 
+    When parsing many documents, the sentence windows of all documents are
+    embedded together in batches of `embed_model.embed_batch_size`, with up
+    to `num_workers` batches requested concurrently. Embeddings are cached by
+    a hash of the window text, so re-running on unchanged text does not call
+    the embedding model again. Pass a persistent mapping (e.g. a `shelve`)
+    as `embedding_cache` to keep the cache across runs.
+
     """
 
     buffer_size: int = Field(
@@ -141,13 +144,21 @@ class SemanticChunker(MetadataAwareTextSplitter):
         default=95.0,
         description="Percentile threshold for breakpoint distance.",
     )
+    num_workers: int = Field(
+        default=4,
+        description="Number of embedding batches requested concurrently.",
+    )
+
+    _embedding_cache: MutableMapping[str, List[float]] = PrivateAttr()
 
     def __init__(
         self,
         buffer_size: int = 1,
         embed_model: Optional[BaseEmbedding] = None,
         breakpoint_percentile_threshold: float = 95.0,
-        **kwargs: Any
+        num_workers: int = 4,
+        embedding_cache: Optional[MutableMapping[str, List[float]]] = None,
+        **kwargs: Any,
     ):
         from llama_index.embeddings.openai import OpenAIEmbedding
 
@@ -155,7 +166,9 @@ class SemanticChunker(MetadataAwareTextSplitter):
             buffer_size=buffer_size,
             embed_model=embed_model or OpenAIEmbedding(),
             breakpoint_percentile_threshold=breakpoint_percentile_threshold,
+            num_workers=num_workers,
         )
+        self._embedding_cache = {} if embedding_cache is None else embedding_cache
 
     @classmethod
     def class_name(cls) -> str:
@@ -167,42 +180,133 @@ class SemanticChunker(MetadataAwareTextSplitter):
     def split_text(self, text: str) -> List[str]:
         return self._split_text(text)
 
+    def _split_sentences(self, text: str) -> Tuple[List[str], List[str]]:
+        """Split text into sentences and their buffered windows."""
+        # Splitting the essay on '.', '?', and '!'
+        sentences = re.split(r"(?<=[.?!])\s+", text)
+        return sentences, combine_sentences(sentences, self.buffer_size)
+
+    def _chunk_sentences(
+        self, sentences: List[str], embeddings: np.ndarray
+    ) -> List[str]:
+        """Group sentences into chunks using the embeddings of their windows."""
+        # calculate cosine distance between adjacent sentences
+        distances = calculate_cosine_distances(embeddings)
+
+        # get indices above threshold
+        indices_above_thresh = get_indices_above_threshold(
+            distances, self.breakpoint_percentile_threshold
+        )
+
+        # make chunks
+        return make_chunks(sentences, indices_above_thresh)
+
+    def _cache_key(self, text: str) -> str:
+        """Key of the embedding of a text in the embedding cache."""
+        model = f"{self.embed_model.class_name()}:{self.embed_model.model_name}"
+        return hashlib.sha256(f"{model}:{text}".encode()).hexdigest()
+
+    def _uncached_batches(
+        self, texts: Sequence[str]
+    ) -> Tuple[List[str], List[List[Tuple[str, str]]]]:
+        """Get the cache keys of texts, and batches of the texts to embed.
+
+        Returns:
+            Tuple[List[str], List[List[Tuple[str, str]]]]: cache key of each
+                text, and batches of (cache key, text) not in the cache, with
+                duplicates removed.
+
+        """
+        keys = [self._cache_key(text) for text in texts]
+        missing = {}
+        for key, text in zip(keys, texts):
+            if key not in missing and key not in self._embedding_cache:
+                missing[key] = text
+
+        items = list(missing.items())
+        batch_size = self.embed_model.embed_batch_size
+        batches = [items[i : i + batch_size] for i in range(0, len(items), batch_size)]
+        return keys, batches
+
+    def _embed_texts(self, texts: Sequence[str]) -> np.ndarray:
+        """Embed texts, only calling the embedding model for uncached ones."""
+        keys, batches = self._uncached_batches(texts)
+        for batch in batches:
+            embeddings = self.embed_model.get_text_embedding_batch(
+                [text for _, text in batch]
+            )
+            for (key, _), embedding in zip(batch, embeddings):
+                self._embedding_cache[key] = embedding
+
+        return np.asarray(
+            [self._embedding_cache[key] for key in keys], dtype=np.float32
+        )
+
+    async def _aembed_texts(
+        self, texts: Sequence[str], show_progress: bool = False
+    ) -> np.ndarray:
+        """Embed texts with concurrent batches, skipping cached ones."""
+        keys, batches = self._uncached_batches(texts)
+        results = await run_jobs(
+            [
+                self.embed_model.aget_text_embedding_batch([text for _, text in batch])
+                for batch in batches
+            ],
+            show_progress=show_progress,
+            workers=self.num_workers,
+        )
+        for batch, embeddings in zip(batches, results):
+            for (key, _), embedding in zip(batch, embeddings):
+                self._embedding_cache[key] = embedding
+
+        return np.asarray(
+            [self._embedding_cache[key] for key in keys], dtype=np.float32
+        )
+
     def _split_text(self, text: str) -> List[str]:
         """
         _Split incoming text and return chunks with overlap size.
 
         Has a preference for complete sentences, phrases, and minimal overlap.
         """
-        # Splitting the essay on '.', '?', and '!'
-        single_sentences_list = re.split(r"(?<=[.?!])\s+", text)
-        sentences = [
-            {"sentence": x, "index": i} for i, x in enumerate(single_sentences_list)
-        ]
+        sentences, combined_sentences = self._split_sentences(text)
 
-        combined_sentences = combine_sentences(sentences, self.buffer_size)
+        # compute embeddings, kept as a single (num_sentences, dim) array
+        embeddings = self._embed_texts(combined_sentences)
 
-        # compute embeddings
-        embeddings = self.embed_model.get_text_embedding_batch(
-            [x["combined_sentence"] for x in combined_sentences]
-        )
-        # assign embeddings to the sentences
-        for i, embedding in enumerate(embeddings):
-            combined_sentences[i]["embedding"] = embedding
+        return self._chunk_sentences(sentences, embeddings)
 
-        # calculate cosine distance between adjacent sentences
-        distances = calculate_cosine_distances(combined_sentences)
-        for i, distance in enumerate(distances):
-            combined_sentences[i]["dist_to_next"] = distance
+    async def _aparse_nodes(
+        self, nodes: Sequence[BaseNode], show_progress: bool = False
+    ) -> List[BaseNode]:
+        """Split nodes, embedding the windows of all nodes together."""
+        split_nodes = [
+            self._split_sentences(node.get_content(metadata_mode=MetadataMode.NONE))
+            for node in nodes
+        ]
+        all_windows = [
+            window
+            for _, combined_sentences in split_nodes
+            for window in combined_sentences
+        ]
+        embeddings = await self._aembed_texts(all_windows, show_progress=show_progress)
 
-        # get indices above threshold
-        indices_above_thresh = get_indices_above_threshold(
-            distances, self.breakpoint_percentile_threshold
-        )
+        all_nodes: List[BaseNode] = []
+        start = 0
+        for node, (sentences, combined_sentences) in zip(nodes, split_nodes):
+            end = start + len(combined_sentences)
+            splits = self._chunk_sentences(sentences, embeddings[start:end])
+            all_nodes.extend(
+                build_nodes_from_splits(splits, node, id_func=self.id_func)
+            )
+            start = end
 
-        # make chunks
-        chunks = make_chunks(combined_sentences, indices_above_thresh)
+        return all_nodes
 
-        return chunks
+    def _parse_nodes(
+        self, nodes: Sequence[BaseNode], show_progress: bool = False, **kwargs: Any
+    ) -> List[BaseNode]:
+        return _run_async(self._aparse_nodes(nodes, show_progress=show_progress))
 
 
 class SemanticChunkingQueryEnginePack(BaseLlamaPack):
@@ -218,6 +322,8 @@ class SemanticChunkingQueryEnginePack(BaseLlamaPack):
         documents: List[Document],
         buffer_size: int = 1,
         breakpoint_percentile_threshold: float = 95.0,
+        num_workers: int = 4,
+        embedding_cache: Optional[MutableMapping[str, List[float]]] = None,
     ) -> None:
         """Init params."""
         self.embed_model = OpenAIEmbedding()
@@ -225,6 +331,8 @@ class SemanticChunkingQueryEnginePack(BaseLlamaPack):
             buffer_size=buffer_size,
             breakpoint_percentile_threshold=breakpoint_percentile_threshold,
             embed_model=self.embed_model,
+            num_workers=num_workers,
+            embedding_cache=embedding_cache,
         )
 
         nodes = self.splitter.get_nodes_from_documents(documents)
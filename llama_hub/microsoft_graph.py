@@ -0,0 +1,393 @@
+"""Microsoft Graph client shared by the OneDrive and SharePoint readers.
+
+Each thread sends its requests through a `requests.Session` of its own, all
+sharing one pool of connections. Throttled and failed
+requests (429 and 5xx) are retried after their `Retry-After` delay, during
+which no other request is sent, so concurrent downloads back off together.
+Drive folders can be synced with delta queries: the delta link of a sync
+is persisted, and the next sync only returns the items changed since.
+"""
+
+import json
+import logging
+import os
+import threading
+import time
+from concurrent.futures import FIRST_COMPLETED, Future, ThreadPoolExecutor, wait
+from email.utils import parsedate_to_datetime
+from typing import Any, Dict, Iterable, Iterator, List, Optional, Set, Tuple
+
+import requests
+from requests.adapters import HTTPAdapter
+
+logger = logging.getLogger(__name__)
+
+GRAPH_API_URL = "https://graph.microsoft.com/v1.0"
+
+_RETRY_STATUS_CODES = (429, 500, 502, 503, 504)
+
+
+class _ResyncRequired(Exception):
+    """The delta link expired, the folder must be synced from scratch."""
+
+
+def load_delta_state(path: str, key: str) -> Optional[Dict[str, Any]]:
+    """Load the delta state of a synced folder, if it was synced before."""
+    if not os.path.exists(path):
+        return None
+    with open(path) as f:
+        return json.load(f).get(key)
+
+
+def save_delta_state(path: str, key: str, state: Dict[str, Any]) -> None:
+    """Persist the delta state of a synced folder."""
+    states = {}
+    if os.path.exists(path):
+        with open(path) as f:
+            states = json.load(f)
+    states[key] = state
+
+    tmp_path = f"{path}.tmp"
+    with open(tmp_path, "w") as f:
+        json.dump(states, f)
+    os.replace(tmp_path, path)
+
+
+class GraphClient:
+    """Microsoft Graph API client.
+
+    Args:
+        access_token (Optional[str]): Bearer token sent to the Graph API.
+        num_workers (int): Number of concurrent downloads, and size of the
+            connection pool.
+        max_retries (int): Number of retries of throttled or failed requests.
+        backoff (float): Seconds before the first retry when the response
+            has no `Retry-After` header, doubled on each further retry.
+    """
+
+    def __init__(
+        self,
+        access_token: Optional[str] = None,
+        num_workers: int = 8,
+        max_retries: int = 5,
+        backoff: float = 1.0,
+    ) -> None:
+        """Initialize with parameters."""
+        self.access_token = access_token
+        self.num_workers = num_workers
+        self.max_retries = max_retries
+        self.backoff = backoff
+
+        # sessions are not thread-safe, but the connection pool of an adapter is
+        self._adapter = HTTPAdapter(
+            pool_connections=num_workers, pool_maxsize=num_workers
+        )
+        self._local = threading.local()
+        self._sessions: List[requests.Session] = []
+        self._lock = threading.Lock()
+        self._throttled_until = 0.0
+
+    def _session(self) -> requests.Session:
+        """Get the session of the current thread."""
+        session = getattr(self._local, "session", None)
+        if session is None:
+            session = self._local.session = requests.Session()
+            session.mount("http://", self._adapter)
+            session.mount("https://", self._adapter)
+            with self._lock:
+                self._sessions.append(session)
+        return session
+
+    def _retry_delay(self, response: requests.Response, retries: int) -> float:
+        retry_after = response.headers.get("Retry-After")
+        if retry_after:
+            try:
+                return max(float(retry_after), 0.0)
+            except ValueError:
+                try:
+                    retry_time = parsedate_to_datetime(retry_after).timestamp()
+                    return max(retry_time - time.time(), 0.0)
+                except (TypeError, ValueError):
+                    pass
+        return self.backoff * 2**retries
+
+    def _wait_for_throttle(self) -> None:
+        with self._lock:
+            delay = self._throttled_until - time.monotonic()
+        if delay > 0:
+            time.sleep(delay)
+
+    def request(
+        self, method: str, url: str, authorize: bool = True, **kwargs: Any
+    ) -> requests.Response:
+        """Send a request, retrying it while it is throttled or fails.
+
+        Args:
+            method (str): HTTP method.
+            url (str): Url of the request.
+            authorize (bool): Whether to send the access token. Pre-authenticated
+                download urls must be requested without it.
+            **kwargs: Passed to `requests.Session.request`.
+
+        Returns:
+            requests.Response: The response, which is the last failed one
+                once the retries are exhausted.
+        """
+        headers = dict(kwargs.pop("headers", None) or {})
+        if authorize and self.access_token:
+            headers["Authorization"] = f"Bearer {self.access_token}"
+
+        retries = 0
+        while True:
+            self._wait_for_throttle()
+            response = self._session().request(method, url, headers=headers, **kwargs)
+            if (
+                response.status_code not in _RETRY_STATUS_CODES
+                or retries >= self.max_retries
+            ):
+                return response
+
+            delay = self._retry_delay(response, retries)
+            logger.warning(
+                f"Retrying {url} in {delay:.1f} secs. Status code:"
+                f" {response.status_code}"
+            )
+            with self._lock:
+                # throttling applies to the app, so pause every request
+                self._throttled_until = max(
+                    self._throttled_until, time.monotonic() + delay
+                )
+            response.close()
+            retries += 1
+
+    def get(self, url: str, **kwargs: Any) -> requests.Response:
+        """Send a GET request, see `request`."""
+        return self.request("GET", url, **kwargs)
+
+    def iter_pages(self, url: str) -> Iterator[Dict[str, Any]]:
+        """Yield the pages of a collection, following `@odata.nextLink`.
+
+        Raises:
+            ValueError: If a page cannot be retrieved.
+        """
+        next_url: Optional[str] = url
+        while next_url:
+            response = self.get(next_url)
+            if response.status_code != 200:
+                raise ValueError(
+                    f"Graph request to {next_url} failed with status code:"
+                    f" {response.status_code}, message: {response.text}"
+                )
+            page = response.json()
+            yield page
+            next_url = page.get("@odata.nextLink")
+
+    def download(self, url: str, path: str, authorize: bool = True) -> str:
+        """Stream the content at a url to a file.
+
+        Raises:
+            ValueError: If the download fails.
+        """
+        response = self.get(url, authorize=authorize, stream=True)
+        with response:
+            if response.status_code != 200:
+                raise ValueError(
+                    f"Download of {path} failed with status code:"
+                    f" {response.status_code}"
+                )
+            os.makedirs(os.path.dirname(path) or ".", exist_ok=True)
+            with open(path, "wb") as f:
+                for chunk in response.iter_content(chunk_size=1024 * 1024):
+                    f.write(chunk)
+        return path
+
+    def download_item(
+        self, item: Dict[str, Any], path: str, drive_url: Optional[str] = None
+    ) -> str:
+        """Download a drive item, with its pre-authenticated url if it has one."""
+        if "@microsoft.graph.downloadUrl" in item:
+            return self.download(
+                item["@microsoft.graph.downloadUrl"], path, authorize=False
+            )
+        if drive_url is None:
+            raise ValueError(f"Item {item['id']} has no download url.")
+        return self.download(f"{drive_url}/items/{item['id']}/content", path)
+
+    def download_items(
+        self,
+        items: Iterable[Tuple[Dict[str, Any], str]],
+        drive_url: Optional[str] = None,
+    ) -> Iterator[Tuple[Dict[str, Any], str]]:
+        """Download drive items concurrently, on `num_workers` threads.
+
+        Args:
+            items (Iterable[Tuple[Dict[str, Any], str]]): Drive items and the
+                paths to download them to.
+            drive_url (Optional[str]): Url of the drive, to download items
+                without a pre-authenticated download url.
+
+        Returns:
+            Iterator[Tuple[Dict[str, Any], str]]: The items and their paths, in
+                the order the downloads complete.
+        """
+        items = iter(items)
+        pending: Dict[Future, Dict[str, Any]] = {}
+        with ThreadPoolExecutor(max_workers=self.num_workers) as executor:
+            try:
+                exhausted = False
+                while True:
+                    while not exhausted and len(pending) < 2 * self.num_workers:
+                        try:
+                            item, path = next(items)
+                        except StopIteration:
+                            exhausted = True
+                            break
+                        future = executor.submit(
+                            self.download_item, item, path, drive_url
+                        )
+                        pending[future] = item
+
+                    if not pending:
+                        break
+
+                    done, _ = wait(pending, return_when=FIRST_COMPLETED)
+                    for future in done:
+                        item = pending.pop(future)
+                        yield item, future.result()
+            finally:
+                for future in pending:
+                    future.cancel()
+
+    def sync_folder(
+        self,
+        drive_url: str,
+        folder_id: str,
+        recursive: bool = True,
+        state: Optional[Dict[str, Any]] = None,
+    ) -> Tuple[List[Dict[str, Any]], List[str], Dict[str, Any]]:
+        """Get the files of a drive folder changed since a previous sync.
+
+        The drive is read with a delta query, from the delta link of `state`
+        if given, else from scratch. Delta queries are only supported on the
+        root of business drives, so the changes are then scoped to the folder
+        by following the parents of the changed items.
+
+        Args:
+            drive_url (str): Url of the drive, e.g. `{GRAPH_API_URL}/me/drive`.
+            folder_id (str): Id of the synced folder.
+            recursive (bool): Whether files of subfolders are synced.
+            state (Optional[Dict[str, Any]]): State returned by the previous
+                sync of the folder.
+
+        Returns:
+            Tuple[List[Dict[str, Any]], List[str], Dict[str, Any]]: The new or
+                modified files, the ids of the files deleted or moved out of
+                the folder, and the state to pass to the next sync.
+        """
+        full_sync = state is None
+        try:
+            changes, delta_link = self._get_delta(
+                f"{drive_url}/root/delta" if full_sync else state["delta_link"]
+            )
+        except _ResyncRequired:
+            logger.info(f"Delta link of folder {folder_id} expired, resyncing.")
+            full_sync = True
+            changes, delta_link = self._get_delta(f"{drive_url}/root/delta")
+
+        folder_ids: Set[str] = {folder_id}
+        file_ids: Set[str] = set()
+        if not full_sync:
+            folder_ids.update(state["folder_ids"])
+            file_ids.update(state["file_ids"])
+
+        scopes: Dict[str, bool] = {}
+
+        def is_in_scope(item_id: str) -> bool:
+            """Whether a changed item is (still) in the synced folder."""
+            chain = []
+            in_scope = False
+            while item_id not in scopes:
+                item = changes[item_id]
+                chain.append(item_id)
+                parent_id = item.get("parentReference", {}).get("id")
+                if "deleted" in item or parent_id is None:
+                    break
+                if parent_id == folder_id:
+                    in_scope = True
+                    break
+                if not recursive:
+                    break
+                if parent_id in changes:
+                    item_id = parent_id
+                    continue
+                in_scope = parent_id in folder_ids
+                break
+            else:
+                in_scope = scopes[item_id]
+            for chain_id in chain:
+                scopes[chain_id] = in_scope
+            return in_scope
+
+        files = []
+        deleted_file_ids = []
+        for item_id, item in changes.items():
+            if item_id == folder_id:
+                continue
+            in_scope = is_in_scope(item_id)
+            if "folder" in item or item_id in folder_ids:
+                if in_scope and recursive:
+                    folder_ids.add(item_id)
+                else:
+                    folder_ids.discard(item_id)
+            elif in_scope and "file" in item:
+                file_ids.add(item_id)
+                files.append(item)
+            elif item_id in file_ids:
+                file_ids.discard(item_id)
+                deleted_file_ids.append(item_id)
+
+        if full_sync and state is not None:
+            # a resync lists every file again, the files it misses were deleted
+            deleted_file_ids.extend(sorted(set(state["file_ids"]) - file_ids))
+
+        new_state = {
+            "delta_link": delta_link,
+            "folder_ids": sorted(folder_ids),
+            "file_ids": sorted(file_ids),
+        }
+        return files, deleted_file_ids, new_state
+
+    def _get_delta(self, url: str) -> Tuple[Dict[str, Dict[str, Any]], str]:
+        """Get the changed items of a delta query, and its next delta link."""
+        changes: Dict[str, Dict[str, Any]] = {}
+        next_url: Optional[str] = url
+        while next_url:
+            response = self.get(next_url)
+            if response.status_code == 410:
+                raise _ResyncRequired()
+            if response.status_code != 200:
+                raise ValueError(
+                    f"Delta query {next_url} failed with status code:"
+                    f" {response.status_code}, message: {response.text}"
+                )
+            page = response.json()
+            for item in page.get("value", []):
+                # an item may be listed several times, the last one is current
+                changes.pop(item["id"], None)
+                changes[item["id"]] = item
+            next_url = page.get("@odata.nextLink")
+            if next_url is None:
+                return changes, page["@odata.deltaLink"]
+        raise ValueError(f"Delta query {url} returned no delta link.")
+
+    def close(self) -> None:
+        """Close the sessions of all threads and the connection pool.
+
+        The client can still be used afterwards, with new sessions.
+        """
+        with self._lock:
+            sessions, self._sessions = self._sessions, []
+            self._local = threading.local()
+        for session in sessions:
+            session.close()
+        self._adapter.close()
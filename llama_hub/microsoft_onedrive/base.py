@@ -3,14 +3,19 @@
 import logging
 import os
 import tempfile
-import requests
-import time
+from concurrent.futures import Future, ThreadPoolExecutor
 from typing import Any, List, Dict, Optional
 
 from llama_index import download_loader
 from llama_index.readers.base import BaseReader
 from llama_index.readers.schema.base import Document
 
+from llama_hub.microsoft_graph import (
+    GRAPH_API_URL,
+    GraphClient,
+    load_delta_state,
+    save_delta_state,
+)
 
 logger = logging.getLogger(__name__)
 
@@ -27,6 +32,10 @@ class OneDriveReader(BaseReader):
         client_id: str,
         client_secret: Optional[str] = None,
         tenant_id: str = "consumers",
+        num_workers: int = 8,
+        max_retries: int = 5,
+        delta_token_path: Optional[str] = None,
+        graph_base_url: str = GRAPH_API_URL,
     ) -> None:
         """
         Initializes a new instance of the OneDriveReader.
@@ -37,6 +46,12 @@ class OneDriveReader(BaseReader):
         :param client_secret: The Application Secret for the app registered in the Azure portal.
                               If provided, the MSAL client credential flow will be used for authentication (ConfidentialClientApplication).
                               If not provided, interactive authentication will be used (Not recommended for CI/CD or scenarios where manual interaction for authentication is not feasible).
+        :param num_workers: Number of files downloaded concurrently over pooled connections.
+        :param max_retries: Number of retries of requests throttled (429) or failed (5xx) by Microsoft Graph, after the delay of their `Retry-After` header.
+        :param delta_token_path: Path of a JSON file storing the Graph delta link of each loaded folder.
+                                 When set, only the files added or modified since the previous load of a folder are downloaded,
+                                 and the ids of the removed files are available in `deleted_file_ids`.
+        :param graph_base_url: Url of the Microsoft Graph API, to use a national cloud.
 
         For interactive authentication to work, a browser is used to authenticate, hence the registered application should have a redirect URI set to 'https://localhost'
         for mobile and native applications.
@@ -45,6 +60,15 @@ class OneDriveReader(BaseReader):
         self.tenant_id = tenant_id
         self.client_secret = client_secret
         self._is_interactive_auth = False if self.client_secret else True
+        self.delta_token_path = delta_token_path
+        self.graph_base_url = graph_base_url
+        self.num_workers = num_workers
+        self.deleted_file_ids: List[str] = []
+        self._graph_client = GraphClient(
+            num_workers=num_workers, max_retries=max_retries
+        )
+        self._download_executor: Optional[ThreadPoolExecutor] = None
+        self._pending_delta_states: Dict[str, Dict[str, Any]] = {}
 
     def _authenticate_with_msal(self) -> Any:
         """Authenticate with MSAL.
@@ -111,13 +135,7 @@ class OneDriveReader(BaseReader):
                 "userprincipalname cannot be empty for App authentication. Provide the userprincipalname (email mostly) of user whose OneDrive needs to be accessed"
             )
 
-        endpoint = "https://graph.microsoft.com/v1.0/"
-
-        # Update the base endpoint based on the authentication method
-        if self._is_interactive_auth:
-            endpoint += "me/drive"
-        else:
-            endpoint += f"users/{userprincipalname}/drive"
+        endpoint = self._drive_url(userprincipalname)
 
         # Update the endpoint for relative paths or item IDs
         if isRelativePath:
@@ -133,11 +151,16 @@ class OneDriveReader(BaseReader):
 
         return endpoint
 
+    def _drive_url(self, userprincipalname: Optional[str] = None) -> str:
+        """Url of the drive of the signed-in user, or of `userprincipalname` for App authentication."""
+        if self._is_interactive_auth:
+            return f"{self.graph_base_url}/me/drive"
+        return f"{self.graph_base_url}/users/{userprincipalname}/drive"
+
     def _get_items_in_drive_with_maxretries(
         self,
         access_token: str,
         item_ref: Optional[str] = "root",
-        max_retries: int = 3,
         userprincipalname: Optional[str] = None,
         isFile: bool = False,
         isRelativePath=False,
@@ -145,45 +168,40 @@ class OneDriveReader(BaseReader):
         """
         Retrieves items from a drive using Microsoft Graph API.
 
+        Requests go through the Graph client, which retries them while they are throttled or fail.
+
         Parameters:
-        access_token (str): Access token for API calls.
+        access_token (str): Access token for API calls, sent by the Graph client.
         item_ref (Optional[str]): Specific item ID/path or root for root folder.
-        max_retries (int): Max number of retries on rate limit or server errors.
         userprincipalname: str value indicating the userprincipalname(normally organization provided email id) whose ondrive needs to be accessed. Mandatory for App authentication scenarios.
         isFile: bool value to indicate if to query file or folder
         isRelativePath: bool value to indicate if to query file or folder using relative path
         Returns:
-        dict/None: JSON response or None after max retries.
+        dict: JSON response, with the children of all the pages of a folder under "value".
 
         Raises:
-        Exception: On non-retriable status code.
+        Exception: If the items cannot be retrieved.
         """
 
         endpoint = self._construct_endpoint(
             item_ref, isRelativePath, isFile, userprincipalname
         )
-        headers = {"Authorization": f"Bearer {access_token}"}
-        retries = 0
-
-        while retries < max_retries:
-            response = requests.get(endpoint, headers=headers)
-            if response.status_code == 200:
-                return response.json()
-            # Check for Ratelimit error, this can happen if you query endpoint recursively
-            # very frequently for large amount of file
-            elif response.status_code in (429, *range(500, 600)):
-                logger.warning(
-                    f"Retrying {retries+1} in {retries+1} secs. Status code: {response.status_code}"
-                )
-                retries += 1
-                time.sleep(retries)  # Exponential back-off
-            else:
-                raise Exception(
-                    f"API request to download {item_ref} failed with status code: {response.status_code}, message: {response.content}"
-                )
-
-        logger.error(f"Failed after {max_retries} attempts.")
-        return None
+        if not isFile:
+            # large folders are listed over several pages
+            return {
+                "value": [
+                    item
+                    for page in self._graph_client.iter_pages(endpoint)
+                    for item in page.get("value", [])
+                ]
+            }
+
+        response = self._graph_client.get(endpoint)
+        if response.status_code != 200:
+            raise Exception(
+                f"API request to download {item_ref} failed with status code: {response.status_code}, message: {response.content}"
+            )
+        return response.json()
 
     def _download_file_by_url(self, item: Dict[str, Any], local_dir: str) -> str:
         """
@@ -198,19 +216,16 @@ class OneDriveReader(BaseReader):
 
         """
 
-        # Extract download URL and filename from the provided item.
-        file_download_url = item["@microsoft.graph.downloadUrl"]
-        file_name = item["name"]
-
-        # Download the file.
-        file_data = requests.get(file_download_url)
-
-        # Save the downloaded file to the specified local directory.
-        file_path = os.path.join(local_dir, file_name)
-        with open(file_path, "wb") as f:
-            f.write(file_data.content)
-
-        return file_path
+        # Stream the file to the specified local directory, over pooled connections.
+        # Items listed by delta queries may have no download URL, they are then
+        # downloaded from their drive.
+        file_path = os.path.join(local_dir, item["name"])
+        drive_id = item.get("parentReference", {}).get("driveId")
+        return self._graph_client.download_item(
+            item,
+            file_path,
+            f"{self.graph_base_url}/drives/{drive_id}" if drive_id else None,
+        )
 
     def _extract_metadata_for_file(self, item: Dict[str, Any]) -> Dict[str, str]:
         """
@@ -283,6 +298,92 @@ class OneDriveReader(BaseReader):
 
         return metadata
 
+    def _submit_download(
+        self,
+        item: Dict[str, Any],
+        local_dir: str,
+        mime_types: Optional[List[str]] = None,
+    ) -> Future:
+        """
+        Checks the MIME type of a file and downloads it in the download thread pool, if there is one.
+
+        :return: Future, resolving to the metadata of the downloaded file.
+        """
+        if self._download_executor is not None:
+            return self._download_executor.submit(
+                self._check_approved_mimetype_and_download_file,
+                item,
+                local_dir,
+                mime_types,
+            )
+
+        future: Future = Future()
+        future.set_result(
+            self._check_approved_mimetype_and_download_file(item, local_dir, mime_types)
+        )
+        return future
+
+    def _sync_folder_and_download(
+        self,
+        access_token: str,
+        local_dir: str,
+        item_ref: str,
+        include_subfolders: bool = True,
+        mime_types: Optional[List[str]] = None,
+        userprincipalname: Optional[str] = None,
+        isRelativePath=False,
+    ) -> Dict[str, Any]:
+        """
+        Download the files of a folder added or modified since its previous sync, using a Graph delta query.
+
+        Each file is downloaded to a directory named after its ID, so that files of different subfolders do not collide.
+        The new delta state of the folder is persisted by `load_data`, once the files are loaded.
+
+        Parameters:
+        - access_token (str): Token for authorization.
+        - local_dir (str): Local directory to store downloaded files.
+        - item_ref (str): ID or relative path of the folder, or "root".
+        - include_subfolders (bool, optional): Whether to include subfolders. Defaults to True.
+        - mime_types(List[str], optional): the mimeTypes you want to allow e.g.: "application/pdf", default is None which loads all files
+        - userprincipalname (str): The userprincipalname(normally organization provided email id) whose ondrive needs to be accessed. Mandatory for App authentication scenarios.
+        - isRelativePath (bool): Value to indicate if item_ref is a relative path
+
+        Returns:
+        - dict: Dictionary of file paths and their corresponding metadata.
+        """
+        folder = self._get_items_in_drive_with_maxretries(
+            access_token,
+            item_ref,
+            userprincipalname=userprincipalname,
+            isFile=True,
+            isRelativePath=isRelativePath,
+        )
+        if not folder:
+            raise Exception(f"Unable to retrieve folder: {item_ref}")
+
+        drive_url = self._drive_url(userprincipalname)
+        delta_key = (
+            f"{drive_url}/items/{folder['id']}"
+            f"{'/recursive' if include_subfolders else ''}"
+        )
+        files, deleted_file_ids, delta_state = self._graph_client.sync_folder(
+            drive_url,
+            folder["id"],
+            recursive=include_subfolders,
+            state=load_delta_state(self.delta_token_path, delta_key),
+        )
+        self.deleted_file_ids.extend(deleted_file_ids)
+        self._pending_delta_states[delta_key] = delta_state
+
+        metadata = {}
+        downloads = [
+            self._submit_download(item, os.path.join(local_dir, item["id"]), mime_types)
+            for item in files
+        ]
+        for download in downloads:
+            metadata.update(download.result())
+        return metadata
+
     def _connect_download_and_return_metadata(
         self,
         access_token: str,
@@ -321,6 +422,7 @@ class OneDriveReader(BaseReader):
 
         if data:
             metadata = {}
+            downloads = []
             for item in data["value"]:
                 if (
                     "folder" in item and include_subfolders
@@ -336,11 +438,10 @@ class OneDriveReader(BaseReader):
                     metadata.update(subfolder_metadata)  # Merge metadata
 
                 elif "file" in item:
-                    file_metadata = self._check_approved_mimetype_and_download_file(
-                        item, local_dir, mime_types
-                    )
-                    metadata.update(file_metadata)
+                    downloads.append(self._submit_download(item, local_dir, mime_types))
 
+            for download in downloads:
+                metadata.update(download.result())
             return metadata
 
         # No data received; raise exception
@@ -373,79 +474,95 @@ class OneDriveReader(BaseReader):
 
         """
         access_token = self._authenticate_with_msal()
-        is_download_from_root = True
-        downloaded_files_metadata = {}
-        # If a folder_id is provided, download files from the folder
-        if folder_id:
-            is_download_from_root = False
-            folder_metadata = self._connect_download_and_return_metadata(
-                access_token,
-                temp_dir,
-                folder_id,
-                recursive,
-                mime_types=mime_types,
-                userprincipalname=userprincipalname,
-            )
-            downloaded_files_metadata.update(folder_metadata)
-
-        # Download files using the provided file IDs
-        if file_ids:
-            is_download_from_root = False
-            for file_id in file_ids or []:
-                item = self._get_items_in_drive_with_maxretries(
+        self._graph_client.access_token = access_token
+        self.deleted_file_ids = []
+        self._pending_delta_states = {}
+        # With a delta token file, folders are synced incrementally
+        download_folder = (
+            self._connect_download_and_return_metadata
+            if self.delta_token_path is None
+            else self._sync_folder_and_download
+        )
+        self._download_executor = ThreadPoolExecutor(max_workers=self.num_workers)
+        try:
+            is_download_from_root = True
+            downloaded_files_metadata = {}
+            file_downloads = []
+            # If a folder_id is provided, download files from the folder
+            if folder_id:
+                is_download_from_root = False
+                folder_metadata = download_folder(
                     access_token,
-                    file_id,
+                    temp_dir,
+                    folder_id,
+                    recursive,
+                    mime_types=mime_types,
                     userprincipalname=userprincipalname,
-                    isFile=True,
-                )
-                file_metadata = self._check_approved_mimetype_and_download_file(
-                    item, temp_dir, mime_types
                 )
-                downloaded_files_metadata.update(file_metadata)
-
-        # If a folder_path is provided, download files from the folder
-        if folder_path:
-            is_download_from_root = False
-            folder_metadata = self._connect_download_and_return_metadata(
-                access_token,
-                temp_dir,
-                folder_path,
-                recursive,
-                mime_types=mime_types,
-                userprincipalname=userprincipalname,
-                isRelativePath=True,
-            )
-            downloaded_files_metadata.update(folder_metadata)
+                downloaded_files_metadata.update(folder_metadata)
 
-        # Download files using the provided file paths
-        if file_paths:
-            is_download_from_root = False
-            for file_path in file_paths or []:
-                item = self._get_items_in_drive_with_maxretries(
+            # Download files using the provided file IDs
+            if file_ids:
+                is_download_from_root = False
+                for file_id in file_ids or []:
+                    item = self._get_items_in_drive_with_maxretries(
+                        access_token,
+                        file_id,
+                        userprincipalname=userprincipalname,
+                        isFile=True,
+                    )
+                    file_downloads.append(
+                        self._submit_download(item, temp_dir, mime_types)
+                    )
+
+            # If a folder_path is provided, download files from the folder
+            if folder_path:
+                is_download_from_root = False
+                folder_metadata = download_folder(
                     access_token,
-                    file_path,
+                    temp_dir,
+                    folder_path,
+                    recursive,
+                    mime_types=mime_types,
                     userprincipalname=userprincipalname,
-                    isFile=True,
                     isRelativePath=True,
                 )
-                file_metadata = self._check_approved_mimetype_and_download_file(
-                    item, temp_dir, mime_types
+                downloaded_files_metadata.update(folder_metadata)
+
+            # Download files using the provided file paths
+            if file_paths:
+                is_download_from_root = False
+                for file_path in file_paths or []:
+                    item = self._get_items_in_drive_with_maxretries(
+                        access_token,
+                        file_path,
+                        userprincipalname=userprincipalname,
+                        isFile=True,
+                        isRelativePath=True,
+                    )
+                    file_downloads.append(
+                        self._submit_download(item, temp_dir, mime_types)
+                    )
+
+            if is_download_from_root:
+                # download files from root folder
+                root_folder_metadata = download_folder(
+                    access_token,
+                    temp_dir,
+                    "root",
+                    recursive,
+                    mime_types=mime_types,
+                    userprincipalname=userprincipalname,
                 )
-                downloaded_files_metadata.update(file_metadata)
-
-        if is_download_from_root:
-            # download files from root folder
-            root_folder_metadata = self._connect_download_and_return_metadata(
-                access_token,
-                temp_dir,
-                "root",
-                recursive,
-                mime_types=mime_types,
-                userprincipalname=userprincipalname,
-            )
-            downloaded_files_metadata.update(root_folder_metadata)
+                downloaded_files_metadata.update(root_folder_metadata)
 
-        return downloaded_files_metadata
+            for download in file_downloads:
+                downloaded_files_metadata.update(download.result())
+
+            return downloaded_files_metadata
+        finally:
+            self._download_executor.shutdown()
+            self._download_executor = None
 
     def _load_documents_with_metadata(
         self, directory: str, recursive: bool = True
@@ -512,8 +629,19 @@ class OneDriveReader(BaseReader):
                     mime_types=mime_types,
                     userprincipalname=userprincipalname,
                 )
-                return self._load_documents_with_metadata(temp_dir, recursive=recursive)
+                documents = []
+                if self._downloaded_files_metadata:
+                    # synced files are downloaded to a directory per file
+                    documents = self._load_documents_with_metadata(
+                        temp_dir,
+                        recursive=recursive or self.delta_token_path is not None,
+                    )
+                for delta_key, delta_state in self._pending_delta_states.items():
+                    save_delta_state(self.delta_token_path, delta_key, delta_state)
+                return documents
         except Exception as e:
             logger.error(
                 "An error occurred while loading the data: {}".format(e), exc_info=True
             )
+        finally:
+            self._graph_client.close()
@@ -3,7 +3,7 @@
 import os
 import logging
 
-from typing import Any, Dict, List, Optional
+from typing import Any, Dict, List, Optional, Tuple
 import tempfile
 
 import requests
@@ -11,9 +11,14 @@ import requests
 from llama_index import download_loader
 from llama_index.readers.base import BaseReader
 from llama_index.schema import Document
+from llama_hub.microsoft_graph import (
+    GRAPH_API_URL,
+    GraphClient,
+    load_delta_state,
+    save_delta_state,
+)
 from llama_hub.utils import import_loader
 
-
 logger = logging.getLogger(__name__)
 
 
@@ -30,6 +35,10 @@ class SharePointReader(BaseReader):
         tenant_id: str,
         filename_as_id: bool = False,
         file_extractor: Optional[Dict[str, BaseReader]] = None,
+        num_workers: int = 8,
+        max_retries: int = 5,
+        delta_token_path: Optional[str] = None,
+        graph_base_url: str = GRAPH_API_URL,
     ) -> None:
         """
         Initializes an instance of SharePoint reader.
@@ -42,6 +51,13 @@ class SharePointReader(BaseReader):
             file_extractor (Optional[Dict[str, BaseReader]]): A mapping of file
                 extension to a BaseReader class that specifies how to convert that file
                 to text. See `SimpleDirectoryReader` for more details.
+            num_workers (int): Number of files downloaded concurrently over pooled connections.
+            max_retries (int): Number of retries of requests throttled (429) or failed (5xx) by Microsoft Graph,
+                       after the delay of their `Retry-After` header.
+            delta_token_path (Optional[str]): Path of a JSON file storing the Graph delta link of each loaded folder.
+                       When set, only the files added or modified since the previous load of the folder are
+                       downloaded, and the ids of the removed files are available in `deleted_file_ids`.
+            graph_base_url (str): Url of the Microsoft Graph API, to use a national cloud.
         """
         self.client_id = (client_id,)
         self.client_secret = (client_secret,)
@@ -49,6 +65,12 @@ class SharePointReader(BaseReader):
         self._authorization_headers = None
         self.file_extractor = file_extractor
         self.filename_as_id = filename_as_id
+        self.delta_token_path = delta_token_path
+        self.graph_base_url = graph_base_url
+        self.deleted_file_ids: List[str] = []
+        self._graph_client = GraphClient(
+            num_workers=num_workers, max_retries=max_retries
+        )
 
     def _get_access_token(self) -> str:
         """
@@ -95,14 +117,12 @@ class SharePointReader(BaseReader):
             Exception: If the specified SharePoint site is not found.
         """
         site_information_endpoint = (
-            f"https://graph.microsoft.com/v1.0/sites?search={sharepoint_site_name}"
+            f"{self.graph_base_url}/sites?search={sharepoint_site_name}"
         )
         self._authorization_headers = {"Authorization": f"Bearer {access_token}"}
+        self._graph_client.access_token = access_token
 
-        response = requests.get(
-            url=site_information_endpoint,
-            headers=self._authorization_headers,
-        )
+        response = self._graph_client.get(site_information_endpoint)
 
         if response.status_code == 200 and "value" in response.json():
             if (
@@ -130,13 +150,12 @@ class SharePointReader(BaseReader):
         Raises:
             ValueError: If there is an error in obtaining the drive ID.
         """
-        self._drive_id_endpoint = f"https://graph.microsoft.com/v1.0/sites/{self._site_id_with_host_name}/drives"
-
-        response = requests.get(
-            url=self._drive_id_endpoint,
-            headers=self._authorization_headers,
+        self._drive_id_endpoint = (
+            f"{self.graph_base_url}/sites/{self._site_id_with_host_name}/drives"
         )
 
+        response = self._graph_client.get(self._drive_id_endpoint)
+
         if response.status_code == 200 and "value" in response.json():
             if (
                 len(response.json()["value"]) > 0
@@ -165,10 +184,7 @@ class SharePointReader(BaseReader):
             f"{self._drive_id_endpoint}/{self._drive_id}/root:/{folder_path}"
         )
 
-        response = requests.get(
-            url=folder_id_endpoint,
-            headers=self._authorization_headers,
-        )
+        response = self._graph_client.get(folder_id_endpoint)
 
         if response.status_code == 200 and "id" in response.json():
             return response.json()["id"]
@@ -195,36 +211,68 @@ class SharePointReader(BaseReader):
         Raises:
             ValueError: If there is an error in downloading the files.
         """
+        files = self._list_folder_files(folder_id, download_dir, include_subfolders)
+        return self._download_files(files)
+
+    def _list_folder_files(
+        self,
+        folder_id: str,
+        download_dir: str,
+        include_subfolders: bool = False,
+    ) -> List[Tuple[Dict[str, Any], str]]:
+        """
+        Lists the files of the specified folder ID, with the paths to download them to.
+
+        Args:
+            folder_id (str): The ID of the folder whose files should be listed.
+            download_dir (str): The directory where the files should be downloaded.
+            include_subfolders (bool): If True, files from all subfolders are listed.
+
+        Returns:
+            List[Tuple[Dict[str, Any], str]]: The file items and their download paths.
+
+        Raises:
+            ValueError: If there is an error in listing the files.
+        """
         folder_info_endpoint = (
             f"{self._drive_id_endpoint}/{self._drive_id}/items/{folder_id}/children"
         )
 
-        response = requests.get(
-            url=folder_info_endpoint,
-            headers=self._authorization_headers,
-        )
-
-        if response.status_code == 200:
-            data = response.json()
-            metadata = {}
-            for item in data["value"]:
+        files = []
+        for page in self._graph_client.iter_pages(folder_info_endpoint):
+            for item in page["value"]:
                 if include_subfolders and "folder" in item:
                     sub_folder_download_dir = os.path.join(download_dir, item["name"])
-                    subfolder_metadata = self._download_files_and_extract_metadata(
-                        folder_id=item["id"],
-                        download_dir=sub_folder_download_dir,
-                        include_subfolders=include_subfolders,
+                    files.extend(
+                        self._list_folder_files(
+                            folder_id=item["id"],
+                            download_dir=sub_folder_download_dir,
+                            include_subfolders=include_subfolders,
+                        )
                     )
 
-                    metadata.update(subfolder_metadata)
-
                 elif "file" in item:
-                    file_metadata = self._download_file(item, download_dir)
-                    metadata.update(file_metadata)
-            return metadata
-        else:
-            logger.error(response.json()["error"])
-            raise ValueError(response.json()["error"])
+                    files.append((item, os.path.join(download_dir, item["name"])))
+        return files
+
+    def _download_files(
+        self, files: List[Tuple[Dict[str, Any], str]]
+    ) -> Dict[str, Dict[str, str]]:
+        """
+        Downloads files concurrently and extracts their metadata.
+
+        Args:
+            files (List[Tuple[Dict[str, Any], str]]): The file items and their download paths.
+
+        Returns:
+            Dict[str, Dict[str, str]]: A dictionary containing the metadata of the downloaded files.
+        """
+        metadata = {}
+        for item, file_path in self._graph_client.download_items(
+            files, f"{self._drive_id_endpoint}/{self._drive_id}"
+        ):
+            metadata[file_path] = self._extract_metadata_for_file(item)
+        return metadata
 
     def _download_file_by_url(self, item: Dict[str, Any], download_dir: str) -> str:
         """
@@ -238,20 +286,10 @@ class SharePointReader(BaseReader):
             str: The path of the downloaded file in the temporary directory.
         """
 
-        # Get the donwload URL for the file.
-        file_download_url = item["@microsoft.graph.downloadUrl"]
-        file_name = item["name"]
-
-        response = requests.get(file_download_url)
-
-        # Create the directory if it does not exist and save the file.
-        if not os.path.exists(download_dir):
-            os.makedirs(download_dir)
-        file_path = os.path.join(download_dir, file_name)
-        with open(file_path, "wb") as f:
-            f.write(response.content)
-
-        return file_path
+        file_path = os.path.join(download_dir, item["name"])
+        return self._graph_client.download_item(
+            item, file_path, f"{self._drive_id_endpoint}/{self._drive_id}"
+        )
 
     def _extract_metadata_for_file(self, item: Dict[str, Any]) -> Dict[str, str]:
         """
@@ -305,6 +343,24 @@ class SharePointReader(BaseReader):
             Dict[str, str]: A dictionary containing the metadata of the downloaded files.
 
         """
+        self._resolve_sharepoint_folder(sharepoint_site_name, sharepoint_folder_path)
+
+        metadata = self._download_files_and_extract_metadata(
+            self.sharepoint_folder_id, download_dir, recursive
+        )
+
+        return metadata
+
+    def _resolve_sharepoint_folder(
+        self, sharepoint_site_name: str, sharepoint_folder_path: str
+    ) -> None:
+        """
+        Authenticates and retrieves the site, drive and folder IDs of the folder.
+
+        Args:
+            sharepoint_site_name (str): The name of the SharePoint site.
+            sharepoint_folder_path (str): The path of the folder in the SharePoint site.
+        """
         access_token = self._get_access_token()
 
         self._site_id_with_host_name = self._get_site_id_with_host_name(
@@ -317,11 +373,48 @@ class SharePointReader(BaseReader):
             sharepoint_folder_path
         )
 
-        metadata = self._download_files_and_extract_metadata(
-            self.sharepoint_folder_id, download_dir, recursive
-        )
+    def _sync_files_from_sharepoint(
+        self,
+        download_dir: str,
+        sharepoint_site_name: str,
+        sharepoint_folder_path: str,
+        recursive: bool,
+    ) -> Tuple[Dict[str, Any], str, Dict[str, Any]]:
+        """
+        Downloads the files of the folder changed since its previous sync.
 
-        return metadata
+        Each file is downloaded to a directory named after its ID, so that
+        files of different subfolders do not collide.
+
+        Args:
+            download_dir (str): The directory where the files should be downloaded.
+            sharepoint_site_name (str): The name of the SharePoint site.
+            sharepoint_folder_path (str): The path of the folder in the SharePoint site.
+            recursive (bool): If True, files from all subfolders are synced.
+
+        Returns:
+            Tuple[Dict[str, Any], str, Dict[str, Any]]: The metadata of the downloaded files,
+                and the key and delta state to persist once the files are loaded.
+        """
+        self._resolve_sharepoint_folder(sharepoint_site_name, sharepoint_folder_path)
+
+        delta_key = (
+            f"{self._drive_id}/{self.sharepoint_folder_id}"
+            f"{'/recursive' if recursive else ''}"
+        )
+        files, self.deleted_file_ids, delta_state = self._graph_client.sync_folder(
+            f"{self._drive_id_endpoint}/{self._drive_id}",
+            self.sharepoint_folder_id,
+            recursive=recursive,
+            state=load_delta_state(self.delta_token_path, delta_key),
+        )
+        metadata = self._download_files(
+            [
+                (item, os.path.join(download_dir, item["id"], item["name"]))
+                for item in files
+            ]
+        )
+        return metadata, delta_key, delta_state
 
     def _load_documents_with_metadata(
         self,
@@ -381,13 +474,38 @@ class SharePointReader(BaseReader):
         """
         try:
             with tempfile.TemporaryDirectory() as temp_dir:
-                files_metadata = self._download_files_from_sharepoint(
-                    temp_dir, sharepoint_site_name, sharepoint_folder_path, recursive
-                )
-                # return self.files_metadata
-                return self._load_documents_with_metadata(
-                    files_metadata, temp_dir, recursive
-                )
+                if self.delta_token_path is None:
+                    files_metadata = self._download_files_from_sharepoint(
+                        temp_dir,
+                        sharepoint_site_name,
+                        sharepoint_folder_path,
+                        recursive,
+                    )
+                else:
+                    (
+                        files_metadata,
+                        delta_key,
+                        delta_state,
+                    ) = self._sync_files_from_sharepoint(
+                        temp_dir,
+                        sharepoint_site_name,
+                        sharepoint_folder_path,
+                        recursive,
+                    )
+
+                documents = []
+                if files_metadata:
+                    # synced files are downloaded to a directory per file
+                    documents = self._load_documents_with_metadata(
+                        files_metadata,
+                        temp_dir,
+                        recursive or self.delta_token_path is not None,
+                    )
+                if self.delta_token_path is not None:
+                    save_delta_state(self.delta_token_path, delta_key, delta_state)
+                return documents
 
         except Exception as exp:
             logger.error("An error occurred while accessing SharePoint: %s", exp)
+        finally:
+            self._graph_client.close()
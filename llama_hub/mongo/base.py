@@ -1,6 +1,9 @@
 """Mongo client."""
 
-from typing import Dict, List, Optional, Union
+import queue
+import threading
+from concurrent.futures import ThreadPoolExecutor
+from typing import Any, Dict, Iterator, List, Optional, Tuple, Union
 
 from llama_index.readers.base import BaseReader
 from llama_index.readers.schema.base import Document
@@ -39,6 +42,7 @@ class SimpleMongoReader(BaseReader):
             raise ValueError("Either `host` and `port` or `uri` must be provided.")
 
         self.client = client
+        self._last_id: Any = None
 
     def _flatten(self, texts: List[Union[str, List[str]]]) -> List[str]:
         result = []
@@ -46,6 +50,249 @@ class SimpleMongoReader(BaseReader):
             result += text if isinstance(text, list) else [text]
         return result
 
+    def _to_document(
+        self,
+        item: Dict,
+        field_names: List[str],
+        separator: str,
+        metadata_names: Optional[List[str]],
+    ) -> Document:
+        try:
+            texts = [item[name] for name in field_names]
+        except KeyError as err:
+            raise ValueError(
+                f"{err.args[0]} field not found in Mongo document."
+            ) from err
+
+        texts = self._flatten(texts)
+        text = separator.join(texts)
+
+        if metadata_names is None:
+            return Document(text=text)
+        try:
+            metadata = {name: item[name] for name in metadata_names}
+        except KeyError as err:
+            raise ValueError(
+                f"{err.args[0]} field not found in Mongo document."
+            ) from err
+        return Document(text=text, metadata=metadata)
+
+    def _partition_bounds(
+        self, collection: Any, query: Dict, num_partitions: int
+    ) -> List[Tuple[Any, Any]]:
+        """Split the `_id` range of the matching documents into partitions of similar size.
+
+        Returns `(lower, upper)` bounds, inclusive and exclusive, where None
+        means unbounded.
+        """
+        count = collection.count_documents(query) if num_partitions > 1 else 0
+        bounds: List[Any] = [None]
+        for i in range(1, num_partitions):
+            skip = i * count // num_partitions
+            if skip == 0:
+                continue
+            # walks the `_id` index only
+            split = list(
+                collection.find(query, {"_id": 1}).sort("_id", 1).skip(skip).limit(1)
+            )
+            if split and split[0]["_id"] != bounds[-1]:
+                bounds.append(split[0]["_id"])
+        return list(zip(bounds, bounds[1:] + [None]))
+
+    def _find_range(
+        self,
+        collection: Any,
+        query: Dict,
+        projection: Optional[Dict[str, int]],
+        batch_size: int,
+        lower: Any = None,
+        upper: Any = None,
+        limit: int = 0,
+    ) -> Any:
+        id_range = {}
+        if lower is not None:
+            id_range["$gte"] = lower
+        if upper is not None:
+            id_range["$lt"] = upper
+        if id_range:
+            query = {"$and": [query, {"_id": id_range}]}
+        return collection.find(
+            filter=query,
+            projection=projection,
+            sort=[("_id", 1)],
+            batch_size=batch_size,
+            limit=limit,
+        )
+
+    def _scan_partitions(
+        self,
+        collection: Any,
+        query: Dict,
+        projection: Optional[Dict[str, int]],
+        batch_size: int,
+        num_workers: int,
+    ) -> Iterator[Tuple[int, Optional[List[Dict]]]]:
+        """Scan `_id` partitions in threads, yielding `(partition, batch)`.
+
+        Batches are yielded as they are read, at most `2 * num_workers`
+        being buffered; a None batch marks the end of its partition.
+        """
+        bounds = self._partition_bounds(collection, query, num_workers)
+        batches: queue.Queue = queue.Queue(maxsize=2 * num_workers)
+        stop = threading.Event()
+
+        def put(value: Any) -> None:
+            while not stop.is_set():
+                try:
+                    batches.put(value, timeout=0.1)
+                    return
+                except queue.Full:
+                    continue
+
+        def scan(partition: int, lower: Any, upper: Any) -> None:
+            try:
+                batch = []
+                cursor = self._find_range(
+                    collection, query, projection, batch_size, lower, upper
+                )
+                for item in cursor:
+                    if stop.is_set():
+                        return
+                    batch.append(item)
+                    if len(batch) >= batch_size:
+                        put((partition, batch))
+                        batch = []
+                if batch:
+                    put((partition, batch))
+                put((partition, None))
+            except Exception as e:
+                put((partition, e))
+
+        with ThreadPoolExecutor(max_workers=num_workers) as executor:
+            for partition, (lower, upper) in enumerate(bounds):
+                executor.submit(scan, partition, lower, upper)
+            try:
+                remaining = len(bounds)
+                while remaining:
+                    partition, batch = batches.get()
+                    if isinstance(batch, Exception):
+                        raise batch
+                    if batch is None:
+                        remaining -= 1
+                    yield partition, batch
+            finally:
+                stop.set()
+
+    def lazy_load_data(
+        self,
+        db_name: str,
+        collection_name: str,
+        field_names: List[str] = ["text"],
+        separator: str = "",
+        query_dict: Optional[Dict] = None,
+        max_docs: int = 0,
+        metadata_names: Optional[List[str]] = None,
+        batch_size: int = 1000,
+        num_workers: int = 1,
+        resume_after_id: Optional[Any] = None,
+    ) -> Iterator[Document]:
+        """Lazily load documents, in batches of the Mongo cursor.
+
+        Only `field_names` and `metadata_names` are fetched from the server.
+        Documents are read in `_id` order, and `get_last_id` returns the
+        `_id` to pass as `resume_after_id` to resume an interrupted load.
+
+        With `num_workers` > 1, the `_id` range of the matching documents is
+        split into as many partitions, scanned concurrently by threads, and
+        documents are yielded as they arrive.
+
+        Args:
+            db_name (str): name of the database.
+            collection_name (str): name of the collection.
+            field_names(List[str]): names of the fields to be concatenated.
+                Defaults to ["text"]
+            separator (str): separator to be used between fields.
+                Defaults to ""
+            query_dict (Optional[Dict]): query to filter documents.
+                Defaults to None
+            max_docs (int): maximum number of documents to load.
+                Defaults to 0 (no limit)
+            metadata_names (Optional[List[str]]): names of the fields to be added
+                to the metadata attribute of the Document. Defaults to None
+            batch_size (int): number of Mongo documents fetched per round trip.
+                Defaults to 1000
+            num_workers (int): number of partitions scanned concurrently.
+                Defaults to 1
+            resume_after_id (Optional[Any]): only load documents whose `_id`
+                is greater. Defaults to None
+
+        Returns:
+            Iterator[Document]: Documents, one per Mongo document.
+        """
+        collection = self.client[db_name][collection_name]
+        query = query_dict or {}
+        if resume_after_id is not None:
+            query = {"$and": [query, {"_id": {"$gt": resume_after_id}}]}
+        projection = {name: 1 for name in field_names + (metadata_names or [])}
+
+        self._last_id = resume_after_id
+        if num_workers <= 1:
+            cursor = self._find_range(
+                collection, query, projection, batch_size, limit=max_docs
+            )
+            for item in cursor:
+                yield self._to_document(item, field_names, separator, metadata_names)
+                # set once the next document is requested, so that an
+                # interrupted document is loaded again on resume
+                self._last_id = item["_id"]
+            return
+
+        # documents of all partitions before the first unfinished one, and of
+        # that one up to its last consumed `_id`, were consumed
+        partition_last_ids: Dict[int, Any] = {}
+        finished = set()
+        num_docs = 0
+        for partition, batch in self._scan_partitions(
+            collection, query, projection, batch_size, num_workers
+        ):
+            if batch is None:
+                finished.add(partition)
+                self._last_id = self._low_watermark(
+                    resume_after_id, partition_last_ids, finished
+                )
+                continue
+            for item in batch:
+                yield self._to_document(item, field_names, separator, metadata_names)
+                partition_last_ids[partition] = item["_id"]
+                self._last_id = self._low_watermark(
+                    resume_after_id, partition_last_ids, finished
+                )
+                num_docs += 1
+                if max_docs and num_docs >= max_docs:
+                    return
+
+    @staticmethod
+    def _low_watermark(
+        resume_after_id: Any, partition_last_ids: Dict[int, Any], finished: set
+    ) -> Any:
+        """The `_id` up to which every document was consumed."""
+        last_id = resume_after_id
+        partition = 0
+        while True:
+            last_id = partition_last_ids.get(partition, last_id)
+            if partition not in finished:
+                return last_id
+            partition += 1
+
+    def get_last_id(self) -> Any:
+        """
+        Returns: The `_id` up to which `lazy_load_data` documents were consumed,
+        to pass as `resume_after_id` to resume loading. Documents being
+        processed when loading stopped, and with `num_workers` > 1 documents of
+        later partitions, are loaded again.
+        """
+        return self._last_id
+
     def load_data(
         self,
         db_name: str,
@@ -76,29 +323,14 @@ class SimpleMongoReader(BaseReader):
         Returns:
             List[Document]: A list of documents.
         """
-        db = self.client[db_name]
-        cursor = db[collection_name].find(filter=query_dict or {}, limit=max_docs)
-
-        documents = []
-        for item in cursor:
-            try:
-                texts = [item[name] for name in field_names]
-            except KeyError as err:
-                raise ValueError(
-                    f"{err.args[0]} field not found in Mongo document."
-                ) from err
-
-            texts = self._flatten(texts)
-            text = separator.join(texts)
-
-            if metadata_names is None:
-                documents.append(Document(text=text))
-            else:
-                try:
-                    metadata = {name: item[name] for name in metadata_names}
-                except KeyError as err:
-                    raise ValueError(
-                        f"{err.args[0]} field not found in Mongo document."
-                    ) from err
-                documents.append(Document(text=text, metadata=metadata))
-        return documents
+        return list(
+            self.lazy_load_data(
+                db_name,
+                collection_name,
+                field_names=field_names,
+                separator=separator,
+                query_dict=query_dict,
+                max_docs=max_docs,
+                metadata_names=metadata_names,
+            )
+        )
@@ -47,18 +47,36 @@ class RemoteReader(BaseReader):
 
     def load_data(self, url: str) -> List[Document]:
         """Parse whatever is at the URL."""
-        import tempfile
-        from urllib.parse import urlparse
         from urllib.request import Request, urlopen
 
-        extra_info = {"Source": url}
-
         req = Request(url, headers={"User-Agent": "Magic Browser"})
         result = urlopen(req)
         url_type = result.info().get_content_type()
+        return self.load_content(url, url_type, result.read())
+
+    def load_content(self, url: str, url_type: str, content: bytes) -> List[Document]:
+        """Parse the already downloaded content of a URL.
+
+        Args:
+            url (str): The URL the content was downloaded from.
+            url_type (str): The content type of the response, e.g. `text/html`.
+            content (bytes): The body of the response.
+
+        Returns:
+            List[Document]: List of documents.
+
+        """
+        import io
+        import tempfile
+        from urllib.parse import urlparse
+
+        extra_info = {"Source": url}
+
         documents = []
         if url_type == "text/html" or url_type == "text/plain":
-            text = "\n\n".join([str(el.decode("utf-8-sig")) for el in result])
+            text = "\n\n".join(
+                [str(el.decode("utf-8-sig")) for el in io.BytesIO(content)]
+            )
             documents = [Document(text=text, extra_info=extra_info)]
         elif self._is_youtube_video(url):
             try:
@@ -75,7 +93,7 @@ class RemoteReader(BaseReader):
             with tempfile.TemporaryDirectory() as temp_dir:
                 filepath = f"{temp_dir}/temp{suffix}"
                 with open(filepath, "wb") as output:
-                    output.write(result.read())
+                    output.write(content)
 
                 SimpleDirectoryReader = download_loader("SimpleDirectoryReader")
                 loader = SimpleDirectoryReader(
@@ -2,13 +2,17 @@
 
 A loader that fetches any remote page or file by URL and retrieves child pages with certain constraints. The class also parses the contents of each page and provides access to the parsed data.
 """
-from typing import Any, Dict, List, Optional, Union
+import asyncio
+from typing import Any, Dict, List, Optional, Tuple, Union
 
 import requests
 from llama_index import download_loader
 from llama_index.readers.base import BaseReader
 from llama_index.readers.schema.base import Document
 
+# the user agent RemoteReader sends
+USER_AGENT = "Magic Browser"
+
 
 class RemoteDepthReader(BaseReader):
     def __init__(
@@ -17,6 +21,10 @@ class RemoteDepthReader(BaseReader):
         file_extractor: Optional[Dict[str, Union[str, BaseReader]]] = None,
         depth: int = 1,
         domain_lock: bool = False,
+        max_concurrency: int = 10,
+        max_per_domain: int = 2,
+        delay: float = 0.0,
+        respect_robots: bool = False,
         **kwargs: Any,
     ) -> None:
         """Init params."""
@@ -24,11 +32,23 @@ class RemoteDepthReader(BaseReader):
         self.file_extractor = file_extractor
         self.depth = depth
         self.domain_lock = domain_lock
+        self.max_concurrency = max_concurrency
+        self.max_per_domain = max_per_domain
+        self.delay = delay
+        self.respect_robots = respect_robots
 
     def load_data(self, url: str) -> List[Document]:
-        from tqdm.auto import tqdm
+        """Parse whatever is at the URL and at the links it contains.
 
-        """Parse whatever is at the URL.""" ""
+        Each page is fetched once: its links are extracted from the same
+        response that is parsed into documents.
+        """
+        try:
+            import aiohttp
+        except ImportError:
+            raise ImportError(
+                "`aiohttp` package not found, please run `pip install aiohttp`"
+            )
         try:
             from llama_hub.utils import import_loader
 
@@ -36,37 +56,56 @@ class RemoteDepthReader(BaseReader):
         except ImportError:
             RemoteReader = download_loader("RemoteReader")
         remote_reader = RemoteReader(file_extractor=self.file_extractor)
-        documents = []
-        links = self.get_links(url)
-        urls = {-1: [url]}  # -1 is the starting point
-        links_visited = []
-        for i in range(self.depth + 1):
-            urls[i] = []
-            new_links = []
-            print(f"Reading links at depth {i}...")
-            for link in tqdm(links):
-                """Checking if the link belongs the provided domain."""
-                if (self.domain_lock and link.find(url) > -1) or (not self.domain_lock):
-                    print("Loading link: " + link)
-                    if link in links_visited:
-                        continue
-                    if link:
-                        urls[i].append(link)
-                        new_links.extend(self.get_links(link))
-                    links_visited.append(link)
-                else:
-                    print("Link ignored: " + link)
-            new_links = list(set(new_links))
-            links = new_links
-        print(f"Found {len(urls)} links at depth {self.depth}.")
-        for depth_i in urls:
-            for url in urls[depth_i]:
+
+        from llama_hub.web.crawler import CrawlFrontier, run_sync
+
+        # the start page is at depth 0, its links are at depth 1
+        frontier = CrawlFrontier(
+            max_depth=self.depth + 1,
+            allow_url=(lambda link: link.find(url) > -1) if self.domain_lock else None,
+            max_concurrency=self.max_concurrency,
+            max_per_domain=self.max_per_domain,
+            delay=self.delay,
+            respect_robots=self.respect_robots,
+            user_agent=USER_AGENT,
+            strip_query=True,
+        )
+
+        async def crawl() -> List[Tuple[int, List[Document]]]:
+            loop = asyncio.get_running_loop()
+            session = aiohttp.ClientSession(headers={"User-Agent": USER_AGENT})
+
+            async def fetch(link: str) -> Tuple[List[Document], List[str]]:
+                print("Loading link: " + link)
                 try:
-                    documents.extend(remote_reader.load_data(url))
+                    async with session.get(link) as response:
+                        response.raise_for_status()
+                        url_type = response.content_type
+                        content = await response.read()
+                    documents = await loop.run_in_executor(
+                        None, remote_reader.load_content, link, url_type, content
+                    )
                 except Exception as e:
-                    print(f"Error reading {url} at depth {depth_i}: {e}")
-                    continue
+                    print(f"Error reading {link}: {e}")
+                    return [], []
 
+                links = []
+                if url_type == "text/html":
+                    links = self._extract_links(link, content)
+                return documents, links
+
+            async with session:
+                return [
+                    (page.index, page.content)
+                    async for page in frontier.crawl([url], fetch)
+                ]
+
+        pages = run_sync(crawl())
+        print(f"Read {len(pages)} links up to depth {self.depth}.")
+
+        documents = []
+        for _, page_documents in sorted(pages, key=lambda page: page[0]):
+            documents.extend(page_documents)
         return documents
 
     @staticmethod
@@ -75,13 +114,17 @@ class RemoteDepthReader(BaseReader):
         return href.startswith("http")
 
     def get_links(self, url) -> List[str]:
+        """Get all links from a page."""
+        page = requests.get(url)
+        return self._extract_links(url, page.content)
+
+    def _extract_links(self, url: str, content: bytes) -> List[str]:
+        """Get all links from the content of a page."""
         from urllib.parse import urljoin, urlparse, urlunparse
 
         from bs4 import BeautifulSoup
 
-        """Get all links from a page."""
-        page = requests.get(url)
-        soup = BeautifulSoup(page.content, "html.parser")
+        soup = BeautifulSoup(content, "html.parser")
 
         links = soup.find_all("a")
         result = []
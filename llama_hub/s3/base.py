@@ -3,11 +3,13 @@
 A loader that fetches a file or iterates through a directory on AWS S3.
 
 """
+import json
 import tempfile
 import os
 import shutil
+from concurrent.futures import FIRST_COMPLETED, Future, ThreadPoolExecutor, wait
 from pathlib import Path
-from typing import Any, Callable, Dict, List, Optional, Union
+from typing import Any, Callable, Dict, Iterable, Iterator, List, Optional, Tuple, Union
 
 from llama_index import download_loader
 from llama_index.readers.base import BaseReader
@@ -33,6 +35,9 @@ class S3Reader(BaseReader):
         aws_session_token: Optional[str] = None,
         s3_endpoint_url: Optional[str] = "https://s3.amazonaws.com",
         custom_reader_path: Optional[str] = None,
+        num_workers: int = 8,
+        max_in_flight_bytes: int = 512 * 1024 * 1024,
+        etag_manifest_path: Optional[str] = None,
         **kwargs: Any,
     ) -> None:
         """Initialize S3 bucket and key, along with credentials if needed.
@@ -58,6 +63,14 @@ class S3Reader(BaseReader):
         aws_access_id (Optional[str]): provide AWS access key directly.
         aws_access_secret (Optional[str]): provide AWS access key directly.
         s3_endpoint_url (Optional[str]): provide S3 endpoint URL directly.
+        num_workers (int): Number of objects downloaded concurrently.
+        max_in_flight_bytes (int): No new download is started while the
+            objects being downloaded exceed this many bytes. With
+            `lazy_load_data`, this includes the objects waiting to be parsed,
+            while `load_data` downloads every object before parsing them.
+        etag_manifest_path (Optional[str]): Path of a JSON file recording the
+            ETag of every ingested object. When set, objects whose ETag did
+            not change since the previous load are skipped.
         """
         super().__init__(*args, **kwargs)
 
@@ -77,35 +90,35 @@ class S3Reader(BaseReader):
         self.aws_session_token = aws_session_token
         self.s3_endpoint_url = s3_endpoint_url
 
-    def load_s3_files_as_docs(self, temp_dir) -> List[Document]:
-        """Load file(s) from S3."""
+        self.num_workers = num_workers
+        self.max_in_flight_bytes = max_in_flight_bytes
+        self.etag_manifest_path = etag_manifest_path
+
+    def _get_client(self) -> Any:
         import boto3
 
-        s3 = boto3.resource("s3")
-        s3_client = boto3.client("s3")
         if self.aws_access_id:
             session = boto3.Session(
                 aws_access_key_id=self.aws_access_id,
                 aws_secret_access_key=self.aws_access_secret,
                 aws_session_token=self.aws_session_token,
             )
-            s3 = session.resource("s3", endpoint_url=self.s3_endpoint_url)
-            s3_client = session.client("s3", endpoint_url=self.s3_endpoint_url)
+            return session.client("s3", endpoint_url=self.s3_endpoint_url)
+        return boto3.client("s3")
 
+    def _list_objects(self, s3_client: Any) -> Iterator[Tuple[str, int, str]]:
+        """List the `(key, size, etag)` of the objects to load."""
         if self.key:
-            filename = Path(self.key).name
-            suffix = Path(self.key).suffix
-            filepath = f"{temp_dir}/{filename}"
-            s3_client.download_file(self.bucket, self.key, filepath)
-        else:
-            bucket = s3.Bucket(self.bucket)
-            for i, obj in enumerate(bucket.objects.filter(Prefix=self.prefix)):
-                if self.num_files_limit is not None and i > self.num_files_limit:
-                    break
-                filename = Path(obj.key).name
-                suffix = Path(obj.key).suffix
-
-                is_dir = obj.key.endswith("/")  # skip folders
+            head = s3_client.head_object(Bucket=self.bucket, Key=self.key)
+            yield self.key, head["ContentLength"], head["ETag"]
+            return
+
+        paginator = s3_client.get_paginator("list_objects_v2")
+        for page in paginator.paginate(Bucket=self.bucket, Prefix=self.prefix):
+            for obj in page.get("Contents", []):
+                suffix = Path(obj["Key"]).suffix
+
+                is_dir = obj["Key"].endswith("/")  # skip folders
                 is_bad_ext = (
                     self.required_exts is not None
                     and suffix not in self.required_exts  # skip other extentions
@@ -113,10 +126,87 @@ class S3Reader(BaseReader):
 
                 if is_dir or is_bad_ext:
                     continue
+                yield obj["Key"], obj["Size"], obj["ETag"]
+
+    def _load_manifest(self) -> Dict[str, str]:
+        if self.etag_manifest_path is None or not os.path.exists(
+            self.etag_manifest_path
+        ):
+            return {}
+        with open(self.etag_manifest_path) as f:
+            return json.load(f)
+
+    def _save_manifest(self, manifest: Dict[str, str]) -> None:
+        if self.etag_manifest_path is None:
+            return
+        tmp_path = f"{self.etag_manifest_path}.tmp"
+        with open(tmp_path, "w") as f:
+            json.dump(manifest, f)
+        os.replace(tmp_path, self.etag_manifest_path)
+
+    def _download_objects(
+        self, temp_dir: str, manifest: Dict[str, str]
+    ) -> Iterator[Tuple[str, str, str]]:
+        """Download objects concurrently, yielding `(key, path, etag)` as they land.
+
+        Objects are stored under `temp_dir` at the path of their key, so
+        objects with the same name in different prefixes do not collide.
+        Objects whose ETag is recorded in `manifest` are skipped. The
+        download of an object is only started while the objects being
+        downloaded or not yet consumed fit in `max_in_flight_bytes`.
+        """
+        s3_client = self._get_client()
+        temp_dir = os.path.abspath(temp_dir)
+
+        def objects() -> Iterator[Tuple[str, int, str, str]]:
+            count = 0
+            for key, size, etag in self._list_objects(s3_client):
+                if self.num_files_limit is not None and count >= self.num_files_limit:
+                    return
+                if manifest.get(f"{self.bucket}/{key}") == etag:
+                    continue
+                filepath = os.path.normpath(os.path.join(temp_dir, key))
+                if not filepath.startswith(temp_dir + os.sep):
+                    continue  # keys like "../x" would escape the temporary dir
+                count += 1
+                yield key, size, etag, filepath
 
-                filepath = f"{temp_dir}/{filename}"
-                s3_client.download_file(self.bucket, obj.key, filepath)
+        def download(key: str, filepath: str) -> None:
+            os.makedirs(os.path.dirname(filepath), exist_ok=True)
+            s3_client.download_file(self.bucket, key, filepath)
 
+        pending: Dict[Future, Tuple[str, int, str, str]] = {}
+        in_flight_bytes = 0
+        object_iter = objects()
+        next_object = next(object_iter, None)
+        with ThreadPoolExecutor(max_workers=self.num_workers) as executor:
+            try:
+                while pending or next_object is not None:
+                    while (
+                        next_object is not None
+                        and len(pending) < self.num_workers
+                        and (
+                            not pending
+                            or in_flight_bytes + next_object[1]
+                            <= self.max_in_flight_bytes
+                        )
+                    ):
+                        key, size, etag, filepath = next_object
+                        pending[executor.submit(download, key, filepath)] = next_object
+                        in_flight_bytes += size
+                        next_object = next(object_iter, None)
+
+                    done, _ = wait(pending, return_when=FIRST_COMPLETED)
+                    for future in done:
+                        key, size, etag, filepath = pending.pop(future)
+                        future.result()
+                        yield key, filepath, etag
+                        in_flight_bytes -= size
+            finally:
+                for future in pending:
+                    future.cancel()
+
+    def _get_directory_reader(self) -> Any:
         try:
             from llama_index import SimpleDirectoryReader
         except ImportError:
@@ -128,9 +218,21 @@ class S3Reader(BaseReader):
                 )
             else:
                 SimpleDirectoryReader = download_loader("SimpleDirectoryReader")
+        return SimpleDirectoryReader
+
+    def load_s3_files_as_docs(self, temp_dir) -> List[Document]:
+        """Load file(s) from S3, once all of them are downloaded to `temp_dir`."""
+        manifest = self._load_manifest()
+        for key, _, etag in self._download_objects(temp_dir, manifest):
+            manifest[f"{self.bucket}/{key}"] = etag
+
+        if not any(files for _, _, files in os.walk(temp_dir)):
+            return []
 
+        SimpleDirectoryReader = self._get_directory_reader()
         loader = SimpleDirectoryReader(
             temp_dir,
+            recursive=True,
             file_extractor=self.file_extractor,
             required_exts=self.required_exts,
             filename_as_id=self.filename_as_id,
@@ -138,7 +240,35 @@ class S3Reader(BaseReader):
             file_metadata=self.file_metadata,
         )
 
-        return loader.load_data()
+        documents = loader.load_data()
+        self._save_manifest(manifest)
+        return documents
+
+    def lazy_load_data(self) -> Iterable[Document]:
+        """Load file(s) from S3, parsing each object as soon as it is downloaded.
+
+        Each object is deleted from local disk once parsed, so at most
+        `max_in_flight_bytes` of objects are stored at once. The ETag
+        manifest is saved once all objects are consumed.
+        """
+        SimpleDirectoryReader = self._get_directory_reader()
+        manifest = self._load_manifest()
+        with tempfile.TemporaryDirectory() as temp_dir:
+            for key, filepath, etag in self._download_objects(temp_dir, manifest):
+                loader = SimpleDirectoryReader(
+                    input_files=[filepath],
+                    file_extractor=self.file_extractor,
+                    filename_as_id=self.filename_as_id,
+                    file_metadata=self.file_metadata,
+                )
+                documents = loader.load_data()
+                os.remove(filepath)
+                for doc in documents:
+                    doc.id_ = self.s3_endpoint_url + "_" + doc.id_
+                    yield doc
+                manifest[f"{self.bucket}/{key}"] = etag
+
+        self._save_manifest(manifest)
 
     def load_data(self, custom_temp_subdir: str = None) -> List[Document]:
         """Decide which directory to load files in - randomly generated directories under /tmp or a custom subdirectory under /tmp"""
@@ -2,22 +2,27 @@
 
 import importlib
 import json
+from functools import lru_cache
 from pathlib import Path
-from typing import Type
+from typing import Dict, Type
 
 from llama_index.readers.base import BaseReader
 
 LIBRARY_JSON_PATH = Path(__file__).parent / "library.json"
 
 
-def import_loader(reader_str: str) -> Type[BaseReader]:
-    """Import or download loader."""
-
-    # read library json file
+@lru_cache(maxsize=None)
+def _library_index() -> Dict[str, str]:
+    """Map each loader name to its directory id, reading library.json once."""
     with open(LIBRARY_JSON_PATH, "r") as json_file:
         json_dict = json.load(json_file)
 
-    dir_name = str(json_dict[reader_str]["id"])
+    return {name: str(entry["id"]) for name, entry in json_dict.items()}
+
+
+def import_loader(reader_str: str) -> Type[BaseReader]:
+    """Import or download loader."""
+    dir_name = _library_index()[reader_str]
 
     fmt_dir_name = dir_name.replace("/", ".")
     module = importlib.import_module("llama_hub." + fmt_dir_name + ".base")
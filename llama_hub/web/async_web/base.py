@@ -1,10 +1,24 @@
 import asyncio
 import logging
-from typing import List
+from concurrent.futures import Executor, ProcessPoolExecutor
+from typing import (
+    TYPE_CHECKING,
+    AsyncIterable,
+    AsyncIterator,
+    Dict,
+    Iterable,
+    List,
+    Optional,
+    Tuple,
+    Union,
+)
 
 from llama_index.readers.base import BaseReader
 from llama_index.readers.schema.base import Document
 
+if TYPE_CHECKING:
+    from llama_hub.web.http_cache import HTTPResponseCache
+
 logger = logging.getLogger(__name__)
 
 
@@ -19,6 +33,14 @@ class AsyncWebPageReader(BaseReader):
         limit (int): Maximum number of concurrent requests.
         dedupe (bool): to deduplicate urls if there is exact-match within given list
         fail_on_error (bool): if requested url does not return status code 200 the routine will raise an ValueError
+        limit_per_host (int): Maximum number of concurrent connections to the
+            same host, 0 for no limit. Connections are kept alive and reused.
+        max_in_flight_bytes (int): No new request is started while the pages
+            being downloaded or waiting to be consumed exceed this many bytes.
+        num_workers (int): Number of worker processes converting HTML to text.
+            With 0, pages are converted in a thread, off the event loop.
+        cache (Optional[HTTPResponseCache]): Cache of the responses, so
+            that unchanged pages are not downloaded again.
     """
 
     def __init__(
@@ -27,6 +49,10 @@ class AsyncWebPageReader(BaseReader):
         limit: int = 10,
         dedupe: bool = True,
         fail_on_error: bool = False,
+        limit_per_host: int = 0,
+        max_in_flight_bytes: int = 64 * 1024 * 1024,
+        num_workers: int = 0,
+        cache: Optional["HTTPResponseCache"] = None,
     ) -> None:
         """Initialize with parameters."""
 
@@ -46,71 +72,204 @@ class AsyncWebPageReader(BaseReader):
         self._html_to_text = html_to_text
         self._dedupe = dedupe
         self._fail_on_error = fail_on_error
+        self._limit_per_host = limit_per_host
+        self._max_in_flight_bytes = max_in_flight_bytes
+        self._num_workers = num_workers
+        self._cache = cache
 
-    def load_data(self, urls: List[str]) -> List[Document]:
-        """Load data from the input urls.
+    async def _aiter_urls(
+        self, urls: Union[Iterable[str], AsyncIterable[str]]
+    ) -> AsyncIterator[Tuple[int, str]]:
+        if isinstance(urls, AsyncIterable):
+            url_iter = urls
+        else:
 
-        Args:
-            urls (List[str]): List of URLs to scrape.
+            async def url_iter_from(urls: Iterable[str]) -> AsyncIterator[str]:
+                for url in urls:
+                    yield url
 
-        Returns:
-            List[Document]: List of documents.
+            url_iter = url_iter_from(urls)
 
-        """
-        if self._dedupe:
-            urls = list(dict.fromkeys(urls))
+        seen = set()
+        index = 0
+        async for url in url_iter:
+            if self._dedupe:
+                if url in seen:
+                    continue
+                seen.add(url)
+            yield index, url
+            index += 1
+
+    async def _afetch_documents(
+        self, urls: Union[Iterable[str], AsyncIterable[str]]
+    ) -> AsyncIterator[Tuple[int, str, Document]]:
+        """Fetch urls, yielding `(index, url, document)` as pages arrive.
 
+        At most `limit` requests run at once, and no new request is started
+        while more than `max_in_flight_bytes` of pages are buffered, so
+        arbitrarily long iterables of urls are read in bounded memory.
+        """
         import aiohttp
+        import html2text
+
+        if isinstance(urls, str):
+            raise ValueError("urls must be a list of strings.")
 
-        def chunked_http_client(limit: int):
-            semaphore = asyncio.Semaphore(limit)
+        loop = asyncio.get_running_loop()
+        executor: Optional[Executor] = None
+        if self._html_to_text and self._num_workers > 0:
+            executor = ProcessPoolExecutor(max_workers=self._num_workers)
+        in_flight_bytes = 0
 
-            async def http_get(url: str, session: aiohttp.ClientSession):
-                async with semaphore:
-                    async with session.get(url) as response:
-                        return response, await response.text()
+        async def fetch(
+            session: aiohttp.ClientSession, url: str
+        ) -> Tuple[int, str, str, int]:
+            nonlocal in_flight_bytes
+            if self._cache is not None:
+                cached = await self._cache.aget(url, session)
+                size = len(cached.body)
+                in_flight_bytes += size
+                status, source, raw_page = cached.status, cached.url, cached.text
+            else:
+                status, source, raw_page, size = await fetch_uncached(session, url)
 
-            return http_get
+            if status == 200 and self._html_to_text:
+                raw_page = await loop.run_in_executor(
+                    executor, html2text.html2text, raw_page
+                )
+            return status, source, raw_page, size
 
-        async def fetch_urls(urls: List[str]):
-            http_client = chunked_http_client(self._limit)
-            async with aiohttp.ClientSession() as session:
-                tasks = [http_client(url, session) for url in urls]
-                return await asyncio.gather(*tasks, return_exceptions=True)
+        async def fetch_uncached(
+            session: aiohttp.ClientSession, url: str
+        ) -> Tuple[int, str, str, int]:
+            nonlocal in_flight_bytes
+            async with session.get(url) as response:
+                chunks = []
+                async for chunk in response.content.iter_chunked(64 * 1024):
+                    chunks.append(chunk)
+                    in_flight_bytes += len(chunk)
+                size = sum(len(chunk) for chunk in chunks)
+                raw_page = b"".join(chunks).decode(
+                    response.charset or "utf-8", errors="replace"
+                )
+            return response.status, str(response.url), raw_page, size
 
-        if not isinstance(urls, list):
-            raise ValueError("urls must be a list of strings.")
+        connector = aiohttp.TCPConnector(
+            limit=self._limit, limit_per_host=self._limit_per_host
+        )
+        pending: Dict[asyncio.Future, Tuple[int, str]] = {}
+        url_iter = self._aiter_urls(urls)
+        exhausted = False
+        try:
+            async with aiohttp.ClientSession(connector=connector) as session:
+                while True:
+                    while (
+                        not exhausted
+                        and len(pending) < self._limit
+                        and in_flight_bytes < self._max_in_flight_bytes
+                    ):
+                        try:
+                            index, url = await url_iter.__anext__()
+                        except StopAsyncIteration:
+                            exhausted = True
+                            break
+                        task = asyncio.ensure_future(fetch(session, url))
+                        pending[task] = (index, url)
 
-        documents = []
-        responses = asyncio.run(fetch_urls(urls))
+                    if not pending:
+                        break
 
-        for i, response_tuple in enumerate(responses):
-            if not isinstance(response_tuple, tuple):
-                raise ValueError(f"One of the inputs is not a valid url: {urls[i]}")
+                    done, _ = await asyncio.wait(
+                        pending, return_when=asyncio.FIRST_COMPLETED
+                    )
+                    for task in done:
+                        index, url = pending.pop(task)
+                        if task.exception() is not None:
+                            raise ValueError(
+                                f"One of the inputs is not a valid url: {url}"
+                            ) from task.exception()
 
-            response, raw_page = response_tuple
+                        status, source, raw_page, size = task.result()
+                        try:
+                            if status != 200:
+                                logger.warning(f"error fetching page from {url}")
+                                logger.info(f"{url} returned status {status}")
 
-            if response.status != 200:
-                logger.warning(f"error fetching page from {urls[i]}")
-                logger.info(response)
+                                if self._fail_on_error:
+                                    raise ValueError(
+                                        f"error fetching page from {url}. server"
+                                        f" returned status: {status} and response"
+                                        f" {raw_page}"
+                                    )
 
-                if self._fail_on_error:
-                    raise ValueError(
-                        f"error fetching page from {urls[i]}. server returned status:"
-                        f" {response.status} and response {raw_page}"
-                    )
+                                continue
 
-                continue
+                            yield index, url, Document(
+                                text=raw_page, extra_info={"Source": source}
+                            )
+                        finally:
+                            in_flight_bytes -= size
+        finally:
+            for task in pending:
+                task.cancel()
+            if executor is not None:
+                executor.shutdown()
 
-            if self._html_to_text:
-                import html2text
+    async def alazy_load_data(
+        self, urls: Union[Iterable[str], AsyncIterable[str]]
+    ) -> AsyncIterator[Document]:
+        """Lazily load data from the input urls.
 
-                response_text = html2text.html2text(raw_page)
-            else:
-                response_text = raw_page
+        Documents are yielded in the order the pages arrive, not in the
+        order of `urls`.
 
-            documents.append(
-                Document(text=response_text, extra_info={"Source": str(response.url)})
-            )
+        Args:
+            urls (Union[Iterable[str], AsyncIterable[str]]): URLs to scrape,
+                e.g. a generator of the urls of a sitemap. Urls of an async
+                iterable are fetched while it produces more urls.
+
+        Returns:
+            AsyncIterator[Document]: Documents, one per page.
+
+        """
+        async for _, _, document in self._afetch_documents(urls):
+            yield document
+
+    async def alazy_load_data_with_urls(
+        self, urls: Union[Iterable[str], AsyncIterable[str]]
+    ) -> AsyncIterator[Tuple[int, str, Document]]:
+        """Lazily load data, telling which input url each document comes from.
+
+        The `Source` of a document is the url of the response, which differs
+        from the input url after a redirect.
+
+        Args:
+            urls (Union[Iterable[str], AsyncIterable[str]]): URLs to scrape.
+
+        Returns:
+            AsyncIterator[Tuple[int, str, Document]]: `(index, url, document)`
+                as pages arrive, where `url` is the input url and `index` its
+                position among the input urls, after deduplication.
+
+        """
+        async for result in self._afetch_documents(urls):
+            yield result
+
+    def load_data(self, urls: List[str]) -> List[Document]:
+        """Load data from the input urls.
+
+        Args:
+            urls (List[str]): List of URLs to scrape.
+
+        Returns:
+            List[Document]: List of documents.
+
+        """
+        if not isinstance(urls, list):
+            raise ValueError("urls must be a list of strings.")
+
+        async def fetch_urls() -> List[Tuple[int, str, Document]]:
+            return [result async for result in self._afetch_documents(urls)]
 
-        return documents
+        results = asyncio.run(fetch_urls())
+        return [document for _, _, document in sorted(results, key=lambda r: r[0])]
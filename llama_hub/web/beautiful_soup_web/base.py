@@ -1,14 +1,64 @@
 """Beautiful Soup Web scraper."""
 
 import logging
-from typing import Any, Callable, Dict, List, Optional, Tuple
+import threading
+from concurrent.futures import Executor, Future, ProcessPoolExecutor, ThreadPoolExecutor
+from typing import TYPE_CHECKING, Any, Callable, Dict, List, Optional, Tuple
 from urllib.parse import urljoin
 
 from llama_index.readers.base import BaseReader
 from llama_index.readers.schema.base import Document
 
+if TYPE_CHECKING:
+    from llama_hub.web.http_cache import HTTPResponseCache
+
 logger = logging.getLogger(__name__)
 
+# number of sub-pages fetched concurrently by the documentation extractors
+SUBPAGE_WORKERS = 8
+
+
+class _SessionPerThread:
+    """Gives each thread its own `requests.Session`, all closed on exit.
+
+    Sessions are not thread-safe, so the threads of a pool do not share one,
+    and each thread keeps its connections alive across its requests.
+    """
+
+    def __init__(self) -> None:
+        """Initialize with parameters."""
+        self._local = threading.local()
+        self._sessions: List[Any] = []
+
+    def get(self) -> Any:
+        """Get the session of the current thread."""
+        session = getattr(self._local, "session", None)
+        if session is None:
+            import requests
+
+            session = self._local.session = requests.Session()
+            self._sessions.append(session)
+        return session
+
+    def close(self) -> None:
+        """Close the sessions of all threads."""
+        for session in self._sessions:
+            session.close()
+
+    def __enter__(self) -> "_SessionPerThread":
+        return self
+
+    def __exit__(self, *args: Any) -> None:
+        self.close()
+
+
+def _fetch_subpages(links: List[str]) -> List[str]:
+    """Fetch the text of sub-pages concurrently, in the order of `links`."""
+    with _SessionPerThread() as sessions, ThreadPoolExecutor(
+        max_workers=SUBPAGE_WORKERS
+    ) as executor:
+        return list(executor.map(lambda link: sessions.get().get(link).text, links))
+
 
 def _substack_reader(soup: Any, **kwargs) -> Tuple[str, Dict[str, Any]]:
     """Extract text from Substack blog post."""
@@ -23,7 +73,6 @@ def _substack_reader(soup: Any, **kwargs) -> Tuple[str, Dict[str, Any]]:
 
 def _readthedocs_reader(soup: Any, url: str, **kwargs) -> Tuple[str, Dict[str, Any]]:
     """Extract text from a ReadTheDocs documentation site"""
-    import requests
     from bs4 import BeautifulSoup
 
     links = soup.find_all("a", {"class": "reference internal"})
@@ -36,9 +85,9 @@ def _readthedocs_reader(soup: Any, url: str, **kwargs) -> Tuple[str, Dict[str, A
             rtd_links[i] = urljoin(url, rtd_links[i])
 
     texts = []
-    for doc_link in rtd_links:
-        page_link = requests.get(doc_link)
-        soup = BeautifulSoup(page_link.text, "html.parser")
+    parser = soup.builder.NAME
+    for page_text in _fetch_subpages(rtd_links):
+        soup = BeautifulSoup(page_text, parser)
         try:
             text = soup.find(attrs={"role": "main"}).get_text()
 
@@ -53,7 +102,6 @@ def _readmedocs_reader(
     soup: Any, url: str, include_url_in_text: bool = True
 ) -> Tuple[str, Dict[str, Any]]:
     """Extract text from a ReadMe documentation site"""
-    import requests
     from bs4 import BeautifulSoup
 
     links = soup.find_all("a")
@@ -64,9 +112,9 @@ def _readmedocs_reader(
             docs_links[i] = urljoin(url, docs_links[i])
 
     texts = []
-    for doc_link in docs_links:
-        page_link = requests.get(doc_link)
-        soup = BeautifulSoup(page_link.text, "html.parser")
+    parser = soup.builder.NAME
+    for doc_link, page_text in zip(docs_links, _fetch_subpages(docs_links)):
+        soup = BeautifulSoup(page_text, parser)
         try:
             text = ""
             for element in soup.find_all("article", {"id": "content"}):
@@ -95,7 +143,6 @@ def _gitbook_reader(
     soup: Any, url: str, include_url_in_text: bool = True
 ) -> Tuple[str, Dict[str, Any]]:
     """Extract text from a ReadMe documentation site"""
-    import requests
     from bs4 import BeautifulSoup
 
     links = soup.find_all("a")
@@ -106,9 +153,9 @@ def _gitbook_reader(
             docs_links[i] = urljoin(url, docs_links[i])
 
     texts = []
-    for doc_link in docs_links:
-        page_link = requests.get(doc_link)
-        soup = BeautifulSoup(page_link.text, "html.parser")
+    parser = soup.builder.NAME
+    for doc_link, page_text in zip(docs_links, _fetch_subpages(docs_links)):
+        soup = BeautifulSoup(page_text, parser)
         try:
             text = ""
             text = soup.find("main")
@@ -131,6 +178,22 @@ DEFAULT_WEBSITE_EXTRACTOR: Dict[
 }
 
 
+def _extract_page(
+    content: bytes,
+    url: str,
+    parser: str,
+    extractor: Optional[Callable] = None,
+    include_url_in_text: Optional[bool] = True,
+) -> Tuple[str, Dict[str, Any]]:
+    """Parse a page and extract its text, in a worker process if one is used."""
+    from bs4 import BeautifulSoup
+
+    soup = BeautifulSoup(content, parser)
+    if extractor is None:
+        return soup.getText(), {}
+    return extractor(soup=soup, url=url, include_url_in_text=include_url_in_text)
+
+
 class BeautifulSoupWebReader(BaseReader):
     """BeautifulSoup web page reader.
 
@@ -141,14 +204,40 @@ class BeautifulSoupWebReader(BaseReader):
         website_extractor (Optional[Dict[str, Callable]]): A mapping of website
             hostname (e.g. google.com) to a function that specifies how to
             extract text from the BeautifulSoup obj. See DEFAULT_WEBSITE_EXTRACTOR.
+        parser (str): BeautifulSoup parser backend, `html.parser` or the
+            faster `lxml` (requires the `lxml` package).
+        num_workers (int): Number of pages fetched concurrently, each
+            worker thread keeping its connections alive.
+        num_parse_workers (int): Number of processes parsing pages and
+            running the website extractors. With 0, pages are parsed in the
+            calling process. Extractors must be module level functions to be
+            run in worker processes.
+        cache (Optional[HTTPResponseCache]): Cache of the page responses, so
+            that unchanged pages are not downloaded again.
     """
 
     def __init__(
         self,
         website_extractor: Optional[Dict[str, Callable]] = None,
+        parser: str = "html.parser",
+        num_workers: int = 8,
+        num_parse_workers: int = 0,
+        cache: Optional["HTTPResponseCache"] = None,
     ) -> None:
         """Initialize with parameters."""
+        if parser == "lxml":
+            try:
+                import lxml  # noqa: F401
+            except ImportError:
+                raise ImportError(
+                    "`lxml` package not found, please run `pip install lxml`"
+                )
+
         self.website_extractor = website_extractor or DEFAULT_WEBSITE_EXTRACTOR
+        self.parser = parser
+        self.num_workers = num_workers
+        self.num_parse_workers = num_parse_workers
+        self.cache = cache
 
     def load_data(
         self,
@@ -170,31 +259,49 @@ class BeautifulSoupWebReader(BaseReader):
         """
         from urllib.parse import urlparse
 
-        import requests
-        from bs4 import BeautifulSoup
+        sessions = _SessionPerThread()
 
-        documents = []
-        for url in urls:
+        def fetch(url: str) -> bytes:
             try:
-                page = requests.get(url)
+                if self.cache is not None:
+                    return self.cache.get(url, session=sessions.get()).body
+                return sessions.get().get(url).content
             except Exception:
                 raise ValueError(f"One of the inputs is not a valid url: {url}")
 
-            hostname = custom_hostname or urlparse(url).hostname or ""
+        parse_executor: Optional[Executor] = None
+        if self.num_parse_workers > 0:
+            parse_executor = ProcessPoolExecutor(max_workers=self.num_parse_workers)
 
-            soup = BeautifulSoup(page.content, "html.parser")
-
-            data = ""
-            extra_info = {"URL": url}
-            if hostname in self.website_extractor:
-                data, metadata = self.website_extractor[hostname](
-                    soup=soup, url=url, include_url_in_text=include_url_in_text
-                )
+        results: List[Future] = []
+        try:
+            with ThreadPoolExecutor(max_workers=self.num_workers) as fetch_executor:
+                # pages are parsed as soon as they are fetched, in url order
+                for url, content in zip(urls, fetch_executor.map(fetch, urls)):
+                    hostname = custom_hostname or urlparse(url).hostname or ""
+                    args = (
+                        content,
+                        url,
+                        self.parser,
+                        self.website_extractor.get(hostname),
+                        include_url_in_text,
+                    )
+                    if parse_executor is not None:
+                        results.append(parse_executor.submit(_extract_page, *args))
+                    else:
+                        result: Future = Future()
+                        result.set_result(_extract_page(*args))
+                        results.append(result)
+
+            documents = []
+            for url, result in zip(urls, results):
+                data, metadata = result.result()
+                extra_info = {"URL": url}
                 extra_info.update(metadata)
-
-            else:
-                data = soup.getText()
-
-            documents.append(Document(text=data, extra_info=extra_info))
+                documents.append(Document(text=data, extra_info=extra_info))
+        finally:
+            sessions.close()
+            if parse_executor is not None:
+                parse_executor.shutdown()
 
         return documents
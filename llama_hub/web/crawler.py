@@ -0,0 +1,280 @@
+"""Crawl frontier shared by the web crawling readers.
+
+The frontier keeps the queue of urls to visit in breadth-first order,
+deduplicates normalized urls, limits concurrency overall and per domain,
+spaces requests to the same domain and honors robots.txt. Readers only
+provide an async `fetch` callable returning the content of a page and the
+links found in the same response, so every url is fetched once.
+"""
+
+import asyncio
+import heapq
+import logging
+import time
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import dataclass
+from typing import (
+    Any,
+    AsyncIterator,
+    Awaitable,
+    Callable,
+    Coroutine,
+    Dict,
+    Generic,
+    Iterable,
+    List,
+    Optional,
+    Set,
+    Tuple,
+    TypeVar,
+)
+from urllib.parse import urljoin, urlsplit, urlunsplit
+from urllib.robotparser import RobotFileParser
+
+logger = logging.getLogger(__name__)
+
+T = TypeVar("T")
+
+_DEFAULT_PORTS = {"http": 80, "https": 443}
+
+
+def normalize_url(
+    url: str, base_url: Optional[str] = None, strip_query: bool = False
+) -> str:
+    """Normalize a url, so that equivalent urls compare equal.
+
+    Relative urls are resolved against `base_url`, the fragment is dropped,
+    the scheme and host are lowercased, default ports are removed and an
+    empty path becomes `/`.
+
+    Args:
+        url (str): The url to normalize.
+        base_url (Optional[str]): Url of the page the url was found on.
+        strip_query (bool): Whether to also drop the query string.
+
+    Returns:
+        str: The normalized url.
+
+    Raises:
+        ValueError: If the url has an invalid port.
+    """
+    if base_url is not None:
+        url = urljoin(base_url, url)
+    parts = urlsplit(url.strip())
+    scheme = parts.scheme.lower()
+    netloc = parts.hostname or ""
+    if ":" in netloc:
+        netloc = f"[{netloc}]"
+    if parts.port is not None and parts.port != _DEFAULT_PORTS.get(scheme):
+        netloc = f"{netloc}:{parts.port}"
+    query = "" if strip_query else parts.query
+    return urlunsplit((scheme, netloc, parts.path or "/", query, ""))
+
+
+def run_sync(coro: Coroutine[Any, Any, T]) -> T:
+    """Run a coroutine to completion from sync code.
+
+    Inside a running event loop (e.g. in a notebook), the coroutine runs in
+    a new event loop in a worker thread, and the caller blocks until it is
+    done.
+    """
+    try:
+        asyncio.get_running_loop()
+    except RuntimeError:
+        return asyncio.run(coro)
+    with ThreadPoolExecutor(max_workers=1) as executor:
+        return executor.submit(asyncio.run, coro).result()
+
+
+def _read_robots(robots_url: str) -> RobotFileParser:
+    parser = RobotFileParser(robots_url)
+    try:
+        parser.read()
+    except Exception as e:
+        logger.info(f"Could not read {robots_url}: {e}, allowing all urls.")
+        parser.allow_all = True
+    return parser
+
+
+@dataclass
+class CrawledPage(Generic[T]):
+    """A page visited by the crawl frontier.
+
+    Attributes:
+        url (str): Normalized url of the page.
+        depth (int): Number of links followed from a start url.
+        index (int): Order in which the url was discovered, so that
+            breadth-first order can be restored from out of order results.
+        content (T): Content returned by the `fetch` callable.
+    """
+
+    url: str
+    depth: int
+    index: int
+    content: T
+
+
+class CrawlFrontier:
+    """Breadth-first crawl frontier.
+
+    Args:
+        max_depth (int): Maximum number of links followed from a start url.
+        allow_url (Optional[Callable[[str], bool]]): Filter on the normalized
+            urls of discovered links. Start urls are always visited.
+        max_concurrency (int): Maximum number of pages fetched at once.
+        max_per_domain (int): Maximum number of pages of the same domain
+            fetched at once.
+        delay (float): Minimum seconds between two requests to the same
+            domain. A larger `Crawl-delay` in robots.txt takes precedence.
+        respect_robots (bool): Whether to skip urls disallowed by robots.txt.
+        user_agent (str): User agent matched against robots.txt rules.
+        strip_query (bool): Whether query strings are dropped from urls.
+    """
+
+    def __init__(
+        self,
+        max_depth: int = 1,
+        allow_url: Optional[Callable[[str], bool]] = None,
+        max_concurrency: int = 10,
+        max_per_domain: int = 2,
+        delay: float = 0.0,
+        respect_robots: bool = True,
+        user_agent: str = "*",
+        strip_query: bool = False,
+    ) -> None:
+        """Initialize with parameters."""
+        self.max_depth = max_depth
+        self.allow_url = allow_url
+        self.max_concurrency = max_concurrency
+        self.max_per_domain = max_per_domain
+        self.delay = delay
+        self.respect_robots = respect_robots
+        self.user_agent = user_agent
+        self.strip_query = strip_query
+
+        self._queue: List[Tuple[int, int, str]] = []
+        self._seen: Set[str] = set()
+        self._robots: Dict[str, "asyncio.Future[RobotFileParser]"] = {}
+        self._domain_semaphores: Dict[str, asyncio.Semaphore] = {}
+        self._next_request_time: Dict[str, float] = {}
+
+    def __len__(self) -> int:
+        """Number of urls waiting to be visited."""
+        return len(self._queue)
+
+    def add(self, url: str, depth: int = 0, base_url: Optional[str] = None) -> bool:
+        """Queue a url, unless it was already seen.
+
+        Args:
+            url (str): The url to queue, relative to `base_url` if given.
+            depth (int): Number of links followed to reach the url.
+            base_url (Optional[str]): Url of the page the url was found on.
+
+        Returns:
+            bool: Whether the url was queued.
+        """
+        try:
+            url = normalize_url(url, base_url, strip_query=self.strip_query)
+        except ValueError:
+            return False
+        if not url.startswith(("http://", "https://")) or url in self._seen:
+            return False
+
+        heapq.heappush(self._queue, (depth, len(self._seen), url))
+        self._seen.add(url)
+        return True
+
+    async def _get_robots(self, url: str) -> RobotFileParser:
+        parts = urlsplit(url)
+        origin = f"{parts.scheme}://{parts.netloc}"
+        if origin not in self._robots:
+            loop = asyncio.get_running_loop()
+            self._robots[origin] = loop.run_in_executor(
+                None, _read_robots, f"{origin}/robots.txt"
+            )
+        return await self._robots[origin]
+
+    async def _wait_for_domain(self, domain: str, delay: float) -> None:
+        """Wait until `delay` seconds passed since the last request to a domain."""
+        now = time.monotonic()
+        start = max(now, self._next_request_time.get(domain, now))
+        self._next_request_time[domain] = start + delay
+        if start > now:
+            await asyncio.sleep(start - now)
+
+    async def _visit(
+        self, url: str, fetch: Callable[[str], Awaitable[Tuple[T, Iterable[str]]]]
+    ) -> Optional[Tuple[T, Iterable[str]]]:
+        delay = self.delay
+        if self.respect_robots:
+            robots = await self._get_robots(url)
+            if not robots.can_fetch(self.user_agent, url):
+                logger.info(f"Skipping {url}, disallowed by robots.txt.")
+                return None
+            delay = max(delay, float(robots.crawl_delay(self.user_agent) or 0))
+
+        domain = urlsplit(url).netloc
+        if domain not in self._domain_semaphores:
+            self._domain_semaphores[domain] = asyncio.Semaphore(self.max_per_domain)
+        async with self._domain_semaphores[domain]:
+            await self._wait_for_domain(domain, delay)
+            return await fetch(url)
+
+    async def crawl(
+        self,
+        start_urls: Iterable[str],
+        fetch: Callable[[str], Awaitable[Tuple[T, Iterable[str]]]],
+    ) -> AsyncIterator[CrawledPage[T]]:
+        """Crawl from the start urls, yielding pages as they are fetched.
+
+        Args:
+            start_urls (Iterable[str]): Urls to start crawling from.
+            fetch (Callable[[str], Awaitable[Tuple[T, Iterable[str]]]]): Coroutine
+                function returning the content of a page and the links it
+                contains. Exceptions raised by `fetch` stop the crawl.
+
+        Returns:
+            AsyncIterator[CrawledPage[T]]: The visited pages, in the order
+                they are fetched.
+        """
+        for url in start_urls:
+            self.add(url)
+
+        pending: Dict[asyncio.Future, Tuple[int, int, str]] = {}
+        try:
+            while True:
+                while self._queue and len(pending) < self.max_concurrency:
+                    depth, index, url = heapq.heappop(self._queue)
+                    task = asyncio.ensure_future(self._visit(url, fetch))
+                    pending[task] = (depth, index, url)
+
+                if not pending:
+                    break
+
+                done, _ = await asyncio.wait(
+                    pending, return_when=asyncio.FIRST_COMPLETED
+                )
+                for task in sorted(done, key=lambda task: pending[task][1]):
+                    depth, index, url = pending.pop(task)
+                    result = task.result()
+                    if result is None:
+                        continue
+
+                    content, links = result
+                    if depth < self.max_depth:
+                        for link in links:
+                            try:
+                                link = normalize_url(
+                                    link, url, strip_query=self.strip_query
+                                )
+                            except ValueError:
+                                continue
+                            if self.allow_url is None or self.allow_url(link):
+                                self.add(link, depth + 1)
+
+                    yield CrawledPage(
+                        url=url, depth=depth, index=index, content=content
+                    )
+        finally:
+            for task in pending:
+                task.cancel()
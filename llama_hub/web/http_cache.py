@@ -0,0 +1,330 @@
+"""On-disk HTTP response cache shared by the web readers.
+
+Response bodies are stored once per content hash, and an sqlite index maps
+urls to their body, headers and validators. Entries younger than the TTL
+are served without network access; older ones are revalidated with
+`If-None-Match` / `If-Modified-Since`, so unchanged pages cost a 304.
+The least recently used entries are evicted when the cache exceeds its
+size bound.
+"""
+
+import asyncio
+import hashlib
+import json
+import os
+import sqlite3
+import threading
+import time
+from dataclasses import dataclass
+from email.message import Message
+from typing import Any, Dict, Optional, Tuple
+
+# headers describing the transfer, not the (already decoded) body
+_DROPPED_HEADERS = {"content-encoding", "content-length", "transfer-encoding"}
+
+
+@dataclass
+class CachedResponse:
+    """A response served by `HTTPResponseCache`.
+
+    Attributes:
+        url (str): Final url of the response, after redirects.
+        status (int): HTTP status code.
+        headers (Dict[str, str]): Response headers, with lowercase names.
+        body (bytes): Decoded response body.
+        from_cache (bool): Whether the body was served from the cache.
+    """
+
+    url: str
+    status: int
+    headers: Dict[str, str]
+    body: bytes
+    from_cache: bool = False
+
+    @property
+    def encoding(self) -> str:
+        message = Message()
+        message["content-type"] = self.headers.get("content-type", "")
+        return str(message.get_param("charset") or "utf-8")
+
+    @property
+    def text(self) -> str:
+        return self.body.decode(self.encoding, errors="replace")
+
+
+class HTTPResponseCache:
+    """Pluggable on-disk HTTP response cache.
+
+    Args:
+        cache_dir (str): Directory of the cache, created if needed.
+        ttl (Optional[float]): Seconds during which a cached response is
+            served without contacting the server. After that, or if None,
+            responses are revalidated with their ETag / Last-Modified.
+        max_size_bytes (Optional[int]): Total size of the cached bodies above
+            which the least recently used entries are evicted.
+
+    Examples:
+        >>> cache = HTTPResponseCache("./.http_cache", ttl=3600)
+        >>> loader = SimpleWebPageReader(cache=cache)
+    """
+
+    def __init__(
+        self,
+        cache_dir: str,
+        ttl: Optional[float] = None,
+        max_size_bytes: Optional[int] = None,
+    ) -> None:
+        """Initialize with parameters."""
+        self.cache_dir = cache_dir
+        self.ttl = ttl
+        self.max_size_bytes = max_size_bytes
+
+        os.makedirs(os.path.join(cache_dir, "bodies"), exist_ok=True)
+        self._lock = threading.Lock()
+        self._db = sqlite3.connect(
+            os.path.join(cache_dir, "index.sqlite"), check_same_thread=False
+        )
+        with self._db:
+            self._db.execute(
+                "CREATE TABLE IF NOT EXISTS responses ("
+                " url TEXT PRIMARY KEY, final_url TEXT, status INTEGER,"
+                " headers TEXT, body_hash TEXT, size INTEGER,"
+                " fetched_at REAL, accessed_at REAL)"
+            )
+
+    def _body_path(self, body_hash: str) -> str:
+        return os.path.join(self.cache_dir, "bodies", body_hash[:2], body_hash)
+
+    def lookup(self, url: str) -> Optional[CachedResponse]:
+        """Get the cached response of a url, without network access."""
+        entry = self._lookup(url)
+        return None if entry is None else entry[0]
+
+    def _lookup(self, url: str) -> Optional[Tuple[CachedResponse, float]]:
+        with self._lock:
+            row = self._db.execute(
+                "SELECT final_url, status, headers, body_hash, fetched_at"
+                " FROM responses WHERE url = ?",
+                (url,),
+            ).fetchone()
+        if row is None:
+            return None
+
+        final_url, status, headers, body_hash, fetched_at = row
+        try:
+            with open(self._body_path(body_hash), "rb") as f:
+                body = f.read()
+        except FileNotFoundError:
+            self.delete(url)
+            return None
+        response = CachedResponse(
+            url=final_url,
+            status=status,
+            headers=json.loads(headers),
+            body=body,
+            from_cache=True,
+        )
+        return response, fetched_at
+
+    def store(
+        self, url: str, final_url: str, status: int, headers: Any, body: bytes
+    ) -> CachedResponse:
+        """Store a response, returning it as a `CachedResponse`."""
+        headers = {
+            name.lower(): value
+            for name, value in headers.items()
+            if name.lower() not in _DROPPED_HEADERS
+        }
+        body_hash = hashlib.sha256(body).hexdigest()
+        path = self._body_path(body_hash)
+        if not os.path.exists(path):
+            os.makedirs(os.path.dirname(path), exist_ok=True)
+            tmp_path = f"{path}.{threading.get_ident()}.tmp"
+            with open(tmp_path, "wb") as f:
+                f.write(body)
+            os.replace(tmp_path, path)
+
+        now = time.time()
+        with self._lock, self._db:
+            previous = self._db.execute(
+                "SELECT body_hash FROM responses WHERE url = ?", (url,)
+            ).fetchone()
+            self._db.execute(
+                "INSERT OR REPLACE INTO responses VALUES (?, ?, ?, ?, ?, ?, ?, ?)",
+                (
+                    url,
+                    final_url,
+                    status,
+                    json.dumps(headers),
+                    body_hash,
+                    len(body),
+                    now,
+                    now,
+                ),
+            )
+            if previous is not None and previous[0] != body_hash:
+                self._delete_unreferenced_body(previous[0])
+        self._evict()
+        return CachedResponse(url=final_url, status=status, headers=headers, body=body)
+
+    def _touch(self, url: str, revalidated: bool) -> None:
+        now = time.time()
+        with self._lock, self._db:
+            if revalidated:
+                self._db.execute(
+                    "UPDATE responses SET fetched_at = ?, accessed_at = ?"
+                    " WHERE url = ?",
+                    (now, now, url),
+                )
+            else:
+                self._db.execute(
+                    "UPDATE responses SET accessed_at = ? WHERE url = ?", (now, url)
+                )
+
+    def delete(self, url: str) -> None:
+        """Remove the cached response of a url."""
+        with self._lock, self._db:
+            row = self._db.execute(
+                "SELECT body_hash FROM responses WHERE url = ?", (url,)
+            ).fetchone()
+            self._db.execute("DELETE FROM responses WHERE url = ?", (url,))
+            if row is not None:
+                self._delete_unreferenced_body(row[0])
+
+    def _delete_unreferenced_body(self, body_hash: str) -> None:
+        (references,) = self._db.execute(
+            "SELECT COUNT(*) FROM responses WHERE body_hash = ?", (body_hash,)
+        ).fetchone()
+        if references == 0:
+            try:
+                os.remove(self._body_path(body_hash))
+            except FileNotFoundError:
+                pass
+
+    def _evict(self) -> None:
+        """Evict the least recently used entries above `max_size_bytes`."""
+        if self.max_size_bytes is None:
+            return
+        with self._lock, self._db:
+            (total,) = self._db.execute(
+                "SELECT COALESCE(SUM(size), 0) FROM responses"
+            ).fetchone()
+            if total <= self.max_size_bytes:
+                return
+            rows = self._db.execute(
+                "SELECT url, body_hash, size FROM responses ORDER BY accessed_at"
+            ).fetchall()
+            for url, body_hash, size in rows:
+                if total <= self.max_size_bytes:
+                    break
+                self._db.execute("DELETE FROM responses WHERE url = ?", (url,))
+                self._delete_unreferenced_body(body_hash)
+                total -= size
+
+    def _is_fresh(self, fetched_at: float) -> bool:
+        return self.ttl is not None and time.time() - fetched_at < self.ttl
+
+    @staticmethod
+    def _conditional_headers(response: CachedResponse) -> Dict[str, str]:
+        headers = {}
+        if "etag" in response.headers:
+            headers["If-None-Match"] = response.headers["etag"]
+        if "last-modified" in response.headers:
+            headers["If-Modified-Since"] = response.headers["last-modified"]
+        return headers
+
+    def _cached_or_validate(
+        self, url: str
+    ) -> Tuple[Optional[CachedResponse], Optional[CachedResponse], Dict[str, str]]:
+        """Get the fresh cached response, or the stale one and its validators."""
+        entry = self._lookup(url)
+        if entry is None:
+            return None, None, {}
+        cached, fetched_at = entry
+        if self._is_fresh(fetched_at):
+            self._touch(url, revalidated=False)
+            return cached, None, {}
+        return None, cached, self._conditional_headers(cached)
+
+    def get(
+        self, url: str, session: Optional[Any] = None, **kwargs: Any
+    ) -> CachedResponse:
+        """Get a url with `requests`, through the cache.
+
+        Only successful responses are cached.
+
+        Args:
+            url (str): The url to get.
+            session (Optional[requests.Session]): Session to send requests with.
+            **kwargs: Passed to `session.get`.
+
+        Returns:
+            CachedResponse: The response.
+        """
+        import requests
+
+        fresh, stale, headers = self._cached_or_validate(url)
+        if fresh is not None:
+            return fresh
+
+        headers.update(kwargs.pop("headers", None) or {})
+        response = (session or requests).get(url, headers=headers, **kwargs)
+        if response.status_code == 304 and stale is not None:
+            self._touch(url, revalidated=True)
+            return stale
+        if response.status_code != 200:
+            return CachedResponse(
+                url=response.url,
+                status=response.status_code,
+                headers={k.lower(): v for k, v in response.headers.items()},
+                body=response.content,
+            )
+        return self.store(
+            url, response.url, response.status_code, response.headers, response.content
+        )
+
+    async def aget(self, url: str, session: Any, **kwargs: Any) -> CachedResponse:
+        """Get a url with an `aiohttp.ClientSession`, through the cache.
+
+        Only successful responses are cached.
+
+        Args:
+            url (str): The url to get.
+            session (aiohttp.ClientSession): Session to send requests with.
+            **kwargs: Passed to `session.get`.
+
+        Returns:
+            CachedResponse: The response.
+        """
+        # sqlite and file accesses block, so keep them off the event loop
+        loop = asyncio.get_running_loop()
+        fresh, stale, headers = await loop.run_in_executor(
+            None, self._cached_or_validate, url
+        )
+        if fresh is not None:
+            return fresh
+
+        headers.update(kwargs.pop("headers", None) or {})
+        async with session.get(url, headers=headers, **kwargs) as response:
+            status, final_url = response.status, str(response.url)
+            response_headers = dict(response.headers)
+            if status != 304 or stale is None:
+                body = await response.read()
+
+        if status == 304 and stale is not None:
+            await loop.run_in_executor(None, self._touch, url, True)
+            return stale
+        if status != 200:
+            return CachedResponse(
+                url=final_url,
+                status=status,
+                headers={k.lower(): v for k, v in response_headers.items()},
+                body=body,
+            )
+        return await loop.run_in_executor(
+            None, self.store, url, final_url, status, response_headers, body
+        )
+
+    def close(self) -> None:
+        """Close the index of the cache."""
+        self._db.close()
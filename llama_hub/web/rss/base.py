@@ -1,10 +1,16 @@
 """Rss reader."""
 
-from typing import List
+import logging
+from typing import TYPE_CHECKING, List, Optional
 
 from llama_index.readers.base import BaseReader
 from llama_index.readers.schema.base import Document
 
+if TYPE_CHECKING:
+    from llama_hub.web.http_cache import HTTPResponseCache
+
+logger = logging.getLogger(__name__)
+
 
 class RssReader(BaseReader):
     """RSS reader.
@@ -13,12 +19,16 @@ class RssReader(BaseReader):
 
     """
 
-    def __init__(self, html_to_text: bool = False) -> None:
+    def __init__(
+        self, html_to_text: bool = False, cache: Optional["HTTPResponseCache"] = None
+    ) -> None:
         """Initialize with parameters.
 
         Args:
             html_to_text (bool): Whether to convert HTML to text.
                 Requires `html2text` package.
+            cache (Optional[HTTPResponseCache]): Cache of the responses, so
+                that unchanged feeds are not downloaded again.
 
         """
         try:
@@ -36,6 +46,7 @@ class RssReader(BaseReader):
                     "`html2text` package not found, please run `pip install html2text`"
                 )
         self._html_to_text = html_to_text
+        self._cache = cache
 
     def load_data(self, urls: List[str]) -> List[Document]:
         """Load data from RSS feeds.
@@ -55,7 +66,14 @@ class RssReader(BaseReader):
         documents = []
 
         for url in urls:
-            parsed = feedparser.parse(url)
+            if self._cache is not None:
+                response = self._cache.get(url)
+                if not 200 <= response.status < 300:
+                    logger.warning(f"{url} returned status {response.status}")
+                    continue
+                parsed = feedparser.parse(response.body)
+            else:
+                parsed = feedparser.parse(url)
             for entry in parsed.entries:
                 if "content" in entry:
                     data = entry.content[0].value
@@ -1,10 +1,13 @@
 """Simple Web scraper."""
-from typing import List
+from typing import TYPE_CHECKING, List, Optional
 
 import requests
 from llama_index.readers.base import BaseReader
 from llama_index.readers.schema.base import Document
 
+if TYPE_CHECKING:
+    from llama_hub.web.http_cache import HTTPResponseCache
+
 
 class SimpleWebPageReader(BaseReader):
     """Simple web page reader.
@@ -14,12 +17,17 @@ class SimpleWebPageReader(BaseReader):
     Args:
         html_to_text (bool): Whether to convert HTML to text.
             Requires `html2text` package.
+        cache (Optional[HTTPResponseCache]): Cache of the responses, so
+            that unchanged pages are not downloaded again.
 
     """
 
-    def __init__(self, html_to_text: bool = False) -> None:
+    def __init__(
+        self, html_to_text: bool = False, cache: Optional["HTTPResponseCache"] = None
+    ) -> None:
         """Initialize with parameters."""
         self._html_to_text = html_to_text
+        self._cache = cache
 
     def load_data(self, urls: List[str]) -> List[Document]:
         """Load data from the input directory.
@@ -36,7 +44,10 @@ class SimpleWebPageReader(BaseReader):
 
         documents = []
         for url in urls:
-            response = requests.get(url).text
+            if self._cache is not None:
+                response = self._cache.get(url).text
+            else:
+                response = requests.get(url).text
             if self._html_to_text:
                 import html2text
 
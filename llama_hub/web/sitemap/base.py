@@ -1,28 +1,104 @@
+import asyncio
+import gzip
+import io
+import json
+import os
 import urllib.request
 import xml.etree.ElementTree as ET
-from typing import List
+from contextlib import contextmanager
+from datetime import datetime, timezone
+from typing import (
+    IO,
+    TYPE_CHECKING,
+    AsyncIterator,
+    Dict,
+    Iterator,
+    List,
+    Optional,
+    Set,
+    Tuple,
+)
 
 from llama_index import download_loader
 from llama_index.readers.base import BaseReader
 from llama_index.readers.schema.base import Document
 
+if TYPE_CHECKING:
+    from llama_hub.web.http_cache import HTTPResponseCache
+
+
+def _parse_lastmod(lastmod: Optional[str]) -> Optional[datetime]:
+    """Parse a W3C datetime, e.g. `2023-06-21` or `2023-06-21T15:16:07+00:00`."""
+    if not lastmod:
+        return None
+    try:
+        parsed = datetime.fromisoformat(lastmod.strip().replace("Z", "+00:00"))
+    except ValueError:
+        return None
+    if parsed.tzinfo is None:
+        parsed = parsed.replace(tzinfo=timezone.utc)
+    return parsed
+
+
+def _advance_watermark(
+    watermark: Optional[datetime],
+    lastmods: Dict[str, Optional[datetime]],
+    loaded: Set[str],
+) -> Optional[datetime]:
+    """Latest `lastmod` of the loaded pages, before any page that failed.
+
+    Pages that produced no document must be listed again by the next load,
+    so the watermark stays before the earliest `lastmod` among them.
+    """
+    failed = [
+        lastmod
+        for location, lastmod in lastmods.items()
+        if location not in loaded and lastmod is not None
+    ]
+    limit = min(failed, default=None)
+
+    latest = watermark
+    for location in loaded:
+        lastmod = lastmods.get(location)
+        if lastmod is None or (limit is not None and lastmod >= limit):
+            continue
+        if latest is None or lastmod > latest:
+            latest = lastmod
+    return latest
+
 
 class SitemapReader(BaseReader):
     """Asynchronous sitemap reader for web.
 
     Reads pages from the web based on their sitemap.xml.
 
+    Sitemaps are parsed incrementally while they download, may be gzipped,
+    and sitemap indexes are followed to the sitemaps they list.
+
     Args:
         sitemap_url (string): Path to the sitemap.xml. e.g. https://gpt-index.readthedocs.io/sitemap.xml
         html_to_text (bool): Whether to convert HTML to text.
             Requires `html2text` package.
         limit (int): Maximum number of concurrent requests.
+        watermark_path (Optional[str]): Path of a JSON file storing, per
+            sitemap, the latest `lastmod` of the loaded pages. When set, pages
+            and nested sitemaps not modified since the previous load are
+            skipped. Pages without `lastmod` are always loaded, and pages
+            that failed to load are listed again by the next load.
+        cache (Optional[HTTPResponseCache]): Cache of the page responses, so
+            that unchanged pages are not downloaded again.
 
     """
 
     xml_schema_sitemap = "http://www.sitemaps.org/schemas/sitemap/0.9"
 
-    def __init__(self, html_to_text: bool = False, limit: int = 10) -> None:
+    def __init__(
+        self,
+        html_to_text: bool = False,
+        limit: int = 10,
+        watermark_path: Optional[str] = None,
+        cache: Optional["HTTPResponseCache"] = None,
+    ) -> None:
         """Initialize with parameters."""
 
         try:
@@ -32,29 +108,167 @@ class SitemapReader(BaseReader):
         except ImportError:
             AsyncWebPageReader = download_loader("AsyncWebPageReader")
 
-        self._async_loader = AsyncWebPageReader(html_to_text=html_to_text, limit=limit)
+        self._async_loader = AsyncWebPageReader(
+            html_to_text=html_to_text, limit=limit, cache=cache
+        )
         self._html_to_text = html_to_text
         self._limit = limit
+        self._watermark_path = watermark_path
 
-    def _load_sitemap(self, sitemap_url: str) -> str:
-        sitemap_url_request = urllib.request.urlopen(sitemap_url)
+    @contextmanager
+    def _open_sitemap(self, sitemap_url: str) -> Iterator[IO[bytes]]:
+        """Open a sitemap as a stream, transparently decompressing gzip."""
+        # closing a GzipFile does not close its file, so close the response too
+        with urllib.request.urlopen(sitemap_url) as response:
+            stream = io.BufferedReader(response)
+            if stream.peek(2)[:2] == b"\x1f\x8b":
+                with gzip.GzipFile(fileobj=stream) as gzip_stream:
+                    yield gzip_stream
+            else:
+                yield stream
 
-        return sitemap_url_request.read()
+    def _iter_entries(
+        self, stream: IO[bytes]
+    ) -> Iterator[Tuple[str, str, Optional[datetime]]]:
+        """Stream `(tag, loc, lastmod)` of the `<url>` and `<sitemap>` entries."""
+        url_tag = f"{{{self.xml_schema_sitemap}}}url"
+        sitemap_tag = f"{{{self.xml_schema_sitemap}}}sitemap"
+        loc_tag = f"{{{self.xml_schema_sitemap}}}loc"
+        lastmod_tag = f"{{{self.xml_schema_sitemap}}}lastmod"
 
-    def _parse_sitemap(self, raw_sitemap: str, filter_locs: str = None) -> list:
-        sitemap = ET.fromstring(raw_sitemap)
-        sitemap_urls = []
+        root = None
+        for event, element in ET.iterparse(stream, events=("start", "end")):
+            if root is None:
+                root = element
+            if event != "end" or element.tag not in (url_tag, sitemap_tag):
+                continue
+
+            location = element.findtext(loc_tag)
+            if location:
+                lastmod = _parse_lastmod(element.findtext(lastmod_tag))
+                yield element.tag, location.strip(), lastmod
+
+            # drop parsed entries, so memory does not grow with the sitemap
+            root.clear()
+
+    def _iter_sitemap_urls(
+        self,
+        sitemap_url: str,
+        filter_locs: Optional[str] = None,
+        modified_since: Optional[datetime] = None,
+    ) -> Iterator[Tuple[str, Optional[datetime]]]:
+        """Stream `(loc, lastmod)` of the pages of a sitemap or sitemap index.
+
+        Pages and nested sitemaps whose `lastmod` is not after
+        `modified_since` are skipped.
+        """
+        url_tag = f"{{{self.xml_schema_sitemap}}}url"
+        visited: Set[str] = set()
 
-        for url in sitemap.findall(f"{{{self.xml_schema_sitemap}}}url"):
-            location = url.find(f"{{{self.xml_schema_sitemap}}}loc").text
+        def iter_sitemap(url: str) -> Iterator[Tuple[str, Optional[datetime]]]:
+            visited.add(url)
+            with self._open_sitemap(url) as stream:
+                for tag, location, lastmod in self._iter_entries(stream):
+                    if (
+                        modified_since is not None
+                        and lastmod is not None
+                        and lastmod <= modified_since
+                    ):
+                        continue
 
-            if filter_locs is None or filter_locs in location:
-                sitemap_urls.append(location)
+                    if tag == url_tag:
+                        if filter_locs is None or filter_locs in location:
+                            yield location, lastmod
+                    elif location not in visited:
+                        yield from iter_sitemap(location)
 
-        return sitemap_urls
+        yield from iter_sitemap(sitemap_url)
+
+    def _load_watermark(self, sitemap_url: str) -> Optional[datetime]:
+        if self._watermark_path is None or not os.path.exists(self._watermark_path):
+            return None
+        with open(self._watermark_path) as f:
+            return _parse_lastmod(json.load(f).get(sitemap_url))
+
+    def _save_watermark(self, sitemap_url: str, watermark: Optional[datetime]) -> None:
+        if self._watermark_path is None or watermark is None:
+            return
+        watermarks = {}
+        if os.path.exists(self._watermark_path):
+            with open(self._watermark_path) as f:
+                watermarks = json.load(f)
+        watermarks[sitemap_url] = watermark.isoformat()
+
+        tmp_path = f"{self._watermark_path}.tmp"
+        with open(tmp_path, "w") as f:
+            json.dump(watermarks, f)
+        os.replace(tmp_path, self._watermark_path)
+
+    async def alazy_load_data(
+        self, sitemap_url: str, filter: Optional[str] = None
+    ) -> AsyncIterator[Document]:
+        """Lazily load the pages of a sitemap.
+
+        Pages are fetched as soon as their url is parsed from the sitemap,
+        while the rest of the sitemap is still downloading, and documents are
+        yielded as the pages arrive.
+
+        Args:
+            sitemap_url (str): Url of the sitemap or sitemap index.
+            filter (Optional[str]): Only load pages whose url contains it.
+
+        Returns:
+            AsyncIterator[Document]: Documents, one per page.
+
+        """
+        loop = asyncio.get_running_loop()
+        watermark = self._load_watermark(sitemap_url)
+        lastmods: Dict[str, Optional[datetime]] = {}
+        loaded: Set[str] = set()
+        sitemap_urls = self._iter_sitemap_urls(sitemap_url, filter, watermark)
+
+        async def aiter_urls() -> AsyncIterator[str]:
+            while True:
+                # parsing blocks on the network, so run it off the event loop
+                entry = await loop.run_in_executor(None, next, sitemap_urls, None)
+                if entry is None:
+                    return
+                location, lastmod = entry
+                lastmods[location] = lastmod
+                yield location
+
+        # keyed on the sitemap location, which a redirect changes in `Source`
+        async for _, location, document in self._async_loader.alazy_load_data_with_urls(
+            aiter_urls()
+        ):
+            loaded.add(location)
+            yield document
+
+        self._save_watermark(
+            sitemap_url, _advance_watermark(watermark, lastmods, loaded)
+        )
 
     def load_data(self, sitemap_url: str, filter: str = None) -> List[Document]:
-        sitemap = self._load_sitemap(sitemap_url=sitemap_url)
-        sitemap_urls = self._parse_sitemap(sitemap, filter)
+        watermark = self._load_watermark(sitemap_url)
+        lastmods: Dict[str, Optional[datetime]] = {}
+        sitemap_urls = []
+        for location, lastmod in self._iter_sitemap_urls(
+            sitemap_url, filter, watermark
+        ):
+            sitemap_urls.append(location)
+            lastmods[location] = lastmod
+
+        async def load_urls() -> List[Tuple[int, str, Document]]:
+            return [
+                result
+                async for result in self._async_loader.alazy_load_data_with_urls(
+                    sitemap_urls
+                )
+            ]
 
-        return self._async_loader.load_data(urls=sitemap_urls)
+        results = sorted(asyncio.run(load_urls()), key=lambda result: result[0])
+        loaded = {location for _, location, _ in results}
+        self._save_watermark(
+            sitemap_url, _advance_watermark(watermark, lastmods, loaded)
+        )
+        return [document for _, _, document in results]
@@ -1,9 +1,15 @@
-from typing import List
+import logging
+from typing import TYPE_CHECKING, List, Optional
 from importlib.util import find_spec
 
 from llama_index.readers.base import BaseReader
 from llama_index.readers.schema.base import Document
 
+if TYPE_CHECKING:
+    from llama_hub.web.http_cache import HTTPResponseCache
+
+logger = logging.getLogger(__name__)
+
 
 class TrafilaturaWebReader(BaseReader):
     """Trafilatura web page reader.
@@ -11,14 +17,19 @@ class TrafilaturaWebReader(BaseReader):
     Reads pages from the web.
     Requires the `trafilatura` package.
 
+    Args:
+        cache (Optional[HTTPResponseCache]): Cache of the responses, so
+            that unchanged pages are not downloaded again.
+
     """
 
-    def __init__(self) -> None:
+    def __init__(self, cache: Optional["HTTPResponseCache"] = None) -> None:
         if find_spec("trafilatura") is None:
             raise ImportError(
                 "Missing package: trafilatura.\n"
                 "Please `pip install trafilatura` to use this Reader"
             )
+        self._cache = cache
 
     def load_data(
         self,
@@ -51,7 +62,14 @@ class TrafilaturaWebReader(BaseReader):
             raise ValueError("urls must be a list of strings.")
         documents = []
         for url in urls:
-            downloaded = trafilatura.fetch_url(url)
+            if self._cache is not None:
+                cached = self._cache.get(url)
+                if not 200 <= cached.status < 300:
+                    logger.warning(f"{url} returned status {cached.status}")
+                    continue
+                downloaded = cached.text
+            else:
+                downloaded = trafilatura.fetch_url(url)
             response = trafilatura.extract(
                 downloaded,
                 include_comments=include_comments,
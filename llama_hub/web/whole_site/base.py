@@ -1,10 +1,10 @@
-from typing import List
+import asyncio
+from typing import List, Optional, Tuple
 from selenium import webdriver
 from selenium.webdriver.common.by import By
 from selenium.common.exceptions import WebDriverException
 from selenium.webdriver.support.ui import WebDriverWait
 from selenium.webdriver.support import expected_conditions as EC
-import time
 
 from llama_index.readers.base import BaseReader
 from llama_index.readers.schema.base import Document
@@ -24,14 +24,30 @@ class WholeSiteReader(BaseReader):
     Args:
         prefix (str): URL prefix for scraping.
         max_depth (int, optional): Maximum depth for BFS. Defaults to 10.
+        num_drivers (int, optional): Number of browsers loading pages
+            concurrently. Defaults to 1.
+        delay (float, optional): Minimum seconds between two requests to the
+            same domain. Defaults to 1.
+        respect_robots (bool, optional): Whether to skip pages disallowed by
+            robots.txt. Defaults to False.
     """
 
-    def __init__(self, prefix: str, max_depth: int = 10) -> None:
+    def __init__(
+        self,
+        prefix: str,
+        max_depth: int = 10,
+        num_drivers: int = 1,
+        delay: float = 1.0,
+        respect_robots: bool = False,
+    ) -> None:
         """
         Initialize the WholeSiteReader with the provided prefix and maximum depth.
         """
         self.prefix = prefix
         self.max_depth = max_depth
+        self.num_drivers = num_drivers
+        self.delay = delay
+        self.respect_robots = respect_robots
         self.driver = self.setup_driver()
 
     def setup_driver(self):
@@ -58,14 +74,16 @@ class WholeSiteReader(BaseReader):
         self.driver.quit()
         self.driver = self.setup_driver()
 
-    def extract_content(self):
-        WebDriverWait(self.driver, 10).until(
+    def extract_content(self, driver=None):
+        driver = driver or self.driver
+        WebDriverWait(driver, 10).until(
             EC.presence_of_element_located((By.TAG_NAME, "body"))
         )
-        body_element = self.driver.find_element(By.TAG_NAME, "body")
+        body_element = driver.find_element(By.TAG_NAME, "body")
         return body_element.text.strip()
 
-    def extract_links(self):
+    def extract_links(self, driver=None):
+        driver = driver or self.driver
         js_script = """
             var links = [];
             var elements = document.getElementsByTagName('a');
@@ -77,7 +95,12 @@ class WholeSiteReader(BaseReader):
             }
             return links;
             """
-        return self.driver.execute_script(js_script)
+        return driver.execute_script(js_script)
+
+    def visit(self, driver, url: str) -> Tuple[str, List[str]]:
+        """Load a page, returning its content and links."""
+        driver.get(url)
+        return self.extract_content(driver), self.extract_links(driver)
 
     def load_data(self, base_url: str) -> List[Document]:
         """Load data from the base URL using BFS algorithm.
@@ -86,47 +109,59 @@ class WholeSiteReader(BaseReader):
         Returns:
             List[Document]: List of scraped documents.
         """
-        added_urls = set()
-        urls_to_visit = [(base_url, 0)]
-        documents = []
-
-        while urls_to_visit:
-            current_url, depth = urls_to_visit.pop(0)
+        from llama_hub.web.crawler import CrawlFrontier, run_sync
+
+        frontier = CrawlFrontier(
+            max_depth=self.max_depth,
+            allow_url=lambda url: url.startswith(self.prefix),
+            max_concurrency=self.num_drivers,
+            max_per_domain=self.num_drivers,
+            delay=self.delay,
+            respect_robots=self.respect_robots,
+        )
 
-            print(f"Visiting: {current_url}, {len(urls_to_visit)} left")
+        async def crawl() -> List[Tuple[int, str, str]]:
+            loop = asyncio.get_running_loop()
+            drivers: asyncio.Queue = asyncio.Queue()
+            drivers.put_nowait(self.driver)
+            for _ in range(self.num_drivers - 1):
+                drivers.put_nowait(await loop.run_in_executor(None, self.setup_driver))
+
+            async def fetch(url: str) -> Tuple[Optional[str], List[str]]:
+                print(f"Visiting: {url}, {len(frontier)} left")
+                driver = await drivers.get()
+                try:
+                    page_content, links = await loop.run_in_executor(
+                        None, self.visit, driver, url
+                    )
+                    print(f"Found {len(links)} potential links")
+                    return page_content, links
+                except WebDriverException:
+                    print("WebDriverException encountered, restarting driver...")
+                    driver.quit()
+                    new_driver = await loop.run_in_executor(None, self.setup_driver)
+                    if driver is self.driver:
+                        self.driver = new_driver
+                    driver = new_driver
+                    return None, []
+                except Exception as e:
+                    print(f"An unexpected exception occurred: {e}, skipping URL...")
+                    return None, []
+                finally:
+                    drivers.put_nowait(driver)
 
-            if depth > self.max_depth:
-                continue
             try:
-                self.driver.get(current_url)
-                page_content = self.extract_content()
-
-                # links = self.driver.find_elements(By.TAG_NAME, 'a')
-                links = self.extract_links()
-                # clean all urls
-                links = [self.clean_url(link) for link in links]
-                # extract new links
-                links = [link for link in links if link not in added_urls]
-                print(f"Found {len(links)} new potential links")
-                for href in links:
-                    try:
-                        if href.startswith(self.prefix) and href not in added_urls:
-                            urls_to_visit.append((href, depth + 1))
-                            added_urls.add(href)
-                    except Exception:
-                        continue
-
-                documents.append(
-                    Document(text=page_content, extra_info={"URL": current_url})
-                )
-                time.sleep(1)
-
-            except WebDriverException:
-                print("WebDriverException encountered, restarting driver...")
-                self.restart_driver()
-            except Exception as e:
-                print(f"An unexpected exception occurred: {e}, skipping URL...")
-                continue
-
-        self.driver.quit()
-        return documents
+                return [
+                    (page.index, page.url, page.content)
+                    async for page in frontier.crawl([base_url], fetch)
+                    if page.content is not None
+                ]
+            finally:
+                while not drivers.empty():
+                    drivers.get_nowait().quit()
+
+        pages = run_sync(crawl())
+        return [
+            Document(text=page_content, extra_info={"URL": url})
+            for _, url, page_content in sorted(pages)
+        ]
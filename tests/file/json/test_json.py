@@ -1,7 +1,11 @@
+import io
 import json
+from unittest.mock import patch
+
 import pytest
 
 from llama_hub.file.json import JSONReader
+from llama_hub.file.json.base import _iter_json_array
 
 # Sample JSON data for testing
 SAMPLE_JSON = {
@@ -57,3 +61,51 @@ def test_load_data_jsonl(jsonl_file):
     assert len(documents) == 2
     assert "Jane Doe" in documents[1].text
     assert "25" in documents[1].text
+
+
+@pytest.mark.parametrize("levels_back", [None, 0, 1])
+def test_lazy_load_data_json_array(tmp_path, levels_back):
+    items = [SAMPLE_JSON, {"name": "Jane Doe", "age": 25}, [1.5, "x"], 12345]
+    file = tmp_path / "test.json"
+    with open(file, "w") as f:
+        json.dump(items, f, indent=2)
+
+    reader = JSONReader(levels_back=levels_back)
+    with patch("llama_hub.file.json.base._iter_json_array") as iter_json_array:
+        # decode the array in chunks of a few characters
+        iter_json_array.side_effect = lambda f, buffer: _iter_json_array(f, buffer, 3)
+        documents = list(reader.lazy_load_data(file))
+    expected = [reader._parse_jsonobj_to_document(item) for item in items]
+    assert [doc.text for doc in documents] == [doc.text for doc in expected]
+
+
+def test_lazy_load_data_jsonl(jsonl_file):
+    with open(jsonl_file, "a") as f:
+        f.write("\n\n" + json.dumps({"name": "Jim Doe"}) + "\n")
+    documents = JSONReader().lazy_load_data(jsonl_file, is_jsonl=True)
+    assert "John Doe" in next(documents).text
+    assert [doc.text for doc in documents] == [
+        '{\n"name": "Jane Doe",\n"age": 25\n}',
+        '{\n"name": "Jim Doe"\n}',
+    ]
+
+
+def test_load_data_num_workers(jsonl_file):
+    documents = JSONReader(levels_back=0).load_data(jsonl_file, is_jsonl=True)
+    parallel = JSONReader(levels_back=0, num_workers=2, batch_size=1).load_data(
+        jsonl_file, is_jsonl=True
+    )
+    assert [doc.text for doc in parallel] == [doc.text for doc in documents]
+    assert documents[0].text.startswith("name John Doe\nage 30\naddress street")
+
+
+@pytest.mark.parametrize("chunk_size", [1, 2, 3, 7])
+def test_iter_json_array_split_at_every_offset(chunk_size):
+    # the data after the opening `[`
+    data = '1.5, 2, -3.25e-2, 10E+3, 0, 1e5, true, null, "1.", {"a": [12.5e1]}]'
+    expected = json.loads("[" + data)
+
+    for offset in range(len(data) + 1):
+        f = io.StringIO(data[offset:])
+        items = list(_iter_json_array(f, data[:offset], chunk_size))
+        assert items == expected, f"split at {offset}: {data[:offset]!r}"
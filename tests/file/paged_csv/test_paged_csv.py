@@ -0,0 +1,42 @@
+import pytest
+
+from llama_hub.file.paged_csv import PagedCSVReader
+
+SAMPLE_CSV = """First Name, Last Name,Age
+Bruce, Wayne,28
+Clark,Kent,
+"Diana, Prince",,5000
+"""
+
+
+# Fixture to create a temporary CSV file
+@pytest.fixture
+def csv_file(tmp_path):
+    file = tmp_path / "test.csv"
+    with open(file, "w") as f:
+        f.write(SAMPLE_CSV)
+    return file
+
+
+def test_load_data(csv_file):
+    documents = PagedCSVReader().load_data(csv_file, extra_info={"source": "test"})
+    assert len(documents) == 3
+    assert documents[0].text == "First Name: Bruce\nLast Name: Wayne\nAge: 28"
+    assert documents[2].text == "First Name: Diana, Prince\nLast Name: \nAge: 5000"
+    assert documents[0].extra_info == {"source": "test"}
+
+
+def test_lazy_load_data_rows_per_document(csv_file):
+    documents = list(PagedCSVReader(rows_per_document=2).lazy_load_data(csv_file))
+    assert [doc.text for doc in documents] == [
+        "First Name: Bruce\nLast Name: Wayne\nAge: 28\n\n"
+        "First Name: Clark\nLast Name: Kent\nAge: ",
+        "First Name: Diana, Prince\nLast Name: \nAge: 5000",
+    ]
+
+
+def test_lazy_load_data_chunksize(csv_file):
+    pytest.importorskip("pandas")
+    expected = PagedCSVReader().load_data(csv_file)
+    documents = list(PagedCSVReader(chunksize=2).lazy_load_data(csv_file))
+    assert [doc.text for doc in documents] == [doc.text for doc in expected]
@@ -0,0 +1,51 @@
+import pytest
+
+pytest.importorskip("pandas")
+
+from llama_hub.file.pandas_csv import PandasCSVReader  # noqa: E402
+
+SAMPLE_CSV = """name,age,score
+Bruce,28,1.5
+Clark,,2.0
+Diana,5000,
+"""
+
+
+# Fixture to create a temporary CSV file
+@pytest.fixture
+def csv_file(tmp_path):
+    file = tmp_path / "test.csv"
+    with open(file, "w") as f:
+        f.write(SAMPLE_CSV)
+    return file
+
+
+def test_load_data(csv_file):
+    documents = PandasCSVReader().load_data(csv_file)
+    assert len(documents) == 1
+    assert documents[0].text == (
+        "Bruce, 28.0, 1.5\nClark, nan, 2.0\nDiana, 5000.0, nan"
+    )
+
+
+def test_lazy_load_data_chunksize(csv_file):
+    reader = PandasCSVReader(concat_rows=False, chunksize=2, rows_per_document=2)
+    documents = list(reader.lazy_load_data(csv_file, extra_info={"source": "test"}))
+    # types are inferred per chunk, the second one has no missing age
+    assert [doc.text for doc in documents] == [
+        "Bruce, 28.0, 1.5\nClark, nan, 2.0",
+        "Diana, 5000, nan",
+    ]
+    assert documents[0].extra_info == {"source": "test"}
+
+
+def test_lazy_load_data_col_joiner(csv_file):
+    reader = PandasCSVReader(
+        concat_rows=False, col_joiner=" | ", pandas_config={"dtype": str}
+    )
+    documents = list(reader.lazy_load_data(csv_file))
+    assert [doc.text for doc in documents] == [
+        "Bruce | 28 | 1.5",
+        "Clark | nan | 2.0",
+        "Diana | 5000 | nan",
+    ]
@@ -0,0 +1,108 @@
+"""Benchmark the PDF engines over a generated local PDF corpus.
+
+Generates PDF files of text pages with PyMuPDF, then extracts them with each
+engine, serially and with worker processes, and prints the pages per second
+and peak RSS of each configuration. Each configuration runs in its own
+process, so that peak RSS is not shared between them.
+
+Usage:
+    python tests/file/pdf_engines/benchmark_pdf_engines.py --files 4 --pages 200
+"""
+
+import argparse
+import json
+import os
+import resource
+import subprocess
+import sys
+import tempfile
+import time
+from typing import List
+
+from llama_hub.file.pdf_engines import (
+    PDFMinerEngine,
+    PyMuPDFEngine,
+    PyPDFEngine,
+    extract_pages,
+)
+
+ENGINES = {
+    "pypdf": PyPDFEngine,
+    "pdfminer": PDFMinerEngine,
+    "pymupdf": PyMuPDFEngine,
+}
+
+PARAGRAPH = "Lorem ipsum dolor sit amet, consectetur adipiscing elit. " * 3
+
+
+def generate_corpus(directory: str, files: int, pages: int) -> List[str]:
+    import fitz
+
+    paths = []
+    for i in range(files):
+        path = os.path.join(directory, f"file{i}.pdf")
+        doc = fitz.open()
+        for number in range(pages):
+            page = doc.new_page()
+            text = f"Page {number}\n" + "\n".join([PARAGRAPH] * 30)
+            page.insert_textbox(page.rect + (36, 36, -36, -36), text, fontsize=8)
+        doc.save(path)
+        doc.close()
+        paths.append(path)
+    return paths
+
+
+def run(engine_name: str, num_workers: int, paths: List[str]) -> None:
+    """Extract the corpus, printing the pages per second and peak RSS as JSON."""
+    engine = ENGINES[engine_name]()
+    start = time.perf_counter()
+    num_pages = 0
+    for path in paths:
+        for _ in extract_pages(engine, path, num_workers=num_workers):
+            num_pages += 1
+    elapsed = time.perf_counter() - start
+
+    # kilobytes on Linux
+    peak_rss = max(
+        resource.getrusage(resource.RUSAGE_SELF).ru_maxrss,
+        resource.getrusage(resource.RUSAGE_CHILDREN).ru_maxrss,
+    )
+    print(json.dumps({"pages_per_sec": num_pages / elapsed, "peak_rss_kb": peak_rss}))
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--files", type=int, default=4)
+    parser.add_argument("--pages", type=int, default=200)
+    parser.add_argument("--workers", type=int, default=os.cpu_count() or 1)
+    parser.add_argument("--engines", nargs="*", default=list(ENGINES))
+    parser.add_argument("--run", nargs=2, help=argparse.SUPPRESS)
+    parser.add_argument("paths", nargs="*", help=argparse.SUPPRESS)
+    args = parser.parse_args()
+
+    if args.run:
+        engine_name, num_workers = args.run
+        run(engine_name, int(num_workers), args.paths)
+        return
+
+    with tempfile.TemporaryDirectory() as directory:
+        paths = generate_corpus(directory, args.files, args.pages)
+        for engine_name in args.engines:
+            for num_workers in (0, args.workers):
+                output = subprocess.run(
+                    [sys.executable, __file__, "--run", engine_name, str(num_workers)]
+                    + paths,
+                    check=True,
+                    stdout=subprocess.PIPE,
+                ).stdout
+                # PyMuPDF may print warnings before the result
+                result = json.loads(output.splitlines()[-1])
+                name = f"{engine_name}, {num_workers} workers"
+                print(
+                    f"{name:30} {result['pages_per_sec']:8.1f} pages/s"
+                    f" {result['peak_rss_kb'] / 1024:8.1f} MiB peak RSS"
+                )
+
+
+if __name__ == "__main__":
+    main()
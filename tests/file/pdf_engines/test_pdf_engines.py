@@ -0,0 +1,156 @@
+import importlib
+import pickle
+from unittest.mock import PropertyMock, patch
+
+import pytest
+
+fitz = pytest.importorskip("fitz")
+
+from llama_hub.file.pdf_engines import (  # noqa: E402
+    PDFEngine,
+    PDFMinerEngine,
+    PDFPageCache,
+    PyMuPDFEngine,
+    PyPDFEngine,
+    extract_pages,
+)
+
+
+def installed(module):
+    try:
+        importlib.import_module(module)
+    except ImportError:
+        return False
+    return True
+
+
+# checked at collection, before other tests replace modules in sys.modules
+ENGINES = [
+    pytest.param(
+        engine_class,
+        id=name,
+        marks=pytest.mark.skipif(not installed(module), reason=f"{module} missing"),
+    )
+    for name, engine_class, module in [
+        ("pypdf", PyPDFEngine, "pypdf"),
+        ("pdfminer", PDFMinerEngine, "pdfminer"),
+        ("pymupdf", PyMuPDFEngine, "fitz"),
+    ]
+]
+
+
+# Fixture to create a temporary PDF file with one line of text per page
+@pytest.fixture
+def pdf_file(tmp_path):
+    file = tmp_path / "test.pdf"
+    doc = fitz.open()
+    for number in range(1, 6):
+        page = doc.new_page()
+        page.insert_text((72, 72), f"Page {number}")
+    doc.save(file)
+    doc.close()
+    return file
+
+
+@pytest.fixture(params=ENGINES)
+def engine(request):
+    return request.param()
+
+
+def test_iter_pages(engine, pdf_file):
+    assert engine.count_pages(pdf_file) == 5
+    pages = list(engine.iter_pages(pdf_file, 1, 3))
+    assert [page.number for page in pages] == [1, 2]
+    assert [page.text.strip() for page in pages] == ["Page 2", "Page 3"]
+
+
+def test_engines_are_complete_and_picklable(engine):
+    assert pickle.loads(pickle.dumps(engine)).cache_key == engine.cache_key
+
+
+def test_incomplete_engine():
+    class NoCountEngine(PDFEngine):
+        cache_key = "no-count"
+
+        def iter_pages(self, file, start=0, stop=None):
+            return iter([])
+
+    with pytest.raises(TypeError):
+        NoCountEngine()
+
+
+@pytest.mark.skipif(not installed("pypdf"), reason="pypdf missing")
+def test_pypdf_page_labels_computed_once(pdf_file):
+    import pypdf
+
+    labels = ["i", "ii", "1", "2", "3"]
+    with patch.object(
+        pypdf.PdfReader, "page_labels", new_callable=PropertyMock
+    ) as page_labels:
+        page_labels.return_value = labels
+        pages = list(PyPDFEngine().iter_pages(pdf_file))
+
+    assert [page.label for page in pages] == labels
+    page_labels.assert_called_once()
+
+
+def test_iter_pages_stream(engine, pdf_file):
+    with open(pdf_file, "rb") as f:
+        pages = list(extract_pages(engine, f))
+    assert [page.text.strip() for page in pages] == [f"Page {i}" for i in range(1, 6)]
+
+
+def test_extract_pages_num_workers(engine, pdf_file):
+    serial = list(extract_pages(engine, pdf_file))
+    parallel = list(extract_pages(engine, pdf_file, num_workers=2, pages_per_task=2))
+    assert parallel == serial
+
+
+def test_extract_pages_cache(tmp_path, pdf_file):
+    engine = PyMuPDFEngine()
+    cache = PDFPageCache(str(tmp_path / "cache"))
+
+    # pages are only cached once all of them are extracted
+    pages = extract_pages(engine, pdf_file, cache=cache)
+    next(pages)
+    pages.close()
+    expected = list(extract_pages(engine, pdf_file, cache=cache))
+
+    with patch.object(engine, "iter_pages") as iter_pages:
+        assert list(extract_pages(engine, pdf_file, cache=cache)) == expected
+    iter_pages.assert_not_called()
+
+    # a modified file is extracted again
+    with fitz.open(pdf_file) as doc:
+        doc.new_page().insert_text((72, 72), "Page 6")
+        doc.saveIncr()
+    pages = list(extract_pages(engine, pdf_file, cache=cache))
+    assert pages[-1].text.strip() == "Page 6"
+
+
+@pytest.mark.skipif(
+    not installed("pypdf") or not installed("pdfminer"),
+    reason="pypdf or pdfminer.six missing",
+)
+def test_readers(pdf_file):
+    from llama_hub.file.cjk_pdf.base import CJKPDFReader
+    from llama_hub.file.pdf.base import PDFReader
+    from llama_hub.file.pdf_miner.base import PDFMinerReader
+
+    documents = PDFReader().load_data(str(pdf_file), extra_info={"author": "me"})
+    assert documents[1].text.strip() == "Page 2"
+    assert documents[1].extra_info == {
+        "page_label": "2",
+        "author": "me",
+        "file_name": "test.pdf",
+    }
+
+    documents = PDFMinerReader(num_workers=2, pages_per_task=2).load_data(pdf_file)
+    assert documents[4].text.strip() == "Page 5"
+    assert documents[4].extra_info == {"page_label": 4, "file_name": "test.pdf"}
+
+    documents = CJKPDFReader().load_data(pdf_file)
+    assert len(documents) == 1
+    assert documents[0].text.split() == [
+        word for i in range(1, 6) for word in ("Page", str(i))
+    ]
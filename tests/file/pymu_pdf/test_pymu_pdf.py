@@ -0,0 +1,60 @@
+import pytest
+
+fitz = pytest.importorskip("fitz")
+
+from llama_hub.file.pymu_pdf.base import PyMuPDFReader  # noqa: E402
+
+
+# Fixture to create a temporary PDF file with one line of text per page
+@pytest.fixture
+def pdf_file(tmp_path):
+    file = tmp_path / "test.pdf"
+    doc = fitz.open()
+    for number in range(1, 8):
+        page = doc.new_page()
+        page.insert_text((72, 72), f"Page {number}")
+    doc.save(file)
+    doc.close()
+    return file
+
+
+def test_load(pdf_file):
+    documents = PyMuPDFReader().load(pdf_file, extra_info={"author": "me"})
+    assert len(documents) == 7
+    assert isinstance(documents[0].text, str)
+    assert documents[0].text.strip() == "Page 1"
+    assert documents[6].extra_info == {
+        "author": "me",
+        "total_pages": 7,
+        "file_path": str(pdf_file),
+        "source": "7",
+    }
+
+
+def test_lazy_load_without_metadata(pdf_file):
+    documents = PyMuPDFReader().lazy_load(str(pdf_file), metadata=False)
+    document = next(documents)
+    assert document.text.strip() == "Page 1"
+    assert document.extra_info == {}
+
+
+def test_lazy_load_max_chars(pdf_file):
+    page_chars = len(PyMuPDFReader().load(pdf_file)[0].text)
+    documents = PyMuPDFReader().load(pdf_file, max_chars=3 * page_chars)
+    assert [document.extra_info["source"] for document in documents] == [
+        "1-3",
+        "4-6",
+        "7",
+    ]
+    assert documents[1].text.split() == ["Page", "4", "Page", "5", "Page", "6"]
+
+
+def test_lazy_load_num_workers(pdf_file):
+    serial = PyMuPDFReader().load(pdf_file)
+    parallel = PyMuPDFReader(num_workers=2, pages_per_task=2).load(pdf_file)
+    assert [document.text for document in parallel] == [
+        document.text for document in serial
+    ]
+    assert [document.extra_info for document in parallel] == [
+        document.extra_info for document in serial
+    ]
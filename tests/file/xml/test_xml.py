@@ -62,3 +62,19 @@ def test_load_data_xml(xml_file):
     assert len(documents) == 1
     assert "Apple" in documents[0].text
     assert "Garden City" in documents[0].text
+
+
+@pytest.mark.parametrize("tree_level_split", [0, 1, 2, 3])
+def test_lazy_load_data_matches_parse(xml_file, tree_level_split):
+    reader = XMLReader(tree_level_split)
+    expected = reader._parse_xmlelt_to_document(ET.fromstring(SAMPLE_XML))
+    documents = list(reader.lazy_load_data(xml_file))
+    assert [doc.text for doc in documents] == [doc.text for doc in expected]
+
+
+def test_lazy_load_data_mixed_content(tmp_path):
+    file = tmp_path / "mixed.xml"
+    file.write_text("<doc><p>Hello <b>bold</b> world</p><p>Bye</p></doc>")
+    documents = XMLReader(2).lazy_load_data(file)
+    assert next(documents).text == "<b>bold</b> world"
+    assert [doc.text for doc in documents] == ["<p>Bye</p>"]
@@ -1,8 +1,10 @@
 """Test file reader."""
+import os
 import sys
 from pathlib import Path
 from tempfile import TemporaryDirectory
 from typing import Any, Dict
+from unittest.mock import patch
 
 from llama_hub.file.base import SimpleDirectoryReader
 
@@ -184,6 +186,29 @@ def test_num_files_limit() -> None:
                     }
 
 
+def test_num_files_limit_stops_walk() -> None:
+    """Test that the walk stops once num_files_limit files are found."""
+    with TemporaryDirectory() as tmp_dir:
+        for i in range(2):
+            with open(f"{tmp_dir}/test{i}.txt", "w") as f:
+                f.write(f"test{i}")
+        for d in range(5):
+            Path(f"{tmp_dir}/dir{d}").mkdir()
+            for i in range(2):
+                with open(f"{tmp_dir}/dir{d}/test{d}{i}.txt", "w") as f:
+                    f.write(f"test{d}{i}")
+
+        with patch("llama_hub.file.base.os.scandir", wraps=os.scandir) as scandir:
+            reader = SimpleDirectoryReader(tmp_dir, recursive=True, num_files_limit=3)
+        input_file_names = [f.name for f in reader.input_files]
+        assert input_file_names == ["test0.txt", "test1.txt", "test00.txt"]
+        # only the top directory and the first subdirectory are listed
+        assert [Path(c.args[0]).name for c in scandir.call_args_list] == [
+            Path(tmp_dir).name,
+            "dir0",
+        ]
+
+
 def test_file_metadata() -> None:
     """Test if file metadata is added to Document."""
     # test file_metadata
@@ -206,3 +231,90 @@ def test_file_metadata() -> None:
 
         for d in documents:
             assert d.extra_info is not None and d.extra_info["author"] == test_author
+
+
+def test_parallel_lazy_load() -> None:
+    """Test that parallel lazy loading yields the same documents as serial."""
+    with TemporaryDirectory() as tmp_dir:
+        for i in range(6):
+            with open(f"{tmp_dir}/test{i}.txt", "w") as f:
+                f.write(f"test{i}")
+
+        serial_reader = SimpleDirectoryReader(tmp_dir)
+        parallel_reader = SimpleDirectoryReader(tmp_dir, num_workers=2, max_in_flight=2)
+
+        serial_texts = [d.text for d in serial_reader.load_data()]
+        parallel_texts = [d.text for d in parallel_reader.lazy_load_data()]
+        assert serial_texts == [f"test{i}" for i in range(6)]
+        assert sorted(parallel_texts) == serial_texts
+
+
+def test_reader_resolved_once() -> None:
+    """Test that a file extractor is only resolved once per reader."""
+    with TemporaryDirectory() as tmp_dir:
+        for i in range(3):
+            with open(f"{tmp_dir}/test{i}.json", "w") as f:
+                f.write(f'{{"key": "test{i}"}}')
+
+        reader = SimpleDirectoryReader(tmp_dir)
+        documents = reader.load_data()
+        assert len(documents) == 3
+        assert list(reader._readers) == [".json"]
+        json_reader = reader._readers[".json"]
+        assert reader._get_reader(".json") is json_reader
+
+
+def test_manifest() -> None:
+    """Test that the manifest skips unchanged files and reports deletions."""
+    with TemporaryDirectory() as tmp_dir, TemporaryDirectory() as manifest_dir:
+        manifest_path = f"{manifest_dir}/manifest.json"
+        for i in range(3):
+            with open(f"{tmp_dir}/test{i}.txt", "w") as f:
+                f.write(f"test{i}")
+
+        reader = SimpleDirectoryReader(tmp_dir, manifest_path=manifest_path)
+        assert [d.text for d in reader.load_data()] == ["test0", "test1", "test2"]
+
+        # nothing changed
+        reader = SimpleDirectoryReader(tmp_dir, manifest_path=manifest_path)
+        assert reader.load_data() == []
+        assert reader.deleted_files == []
+
+        # modify one file, add one and remove one
+        with open(f"{tmp_dir}/test1.txt", "w") as f:
+            f.write("test1 modified")
+        with open(f"{tmp_dir}/test3.txt", "w") as f:
+            f.write("test3")
+        Path(f"{tmp_dir}/test2.txt").unlink()
+
+        reader = SimpleDirectoryReader(tmp_dir, manifest_path=manifest_path)
+        assert [d.text for d in reader.load_data()] == ["test1 modified", "test3"]
+        assert reader.deleted_files == [str(Path(tmp_dir) / "test2.txt")]
+
+
+def test_include_exclude() -> None:
+    """Test include and exclude glob patterns."""
+    with TemporaryDirectory() as tmp_dir:
+        with open(f"{tmp_dir}/test1.txt", "w") as f:
+            f.write("test1")
+        with open(f"{tmp_dir}/test2.md", "w") as f:
+            f.write("test2")
+        Path(f"{tmp_dir}/build").mkdir()
+        with open(f"{tmp_dir}/build/test3.txt", "w") as f:
+            f.write("test3")
+        Path(f"{tmp_dir}/src").mkdir()
+        with open(f"{tmp_dir}/src/test4.txt", "w") as f:
+            f.write("test4")
+
+        reader = SimpleDirectoryReader(
+            tmp_dir, recursive=True, include=["*.txt"], exclude=["build"]
+        )
+        input_file_names = [f.name for f in reader.input_files]
+        assert input_file_names == ["test1.txt", "test4.txt"]
+
+        reader = SimpleDirectoryReader(
+            tmp_dir, recursive=True, include=["src/*"], lazy_listing=True
+        )
+        assert reader._input_files is None
+        assert [d.text for d in reader.lazy_load_data()] == ["test4"]
+        assert [f.name for f in reader.input_files] == ["test4.txt"]
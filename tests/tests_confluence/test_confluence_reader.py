@@ -1,4 +1,5 @@
 import unittest
+from concurrent.futures import ThreadPoolExecutor
 from typing import Optional
 from unittest.mock import patch
 
@@ -72,6 +73,27 @@ class TestConfluenceReader:
                 cloud=True,
             )
 
+    def test_confluence_reader_client_per_thread(self, mock_confluence):
+        mock_confluence.side_effect = lambda **kwargs: unittest.mock.MagicMock()
+        confluence_reader = ConfluenceReader(
+            base_url=CONFLUENCE_BASE_URL, oauth2=MOCK_OAUTH
+        )
+        client = confluence_reader.confluence
+        assert confluence_reader.confluence is client
+
+        with ThreadPoolExecutor(max_workers=2) as executor:
+            thread_client = executor.submit(lambda: confluence_reader.confluence)
+        assert thread_client.result() is not client
+        mock_confluence.assert_called_with(
+            url=CONFLUENCE_BASE_URL, oauth2=MOCK_OAUTH, cloud=True
+        )
+
+        # a client set by the caller is shared
+        confluence_reader.confluence = client
+        with ThreadPoolExecutor(max_workers=2) as executor:
+            thread_client = executor.submit(lambda: confluence_reader.confluence)
+        assert thread_client.result() is client
+
     def test_confluence_reader_load_data_invalid_args_no_method(self, mock_confluence):
         confluence_reader = ConfluenceReader(
             base_url=CONFLUENCE_BASE_URL, oauth2=MOCK_OAUTH
@@ -675,6 +697,60 @@ class TestConfluenceReader:
         actual_doc_ids = [doc.doc_id for doc in documents]
         assert actual_doc_ids == ["0", "1", "4", "7", "5", "2"]
 
+    def test_confluence_reader_load_data_by_page_ids_batched(self, mock_confluence):
+        mock_confluence.get.side_effect = _mock_get_pages_by_id_cql
+        mock_confluence.get_page_by_id.side_effect = lambda page_id, expand: {
+            "id": str(page_id),
+            "type": "page",
+            "status": "draft",
+            "title": f"Page {page_id}",
+            "body": {"export_view": {"value": f"<p>Content {page_id}</p>"}},
+            "_links": {"webui": f"/spaces/{page_id}/pages/{page_id}/Page+{page_id}"},
+        }
+
+        confluence_reader = ConfluenceReader(
+            base_url=CONFLUENCE_BASE_URL, oauth2=MOCK_OAUTH, page_batch_size=3
+        )
+        confluence_reader.confluence = mock_confluence
+
+        # "9" is a draft, which the search does not return
+        mock_page_ids = ["0", "1", "2", "3", "9", "4", "1"]
+        documents = confluence_reader.load_data(page_ids=mock_page_ids)
+
+        # 5 distinct searchable ids are looked up in batches of 3
+        assert mock_confluence.get.call_count == 2
+        searched_cql = sorted(
+            call.kwargs["params"]["cql"] for call in mock_confluence.get.call_args_list
+        )
+        assert searched_cql == ["id in (0,1,2)", "id in (3,9,4)"]
+        assert mock_confluence.get_page_by_id.call_count == 1
+        assert [doc.doc_id for doc in documents] == mock_page_ids
+        assert documents[4].extra_info["status"] == "draft"
+        assert confluence_reader.get_next_cursor() is None
+
+    def test_confluence_reader_load_data_by_page_ids_search_error(
+        self, mock_confluence
+    ):
+        mock_confluence.get.side_effect = RuntimeError("search unavailable")
+        mock_confluence.get_page_by_id.side_effect = lambda page_id, expand: {
+            "id": str(page_id),
+            "type": "page",
+            "status": "current",
+            "title": f"Page {page_id}",
+            "body": {"export_view": {"value": f"<p>Content {page_id}</p>"}},
+            "_links": {"webui": f"/spaces/{page_id}/pages/{page_id}/Page+{page_id}"},
+        }
+
+        confluence_reader = ConfluenceReader(
+            base_url=CONFLUENCE_BASE_URL, oauth2=MOCK_OAUTH
+        )
+        confluence_reader.confluence = mock_confluence
+
+        documents = confluence_reader.load_data(page_ids=["0", "1", "2"])
+
+        assert mock_confluence.get_page_by_id.call_count == 3
+        assert [doc.doc_id for doc in documents] == ["0", "1", "2"]
+
     def test_confluence_reader_load_data_cql_paging_max_none(self, mock_confluence):
         mock_confluence.get.side_effect = [
             {
@@ -1015,3 +1091,22 @@ def _mock_get_cursor_pages(path: Optional[str], params):
 
     body = {"results": results, "_links": links}
     return body
+
+
+def _mock_get_pages_by_id_cql(path: Optional[str], params):
+    """Mock the search of pages by id on a Confluence server with 8 current pages."""
+    num_pages_on_server = 8
+    page_ids = params["cql"][len("id in (") : -1].split(",")
+    results = [
+        {
+            "id": page_id,
+            "type": "page",
+            "status": "current",
+            "title": f"Page {page_id}",
+            "body": {"export_view": {"value": f"<p>Content {page_id}</p>"}},
+            "_links": {"webui": f"/spaces/{page_id}/pages/{page_id}/Page+{page_id}"},
+        }
+        for page_id in page_ids
+        if int(page_id) < num_pages_on_server
+    ]
+    return {"results": results, "_links": {}}
@@ -0,0 +1,68 @@
+import pytest
+
+pytest.importorskip("sqlalchemy")
+
+from sqlalchemy import create_engine, text  # noqa: E402
+
+from llama_hub.database.base import DatabaseReader  # noqa: E402
+
+
+@pytest.fixture()
+def reader(tmp_path):
+    engine = create_engine(f"sqlite:///{tmp_path / 'test.db'}")
+    with engine.begin() as connection:
+        connection.execute(text("CREATE TABLE users (id INTEGER, name TEXT, age INT)"))
+        for i in range(1, 11):
+            connection.execute(
+                text("INSERT INTO users VALUES (:id, :name, :age)"),
+                {"id": i, "name": f"user{i}", "age": 20 + i},
+            )
+    return DatabaseReader(engine=engine)
+
+
+def test_load_data(reader):
+    documents = reader.load_data(query="SELECT * FROM users WHERE id <= 2")
+    assert [doc.text for doc in documents] == ["1, user1, 21", "2, user2, 22"]
+
+
+def test_lazy_load_data_template(reader):
+    documents = list(
+        reader.lazy_load_data(
+            query="SELECT name, age FROM users ORDER BY id",
+            batch_size=3,
+            text_template="{name} is {age} years old.",
+        )
+    )
+    assert len(documents) == 10
+    assert documents[0].text == "user1 is 21 years old."
+    assert documents[-1].text == "user10 is 30 years old."
+
+
+def test_lazy_load_data_incremental(reader):
+    query = "SELECT id, name FROM users WHERE age > 22"
+    documents = reader.lazy_load_data(
+        query=query, batch_size=3, incremental_column="id"
+    )
+    first = [next(documents).text for _ in range(4)]
+    assert first == ["3, user3", "4, user4", "5, user5", "6, user6"]
+    documents.close()
+
+    # resume after the last row followed by a request for the next one
+    last_value = reader.get_last_value()
+    assert last_value == 5
+    rest = reader.lazy_load_data(
+        query=query, batch_size=3, incremental_column="id", last_value=last_value
+    )
+    assert [doc.text for doc in rest] == [
+        "6, user6",
+        "7, user7",
+        "8, user8",
+        "9, user9",
+        "10, user10",
+    ]
+    assert reader.get_last_value() == 10
+
+
+def test_lazy_load_data_last_value_requires_column(reader):
+    with pytest.raises(ValueError):
+        list(reader.lazy_load_data(query="SELECT * FROM users", last_value=1))
@@ -0,0 +1,109 @@
+"""Offline tests of GithubClient, against a local HTTP server."""
+
+import asyncio
+from unittest.mock import patch
+
+import pytest
+from pytest_httpserver import HTTPServer
+
+from llama_hub.github_repo.github_client import GithubClient
+
+TREE_RESPONSE = {
+    "sha": "tree-sha",
+    "url": "https://api.github.com/repos/owner/repo/git/trees/tree-sha",
+    "tree": [],
+    "truncated": False,
+}
+
+
+@pytest.fixture()
+def httpserver():
+    # a server of its own: the session server listens where the first module
+    # using it asks, and other modules configure a fixed address
+    server = HTTPServer()
+    server.start()
+    yield server
+    server.clear()
+    server.stop()
+
+
+@pytest.mark.asyncio
+async def test_github_client_etag_cache(httpserver):
+    httpserver.expect_ordered_request(
+        "/repos/owner/repo/git/trees/tree-sha", method="GET"
+    ).respond_with_json(TREE_RESPONSE, headers={"ETag": '"v1"'})
+    httpserver.expect_ordered_request(
+        "/repos/owner/repo/git/trees/tree-sha",
+        method="GET",
+        headers={"If-None-Match": '"v1"'},
+    ).respond_with_data("", status=304)
+
+    async with GithubClient("token", base_url=httpserver.url_for("")) as client:
+        first = await client.get_tree("owner", "repo", "tree-sha")
+        second = await client.get_tree("owner", "repo", "tree-sha")
+
+    assert first.sha == second.sha == "tree-sha"
+    httpserver.check_assertions()
+
+
+@pytest.mark.asyncio
+async def test_github_client_rate_limit_retry(httpserver):
+    httpserver.expect_ordered_request(
+        "/repos/owner/repo/git/trees/tree-sha", method="GET"
+    ).respond_with_data(
+        "", status=403, headers={"X-RateLimit-Remaining": "0", "Retry-After": "0"}
+    )
+    httpserver.expect_ordered_request(
+        "/repos/owner/repo/git/trees/tree-sha", method="GET"
+    ).respond_with_json(TREE_RESPONSE, headers={"X-RateLimit-Remaining": "10"})
+
+    async with GithubClient("token", base_url=httpserver.url_for("")) as client:
+        tree = await client.get_tree("owner", "repo", "tree-sha")
+        assert client._rate_limit_remaining == 10
+
+    assert tree.sha == "tree-sha"
+    httpserver.check_assertions()
+
+
+@pytest.mark.asyncio
+async def test_github_client_rate_limit_sleeps_once(httpserver):
+    httpserver.expect_ordered_request(
+        "/repos/owner/repo/git/trees/tree-sha", method="GET"
+    ).respond_with_data(
+        "", status=403, headers={"X-RateLimit-Remaining": "0", "Retry-After": "2"}
+    )
+    httpserver.expect_ordered_request(
+        "/repos/owner/repo/git/trees/tree-sha", method="GET"
+    ).respond_with_json(TREE_RESPONSE, headers={"X-RateLimit-Remaining": "10"})
+
+    sleeps = []
+
+    async def sleep(delay):
+        sleeps.append(delay)
+
+    async with GithubClient("token", base_url=httpserver.url_for("")) as client:
+        # the reset is still ahead when the request is retried
+        client._rate_limit_reset = 2e9
+        with patch("llama_hub.github_repo.github_client.asyncio.sleep", sleep):
+            await client.get_tree("owner", "repo", "tree-sha")
+
+    assert sleeps == [2.0]
+
+
+def test_github_client_closes_client_of_previous_loop(httpserver):
+    httpserver.expect_request(
+        "/repos/owner/repo/git/trees/tree-sha", method="GET"
+    ).respond_with_json(TREE_RESPONSE)
+    client = GithubClient("token", base_url=httpserver.url_for(""))
+
+    async def get_tree():
+        await client.get_tree("owner", "repo", "tree-sha")
+        return client._client
+
+    first = asyncio.run(get_tree())
+    second = asyncio.run(get_tree())
+
+    assert second is not first
+    assert first.is_closed
+    asyncio.run(client.aclose())
+    assert second.is_closed
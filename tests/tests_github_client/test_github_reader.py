@@ -0,0 +1,260 @@
+import asyncio
+import base64
+from unittest.mock import AsyncMock, MagicMock
+
+import pytest
+
+from llama_hub.github_repo.base import GithubRepositoryReader
+from llama_hub.github_repo.github_client import (
+    GitBlobResponseModel,
+    GitCommitResponseModel,
+    GitTreeResponseModel,
+)
+from llama_hub.github_repo.utils import BlobCache
+
+
+def get_mocked_diff_github_client():
+    #  Three commits of a mocked github repo:
+    #   "base-commit"               "head-commit"
+    #   ├───README.md (1111)        ├───README.md (2222)   modified
+    #   ├───docs (3333)             ├───docs (3333)        unchanged, not fetched
+    #   │   └───guide.md (4444)     │   └───guide.md (4444)
+    #   └───src (5555)              ├───src (6666)
+    #       ├───main.py (7777)      │   └───main.py (8888) modified
+    #       └───old.py (9999)       └───new.py (1010)      added, old.py deleted
+    #
+    #   "retyped-commit"
+    #   ├───README.md (1212)        blob replaced by a tree
+    #   │   └───index.md (1313)
+    #   └───docs (3333)             src deleted
+    tree_objects = {
+        "base-tree": [
+            ("README.md", "blob", "1111"),
+            ("docs", "tree", "3333"),
+            ("src", "tree", "5555"),
+        ],
+        "head-tree": [
+            ("README.md", "blob", "2222"),
+            ("docs", "tree", "3333"),
+            ("src", "tree", "6666"),
+            ("new.py", "blob", "1010"),
+        ],
+        "retyped-tree": [
+            ("README.md", "tree", "1212"),
+            ("docs", "tree", "3333"),
+        ],
+        "1212": [("index.md", "blob", "1313")],
+        "3333": [("guide.md", "blob", "4444")],
+        "5555": [("main.py", "blob", "7777"), ("old.py", "blob", "9999")],
+        "6666": [("main.py", "blob", "8888")],
+    }
+    commit_trees = {
+        "base-commit": "base-tree",
+        "head-commit": "head-tree",
+        "retyped-commit": "retyped-tree",
+    }
+
+    github_client = MagicMock()
+
+    async def get_commit_side_effect(owner, repo, commit_sha, timeout=None):
+        return GitCommitResponseModel.from_dict(
+            {
+                "commit": {"tree": {"sha": commit_trees[commit_sha]}},
+                "url": f"https://api.github.com/repos/{owner}/{repo}/commits/{commit_sha}",
+                "sha": commit_sha,
+            }
+        )
+
+    async def get_tree_side_effect(owner, repo, sha, timeout=None):
+        return GitTreeResponseModel(
+            sha=sha,
+            url=f"https://api.github.com/repos/{owner}/{repo}/git/trees/{sha}",
+            tree=[
+                GitTreeResponseModel.GitTreeObject(
+                    path=path,
+                    type=type,
+                    sha=obj_sha,
+                    mode="040000" if type == "tree" else "100644",
+                    url=f"https://api.github.com/repos/{owner}/{repo}/git/blobs/{obj_sha}",
+                )
+                for path, type, obj_sha in tree_objects[sha]
+            ],
+            truncated=False,
+        )
+
+    async def get_blob_side_effect(owner, repo, sha, timeout=None):
+        return GitBlobResponseModel(
+            sha=sha,
+            url=f"https://api.github.com/repos/{owner}/{repo}/git/blobs/{sha}",
+            content=base64.b64encode(f"content of {sha}".encode()).decode(),
+            encoding="base64",
+            size=8888,
+            node_id="",
+        )
+
+    github_client.get_commit = AsyncMock(side_effect=get_commit_side_effect)
+    github_client.get_tree = AsyncMock(side_effect=get_tree_side_effect)
+    github_client.get_blob = AsyncMock(side_effect=get_blob_side_effect)
+    return github_client
+
+
+def test_blob_cache(tmp_path):
+    cache = BlobCache(str(tmp_path))
+
+    assert "abcdef" not in cache
+    assert cache.get("abcdef") is None
+
+    cache.put("abcdef", b"content")
+    assert "abcdef" in cache
+    assert cache.get("abcdef") == b"content"
+    assert (tmp_path / "ab" / "abcdef").read_bytes() == b"content"
+
+    cache.put("abcdef", b"new content")
+    assert cache.get("abcdef") == b"new content"
+    assert sorted(p.name for p in (tmp_path / "ab").iterdir()) == ["abcdef"]
+
+
+@pytest.mark.asyncio
+async def test__diff_tree():
+    github_client = get_mocked_diff_github_client()
+    reader = GithubRepositoryReader(github_client, "owner", "repo")
+
+    blobs_and_paths = await reader._diff_tree("base-tree", "head-tree")
+
+    assert sorted((blob.sha, path) for blob, path in blobs_and_paths) == [
+        ("1010", "new.py"),
+        ("2222", "README.md"),
+        ("8888", "src/main.py"),
+    ]
+    assert reader.deleted_paths == ["src/old.py"]
+    fetched_trees = sorted(c.args[2] for c in github_client.get_tree.call_args_list)
+    assert fetched_trees == ["5555", "6666", "base-tree", "head-tree"]
+
+
+@pytest.mark.asyncio
+async def test__diff_tree_type_change_and_deleted_tree():
+    github_client = get_mocked_diff_github_client()
+    reader = GithubRepositoryReader(github_client, "owner", "repo")
+
+    blobs_and_paths = await reader._diff_tree("base-tree", "retyped-tree")
+
+    assert [(blob.sha, path) for blob, path in blobs_and_paths] == [
+        ("1313", "README.md/index.md")
+    ]
+    assert sorted(reader.deleted_paths) == ["README.md", "src/main.py", "src/old.py"]
+
+
+@pytest.mark.asyncio
+async def test__diff_tree_same_tree():
+    github_client = get_mocked_diff_github_client()
+    reader = GithubRepositoryReader(github_client, "owner", "repo")
+
+    assert await reader._diff_tree("head-tree", "head-tree") == []
+    assert reader.deleted_paths == []
+    github_client.get_tree.assert_not_called()
+
+
+def test_load_data_since_base_commit():
+    github_client = get_mocked_diff_github_client()
+    reader = GithubRepositoryReader(
+        github_client=github_client,
+        owner="owner",
+        repo="repo",
+    )
+
+    docs = reader.load_data(commit_sha="head-commit", base_commit_sha="base-commit")
+
+    assert sorted(doc.extra_info["file_path"] for doc in docs) == [
+        "README.md",
+        "new.py",
+        "src/main.py",
+    ]
+    assert reader.deleted_paths == ["src/old.py"]
+    fetched_trees = [c.args[2] for c in github_client.get_tree.call_args_list]
+    assert "3333" not in fetched_trees
+
+
+def test_load_data_with_blob_cache(tmp_path):
+    github_client = get_mocked_diff_github_client()
+    reader = GithubRepositoryReader(
+        github_client=github_client,
+        owner="owner",
+        repo="repo",
+        blob_cache_dir=str(tmp_path),
+    )
+
+    first_docs = reader.load_data(commit_sha="head-commit")
+    fetched_blobs = sorted(c.args[2] for c in github_client.get_blob.call_args_list)
+    assert fetched_blobs == ["1010", "2222", "4444", "8888"]
+    for sha in fetched_blobs:
+        assert BlobCache(str(tmp_path)).get(sha) == f"content of {sha}".encode()
+
+    # every blob is a hit
+    github_client.get_blob.reset_mock()
+    second_docs = reader.load_data(commit_sha="head-commit")
+    github_client.get_blob.assert_not_called()
+    assert sorted(doc.text for doc in first_docs) == sorted(
+        doc.text for doc in second_docs
+    )
+
+    # only the blobs missing from the cache are fetched
+    base_docs = reader.load_data(commit_sha="base-commit")
+    fetched_blobs = sorted(c.args[2] for c in github_client.get_blob.call_args_list)
+    assert fetched_blobs == ["1111", "7777", "9999"]
+    assert sorted(doc.text for doc in base_docs) == [
+        "content of 1111",
+        "content of 4444",
+        "content of 7777",
+        "content of 9999",
+    ]
+
+
+def test_load_data_in_tree_order():
+    github_client = get_mocked_diff_github_client()
+    fetch_blob = github_client.get_blob.side_effect
+
+    async def slow_first_blob(owner, repo, sha, timeout=None):
+        if sha == "2222":
+            await asyncio.sleep(0.2)
+        return await fetch_blob(owner, repo, sha, timeout)
+
+    github_client.get_blob.side_effect = slow_first_blob
+    reader = GithubRepositoryReader(github_client, "owner", "repo")
+
+    docs = reader.load_data(commit_sha="head-commit")
+
+    assert [doc.extra_info["file_path"] for doc in docs] == [
+        "README.md",
+        "docs/guide.md",
+        "src/main.py",
+        "new.py",
+    ]
+
+
+def test_load_data_more_blobs_than_queued():
+    github_client = get_mocked_diff_github_client()
+    github_client.get_tree.side_effect = None
+    github_client.get_tree.return_value = GitTreeResponseModel(
+        sha="big-tree",
+        url="https://api.github.com/repos/owner/repo/git/trees/big-tree",
+        tree=[
+            GitTreeResponseModel.GitTreeObject(
+                path=f"file{i}.txt",
+                type="blob",
+                sha=f"{i:04}",
+                mode="100644",
+                url=f"https://api.github.com/repos/owner/repo/git/blobs/{i:04}",
+            )
+            for i in range(50)
+        ],
+        truncated=False,
+    )
+    reader = GithubRepositoryReader(
+        github_client, "owner", "repo", concurrent_requests=2
+    )
+
+    docs = reader.load_data(commit_sha="head-commit")
+
+    assert [doc.extra_info["file_path"] for doc in docs] == [
+        f"file{i}.txt" for i in range(50)
+    ]
@@ -0,0 +1,125 @@
+import inspect
+import subprocess
+
+import pytest
+
+from llama_hub.github_repo.base import GithubRepositoryReader
+from llama_hub.github_repo.github_client import BaseGithubClient
+from llama_hub.github_repo.local_git_client import LocalGitClient
+
+
+def git(repo_path, *args):
+    return subprocess.run(
+        ["git", "-C", str(repo_path), *args],
+        check=True,
+        capture_output=True,
+        text=True,
+    ).stdout.strip()
+
+
+@pytest.fixture
+def local_repo(tmp_path):
+    #  The fixture repo structure:
+    #   .
+    #   ├───README.md
+    #   └───src
+    #       ├───main.py
+    #       └───utils
+    #           └───helpers.py
+    repo_path = tmp_path / "repo"
+    repo_path.mkdir()
+    git(repo_path, "init", "--quiet", "--initial-branch", "main")
+    git(repo_path, "config", "user.email", "test@example.com")
+    git(repo_path, "config", "user.name", "test")
+    git(repo_path, "config", "commit.gpgsign", "false")
+    (repo_path / "README.md").write_text("this is the file content for README.md")
+    (repo_path / "src" / "utils").mkdir(parents=True)
+    (repo_path / "src" / "main.py").write_text("print('hello world')")
+    (repo_path / "src" / "utils" / "helpers.py").write_text("def helper(): ...")
+    git(repo_path, "add", ".")
+    git(repo_path, "commit", "--quiet", "-m", "initial commit")
+    return repo_path
+
+
+def test_load_data_from_local_clone(local_repo, tmp_path):
+    client = LocalGitClient.from_remote(str(local_repo), str(tmp_path / "repo.git"))
+    reader = GithubRepositoryReader(client, "owner", "repo")
+
+    documents = reader.load_data(branch="main")
+    client.close()
+
+    assert {doc.extra_info["file_path"]: doc.text for doc in documents} == {
+        "README.md": "this is the file content for README.md",
+        "src/main.py": "print('hello world')",
+        "src/utils/helpers.py": "def helper(): ...",
+    }
+    # doc ids are the blob shas, like with the Github API
+    ls_tree = git(local_repo, "ls-tree", "-r", "HEAD").splitlines()
+    assert {doc.doc_id for doc in documents} == {line.split()[2] for line in ls_tree}
+
+
+def test_load_data_since_commit_from_local_clone(local_repo):
+    base_commit_sha = git(local_repo, "rev-parse", "HEAD")
+    (local_repo / "src" / "main.py").write_text("print('hello again')")
+    git(local_repo, "rm", "--quiet", "README.md")
+    git(local_repo, "commit", "--quiet", "-am", "second commit")
+    commit_sha = git(local_repo, "rev-parse", "HEAD")
+
+    client = LocalGitClient(str(local_repo))
+    reader = GithubRepositoryReader(client, "owner", "repo")
+
+    documents = reader.load_data(commit_sha=commit_sha, base_commit_sha=base_commit_sha)
+    client.close()
+
+    assert [doc.text for doc in documents] == ["print('hello again')"]
+    assert reader.deleted_paths == ["README.md"]
+
+
+@pytest.mark.asyncio
+async def test_local_git_client_missing_object(local_repo):
+    client = LocalGitClient(str(local_repo))
+    with pytest.raises(ValueError, match="not found"):
+        await client.get_tree("owner", "repo", "0" * 40)
+    client.close()
+
+
+def test_local_git_client_implements_base_github_client(local_repo):
+    client: BaseGithubClient = LocalGitClient(str(local_repo))
+    members = [
+        name
+        for name, member in vars(BaseGithubClient).items()
+        if inspect.isfunction(member) and not name.startswith("_")
+    ]
+    assert "get_all_endpoints" in members and "request" in members
+    for name in members:
+        expected = inspect.iscoroutinefunction(getattr(BaseGithubClient, name))
+        assert inspect.iscoroutinefunction(getattr(client, name)) == expected, name
+        # the Protocol arguments are accepted
+        protocol_parameters = inspect.signature(getattr(BaseGithubClient, name))
+        parameters = inspect.signature(getattr(LocalGitClient, name)).parameters
+        assert set(protocol_parameters.parameters) <= set(parameters), name
+
+
+@pytest.mark.asyncio
+async def test_local_git_client_request(local_repo):
+    client = LocalGitClient(str(local_repo))
+    assert set(client.get_all_endpoints()) == {
+        "getTree",
+        "getBranch",
+        "getBlob",
+        "getCommit",
+    }
+
+    branch = await client.request(
+        "getBranch", "GET", owner="o", repo="r", branch="main"
+    )
+    tree = await client.request(
+        "getTree", "GET", owner="o", repo="r", tree_sha=branch.commit.commit.tree.sha
+    )
+    assert [obj.path for obj in tree.tree] == ["README.md", "src"]
+
+    with pytest.raises(ValueError, match="not supported"):
+        await client.request("getRateLimit", "GET")
+    with pytest.raises(ValueError, match="not supported"):
+        await client.request("getTree", "POST", owner="o", repo="r", tree_sha="x")
+    client.close()
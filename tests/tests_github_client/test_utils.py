@@ -1,12 +1,17 @@
 import asyncio
+import base64
 from typing import List, Tuple
 
 import pytest
 
-from llama_hub.github_repo.github_client import GitTreeResponseModel
+from llama_hub.github_repo.github_client import (
+    GitBlobResponseModel,
+    GitTreeResponseModel,
+)
 from llama_hub.github_repo.utils import (
     BufferedAsyncIterator,
     BufferedGitBlobDataIterator,
+    GitBlobFetchPipeline,
 )
 
 # Remove this to test changes to GithubRepositoryReader.
@@ -164,3 +169,60 @@ async def test_buffered_git_blob_data_iterator():
     assert it._index == 4
     with pytest.raises(StopAsyncIteration):
         await it.__anext__()
+
+
+class MockSlowGithubClient:
+    def __init__(self):
+        self.in_flight = 0
+        self.max_in_flight = 0
+
+    async def get_blob(self, owner, repo, sha):
+        self.in_flight += 1
+        self.max_in_flight = max(self.max_in_flight, self.in_flight)
+        # the first blob is much slower than the others
+        await asyncio.sleep(0.2 if sha == "sha-0" else 0.01)
+        self.in_flight -= 1
+        return GitBlobResponseModel(
+            content=base64.b64encode(f"content of {sha}".encode()).decode(),
+            encoding="base64",
+            url=f"https://api.github.com/repos/{owner}/{repo}/git/blobs/{sha}",
+            sha=sha,
+            size=1,
+            node_id="",
+        )
+
+
+@pytest.mark.asyncio
+async def test_git_blob_fetch_pipeline():
+    github_client = MockSlowGithubClient()
+    blobs_and_paths = [
+        (
+            GitTreeResponseModel.GitTreeObject(
+                sha=f"sha-{i}",
+                path=f"file{i}",
+                mode="100644",
+                type="blob",
+                url=f"https://api.github.com/repos/owner/repo/git/blobs/sha-{i}",
+            ),
+            f"path/file{i}",
+        )
+        for i in range(10)
+    ]
+
+    async def blob_source():
+        for item in blobs_and_paths:
+            yield item
+
+    pipeline = GitBlobFetchPipeline(
+        github_client, "owner", "repo", concurrent_requests=3
+    )
+    results = [item async for item in pipeline.run(blob_source())]
+
+    assert github_client.max_in_flight == 3
+    assert sorted(results) == [
+        (f"sha-{i}", f"content of sha-{i}".encode(), f"path/file{i}") for i in range(10)
+    ]
+    # the slow blob does not hold up the blobs fetched after it
+    assert results[-1][0] == "sha-0"
+    assert pipeline.metrics.blobs_fetched == 10
+    assert pipeline.metrics.blobs_per_second > 0
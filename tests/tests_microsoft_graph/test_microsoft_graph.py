@@ -0,0 +1,190 @@
+import time
+
+import pytest
+from pytest_httpserver import HTTPServer
+
+from llama_hub.microsoft_graph import GraphClient, load_delta_state, save_delta_state
+
+
+@pytest.fixture()
+def httpserver():
+    # a server of its own: the session server listens where the first module
+    # using it asks, and other modules configure a fixed address
+    server = HTTPServer()
+    server.start()
+    yield server
+    server.clear()
+    server.stop()
+
+
+def drive_item(httpserver, item_id, parent_id, folder=False, **extra):
+    item = {"id": item_id, "name": f"{item_id}.txt", **extra}
+    if parent_id is not None:
+        item["parentReference"] = {"id": parent_id, "driveId": "drive"}
+    if folder:
+        item["folder"] = {"childCount": 1}
+    else:
+        item["file"] = {"mimeType": "text/plain"}
+        item["@microsoft.graph.downloadUrl"] = httpserver.url_for(f"/content/{item_id}")
+    return item
+
+
+@pytest.fixture()
+def graph(httpserver):
+    """Mock Graph drive: `root/F/a`, `root/F/S/b` and `root/c`."""
+    # "b" is listed before its parent folder "S"
+    httpserver.expect_request("/drive/root/delta").respond_with_json(
+        {
+            "value": [
+                drive_item(httpserver, "root", None, folder=True),
+                drive_item(httpserver, "F", "root", folder=True),
+                drive_item(httpserver, "b", "S"),
+            ],
+            "@odata.nextLink": httpserver.url_for("/drive/delta/page2"),
+        }
+    )
+    httpserver.expect_request("/drive/delta/page2").respond_with_json(
+        {
+            "value": [
+                drive_item(httpserver, "a", "F"),
+                drive_item(httpserver, "S", "F", folder=True),
+                drive_item(httpserver, "c", "root"),
+            ],
+            "@odata.deltaLink": httpserver.url_for("/drive/delta/token1"),
+        }
+    )
+    # "a" is modified, "b" moves out of "F", "d" is added to "S", "c" is deleted
+    httpserver.expect_request("/drive/delta/token1").respond_with_json(
+        {
+            "value": [
+                drive_item(httpserver, "a", "F", size=2),
+                drive_item(httpserver, "b", "root"),
+                drive_item(httpserver, "d", "S"),
+                {"id": "c", "deleted": {}, "parentReference": {"id": "root"}},
+            ],
+            "@odata.deltaLink": httpserver.url_for("/drive/delta/token2"),
+        }
+    )
+    httpserver.expect_request("/drive/delta/token2").respond_with_data(
+        "resyncRequired", status=410
+    )
+    return httpserver
+
+
+def test_sync_folder(graph):
+    client = GraphClient()
+    drive_url = graph.url_for("/drive")
+
+    files, deleted_file_ids, state = client.sync_folder(drive_url, "F")
+    assert sorted(item["id"] for item in files) == ["a", "b"]
+    assert deleted_file_ids == []
+    assert state["delta_link"] == graph.url_for("/drive/delta/token1")
+    assert state["folder_ids"] == ["F", "S"]
+
+    files, deleted_file_ids, state = client.sync_folder(drive_url, "F", state=state)
+    assert sorted(item["id"] for item in files) == ["a", "d"]
+    assert deleted_file_ids == ["b"]
+    assert state["file_ids"] == ["a", "d"]
+
+    # the delta link expired: the folder is synced again from scratch
+    files, deleted_file_ids, state = client.sync_folder(drive_url, "F", state=state)
+    assert sorted(item["id"] for item in files) == ["a", "b"]
+    assert deleted_file_ids == ["d"]
+
+
+def test_sync_folder_not_recursive(graph):
+    files, _, state = GraphClient().sync_folder(
+        graph.url_for("/drive"), "F", recursive=False
+    )
+    assert [item["id"] for item in files] == ["a"]
+    assert state["folder_ids"] == ["F"]
+
+
+def test_delta_state_persistence(tmp_path):
+    path = str(tmp_path / "delta.json")
+    assert load_delta_state(path, "folder") is None
+
+    save_delta_state(path, "folder", {"delta_link": "link"})
+    save_delta_state(path, "other", {"delta_link": "other_link"})
+    assert load_delta_state(path, "folder") == {"delta_link": "link"}
+    assert load_delta_state(path, "other") == {"delta_link": "other_link"}
+
+
+def test_request_honors_retry_after(httpserver):
+    httpserver.expect_ordered_request("/throttled").respond_with_data(
+        "", status=429, headers={"Retry-After": "1"}
+    )
+    httpserver.expect_ordered_request("/throttled").respond_with_json({"value": []})
+
+    client = GraphClient(access_token="token")
+    start = time.monotonic()
+    response = client.get(httpserver.url_for("/throttled"))
+
+    assert response.status_code == 200
+    assert time.monotonic() - start >= 1
+    assert len(httpserver.log) == 2
+    assert httpserver.log[1][0].headers["Authorization"] == "Bearer token"
+
+
+def test_request_gives_up_after_max_retries(httpserver):
+    httpserver.expect_request("/unavailable").respond_with_data("", status=503)
+
+    client = GraphClient(max_retries=2, backoff=0)
+    response = client.get(httpserver.url_for("/unavailable"))
+
+    assert response.status_code == 503
+    assert len(httpserver.log) == 3
+
+
+def test_download_items(httpserver, tmp_path):
+    for item_id in ["a", "b"]:
+        httpserver.expect_request(f"/content/{item_id}").respond_with_data(
+            f"content {item_id}"
+        )
+    httpserver.expect_request("/drive/items/c/content").respond_with_data("content c")
+    items = [
+        (drive_item(httpserver, "a", "F"), str(tmp_path / "a" / "a.txt")),
+        (drive_item(httpserver, "b", "F"), str(tmp_path / "b" / "b.txt")),
+        ({"id": "c", "name": "c.txt"}, str(tmp_path / "c.txt")),
+    ]
+
+    client = GraphClient(access_token="token", num_workers=2)
+    downloaded = dict(
+        (item["id"], path)
+        for item, path in client.download_items(items, httpserver.url_for("/drive"))
+    )
+
+    assert sorted(downloaded) == ["a", "b", "c"]
+    for item_id, path in downloaded.items():
+        with open(path) as f:
+            assert f.read() == f"content {item_id}"
+    # pre-authenticated download urls must not receive the access token
+    authorized_paths = [
+        request.path
+        for request, _ in httpserver.log
+        if "Authorization" in request.headers
+    ]
+    assert authorized_paths == ["/drive/items/c/content"]
+
+
+def test_sessions_per_thread(httpserver, tmp_path):
+    httpserver.expect_request("/content/a").respond_with_data("content a")
+    httpserver.expect_request("/content/b").respond_with_data("content b")
+    items = [
+        (drive_item(httpserver, item_id, "F"), str(tmp_path / f"{item_id}.txt"))
+        for item_id in ["a", "b"]
+    ]
+
+    client = GraphClient(num_workers=2)
+    session = client._session()
+    assert client._session() is session
+    list(client.download_items(items))
+
+    # the download threads do not share the session of this thread
+    sessions = client._sessions
+    assert session in sessions and len(sessions) > 1
+    assert len(set(map(id, sessions))) == len(sessions)
+
+    client.close()
+    assert client._sessions == []
+    assert client._session() is not session
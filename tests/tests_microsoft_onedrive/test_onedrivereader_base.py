@@ -3,6 +3,7 @@ from pytest_mock import MockerFixture
 from unittest.mock import patch
 from llama_hub.microsoft_onedrive.base import OneDriveReader
 from importlib.util import find_spec
+from pytest_httpserver import HTTPServer
 
 msal_spec = find_spec("msal")
 if msal_spec is None:
@@ -196,31 +197,31 @@ def test_construct_endpoint(
         assert endpoint == expected_endpoint
 
 
-@patch("llama_hub.microsoft_onedrive.base.requests.get")
 @patch("llama_hub.microsoft_onedrive.base.OneDriveReader._construct_endpoint")
-def test_get_items_in_drive_with_maxretries(mock_construct_endpoint, mock_get, mocker):
+def test_get_items_in_drive_with_maxretries(mock_construct_endpoint, mocker):
     # Arrange
     access_token = "test_access_token"
     item_ref = "test_item"
-    max_retries = 3
     mock_construct_endpoint.return_value = "constructed_endpoint"
 
-    # Mock the response object that the requests.get method will return
+    # Mock the response object that the Graph client will return
     mock_response = mocker.Mock()
     mock_response.json.return_value = {"data": "test_data"}
     mock_response.status_code = 200
-    mock_get.return_value = mock_response
 
     reader = OneDriveReader(client_id="test_client", tenant_id="test_tenant")
+    mock_get = mocker.patch.object(
+        reader._graph_client, "get", return_value=mock_response
+    )
 
     # Act
     result = reader._get_items_in_drive_with_maxretries(
-        access_token=access_token, item_ref=item_ref, max_retries=max_retries
+        access_token=access_token, item_ref=item_ref, isFile=True
     )
 
     # Assert
-    mock_construct_endpoint.assert_called_once_with(item_ref, False, False, None)
-    assert mock_get.call_count == 1
+    mock_construct_endpoint.assert_called_once_with(item_ref, False, True, None)
+    mock_get.assert_called_once_with("constructed_endpoint")
     assert result == {"data": "test_data"}
 
 
@@ -343,3 +344,103 @@ def test_with_file_paths(mock_methods):
     reader = OneDriveReader("client_id", "client_secret", "tenant_id")
     reader._init_download_and_get_metadata("temp_dir", file_paths=["/path/to/file"])
     mock_methods.assert_not_called()  # _connect_download_and_return_metadata should not be called for file paths
+
+
+@pytest.fixture()
+def httpserver():
+    # a server of its own: the session server listens where the first module
+    # using it asks, and other modules configure a fixed address
+    server = HTTPServer()
+    server.start()
+    yield server
+    server.clear()
+    server.stop()
+
+
+def _drive_file(httpserver, item_id, parent_id):
+    return {
+        "id": item_id,
+        "name": f"{item_id}.txt",
+        "file": {"mimeType": "text/plain"},
+        "parentReference": {"id": parent_id, "driveId": "drive"},
+        "@microsoft.graph.downloadUrl": httpserver.url_for(f"/content/{item_id}"),
+    }
+
+
+def test_load_data_with_delta_sync(httpserver, tmp_path, mocker: MockerFixture):
+    mocker.patch(
+        "llama_hub.microsoft_onedrive.base.OneDriveReader._authenticate_with_msal",
+        return_value="mocked_token",
+    )
+    httpserver.expect_request("/v1.0/me/drive/items/F").respond_with_json(
+        {"id": "F", "name": "F", "folder": {"childCount": 2}}
+    )
+    httpserver.expect_request("/v1.0/me/drive/root/delta").respond_with_json(
+        {
+            "value": [
+                {"id": "F", "name": "F", "folder": {}, "parentReference": {"id": "R"}},
+                _drive_file(httpserver, "a", "F"),
+                _drive_file(httpserver, "b", "F"),
+                _drive_file(httpserver, "c", "R"),
+            ],
+            "@odata.deltaLink": httpserver.url_for("/v1.0/delta/token1"),
+        }
+    )
+    httpserver.expect_request("/v1.0/delta/token1").respond_with_json(
+        {
+            "value": [
+                _drive_file(httpserver, "a", "F"),
+                {"id": "b", "deleted": {}, "parentReference": {"id": "F"}},
+            ],
+            "@odata.deltaLink": httpserver.url_for("/v1.0/delta/token2"),
+        }
+    )
+    for item_id in ["a", "b", "c"]:
+        httpserver.expect_request(f"/content/{item_id}").respond_with_data(
+            f"content {item_id}"
+        )
+
+    reader = OneDriveReader(
+        "client_id",
+        graph_base_url=httpserver.url_for("/v1.0"),
+        delta_token_path=str(tmp_path / "delta.json"),
+    )
+
+    documents = reader.load_data(folder_id="F")
+    assert sorted(doc.text for doc in documents) == ["content a", "content b"]
+    assert sorted(doc.metadata["file_id"] for doc in documents) == ["a", "b"]
+    assert reader.deleted_file_ids == []
+
+    # only the modified file is downloaded again
+    documents = reader.load_data(folder_id="F")
+    assert [doc.text for doc in documents] == ["content a"]
+    assert reader.deleted_file_ids == ["b"]
+    downloads = [
+        request.path for request, _ in httpserver.log if "content" in request.path
+    ]
+    assert sorted(downloads) == ["/content/a", "/content/a", "/content/b"]
+    # the sessions of the download threads are closed
+    assert reader._graph_client._sessions == []
+
+
+def test_get_items_in_drive_follows_next_link(httpserver):
+    httpserver.expect_ordered_request(
+        "/v1.0/me/drive/items/F/children"
+    ).respond_with_json(
+        {
+            "value": [_drive_file(httpserver, "a", "F")],
+            "@odata.nextLink": httpserver.url_for("/v1.0/children/page2"),
+        }
+    )
+    httpserver.expect_ordered_request("/v1.0/children/page2").respond_with_data(
+        "", status=429, headers={"Retry-After": "0"}
+    )
+    httpserver.expect_ordered_request("/v1.0/children/page2").respond_with_json(
+        {"value": [_drive_file(httpserver, "b", "F")]}
+    )
+
+    reader = OneDriveReader("client_id", graph_base_url=httpserver.url_for("/v1.0"))
+    data = reader._get_items_in_drive_with_maxretries("token", "F")
+
+    assert [item["id"] for item in data["value"]] == ["a", "b"]
+    assert len(httpserver.log) == 3
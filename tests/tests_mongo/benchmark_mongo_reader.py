@@ -0,0 +1,68 @@
+"""Benchmark SimpleMongoReader against a local mongod, or mongomock.
+
+Fills a collection with generated documents and prints the documents per
+second of several reader configurations. Without `--uri`, the collection is
+held by mongomock, which has no network round trips, so only the projection
+and batching overheads are measured.
+
+Usage:
+    python tests/tests_mongo/benchmark_mongo_reader.py --uri mongodb://localhost:27017
+"""
+
+import argparse
+import time
+from unittest.mock import patch
+
+from llama_hub.mongo.base import SimpleMongoReader
+
+TEXT = "Lorem ipsum dolor sit amet, consectetur adipiscing. " * 20
+
+
+def make_reader(uri: str) -> SimpleMongoReader:
+    if uri:
+        return SimpleMongoReader(uri=uri)
+    import mongomock
+
+    with patch("pymongo.MongoClient", mongomock.MongoClient):
+        return SimpleMongoReader(uri="mongodb://localhost:27017")
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--uri", default="")
+    parser.add_argument("--docs", type=int, default=20000)
+    parser.add_argument("--db", default="llama_hub_benchmark")
+    args = parser.parse_args()
+
+    reader = make_reader(args.uri)
+    collection = reader.client[args.db]["docs"]
+    collection.drop()
+    collection.insert_many(
+        [
+            # unread fields, skipped by the projection
+            {"_id": i, "text": TEXT, "title": f"title{i}", "blob": TEXT * 10}
+            for i in range(args.docs)
+        ]
+    )
+
+    configurations = {
+        "load_data": None,
+        "lazy, batch_size=1000": {"batch_size": 1000},
+        "lazy, batch_size=1000, 4 workers": {"batch_size": 1000, "num_workers": 4},
+    }
+    try:
+        for name, kwargs in configurations.items():
+            start = time.perf_counter()
+            if kwargs is None:
+                count = len(reader.load_data(args.db, "docs"))
+            else:
+                count = sum(1 for _ in reader.lazy_load_data(args.db, "docs", **kwargs))
+            elapsed = time.perf_counter() - start
+            assert count == args.docs
+            print(f"{name:40} {count / elapsed:10.1f} docs/s")
+    finally:
+        collection.drop()
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,95 @@
+from unittest.mock import patch
+
+import pytest
+
+mongomock = pytest.importorskip("mongomock")
+
+from llama_hub.mongo.base import SimpleMongoReader  # noqa: E402
+
+
+@pytest.fixture()
+def reader():
+    with patch("pymongo.MongoClient", mongomock.MongoClient):
+        reader = SimpleMongoReader(uri="mongodb://localhost:27017")
+    collection = reader.client["db"]["docs"]
+    collection.insert_many(
+        [
+            {"_id": i, "title": f"title{i}", "text": f"text{i}", "page": i % 3}
+            for i in range(1, 21)
+        ]
+    )
+    return reader
+
+
+def test_load_data(reader):
+    documents = reader.load_data(
+        "db",
+        "docs",
+        field_names=["title", "text"],
+        separator=" ",
+        query_dict={"page": 1},
+        max_docs=2,
+        metadata_names=["page"],
+    )
+    assert [doc.text for doc in documents] == ["title1 text1", "title4 text4"]
+    assert documents[0].metadata == {"page": 1}
+
+
+def test_load_data_missing_field(reader):
+    with pytest.raises(ValueError, match="missing field not found"):
+        reader.load_data("db", "docs", field_names=["missing"])
+
+
+def test_lazy_load_data_projection(reader):
+    find_range = reader._find_range
+    calls = []
+
+    def record_find_range(collection, query, projection, batch_size, *args, **kwargs):
+        calls.append((dict(projection), batch_size))
+        return find_range(collection, query, projection, batch_size, *args, **kwargs)
+
+    with patch.object(reader, "_find_range", side_effect=record_find_range):
+        documents = list(
+            reader.lazy_load_data("db", "docs", metadata_names=["page"], batch_size=5)
+        )
+    assert len(documents) == 20
+    assert calls == [({"text": 1, "page": 1}, 5)]
+
+
+def test_lazy_load_data_resume(reader):
+    documents = reader.lazy_load_data("db", "docs")
+    for _ in range(5):
+        next(documents)
+    # the 5th document is still being processed
+    last_id = reader.get_last_id()
+    assert last_id == 4
+    documents.close()
+
+    resumed = list(reader.lazy_load_data("db", "docs", resume_after_id=last_id))
+    assert [doc.text for doc in resumed] == [f"text{i}" for i in range(5, 21)]
+    assert reader.get_last_id() == 20
+
+
+def test_lazy_load_data_parallel(reader):
+    documents = list(
+        reader.lazy_load_data(
+            "db", "docs", query_dict={"page": {"$ne": 0}}, batch_size=2, num_workers=4
+        )
+    )
+    expected = [f"text{i}" for i in range(1, 21) if i % 3 != 0]
+    assert sorted(doc.text for doc in documents) == sorted(expected)
+    assert reader.get_last_id() == 20
+
+
+def test_lazy_load_data_parallel_resume(reader):
+    documents = reader.lazy_load_data("db", "docs", batch_size=2, num_workers=4)
+    loaded = [next(documents).text for _ in range(7)]
+    last_id = reader.get_last_id()
+    documents.close()
+
+    resumed = list(reader.lazy_load_data("db", "docs", resume_after_id=last_id))
+    # every document is loaded at least once
+    loaded_ids = {int(text[4:]) for text in loaded}
+    resumed_ids = {int(doc.text[4:]) for doc in resumed}
+    assert loaded_ids | resumed_ids == set(range(1, 21))
+    assert all(i > (last_id or 0) for i in resumed_ids)
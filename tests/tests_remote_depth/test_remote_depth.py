@@ -0,0 +1,52 @@
+import pytest
+from pytest_httpserver import HTTPServer
+
+from llama_hub.remote_depth.base import RemoteDepthReader
+
+
+@pytest.fixture()
+def httpserver():
+    # a server of its own: the session server listens where the first module
+    # using it asks, and other modules configure a fixed address
+    server = HTTPServer()
+    server.start()
+    yield server
+    server.clear()
+    server.stop()
+
+
+@pytest.fixture()
+def site(httpserver):
+    for path, body in [
+        ("/", '<a href="/a">a</a> <a href="/b?page=2">b</a>'),
+        ("/a", '<a href="/">home</a> page a'),
+        ("/b", "page b"),
+    ]:
+        httpserver.expect_request(
+            path, headers={"User-Agent": "Magic Browser"}
+        ).respond_with_data(body, content_type="text/html")
+    return httpserver
+
+
+def test_load_data(site):
+    reader = RemoteDepthReader(depth=1)
+
+    documents = reader.load_data(site.url_for("/"))
+
+    assert [doc.extra_info["Source"] for doc in documents] == [
+        site.url_for("/"),
+        site.url_for("/a"),
+        site.url_for("/b"),
+    ]
+    # robots.txt is only read with respect_robots=True
+    assert "/robots.txt" not in [request.path for request, _ in site.log]
+
+
+@pytest.mark.asyncio
+async def test_load_data_inside_running_loop(site):
+    reader = RemoteDepthReader(depth=0)
+
+    documents = reader.load_data(site.url_for("/"))
+
+    # the links of the start page are loaded at depth 0
+    assert len(documents) == 3
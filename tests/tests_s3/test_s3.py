@@ -0,0 +1,82 @@
+import os
+
+import pytest
+
+boto3 = pytest.importorskip("boto3")
+moto = pytest.importorskip("moto")
+
+from llama_hub.s3.base import S3Reader  # noqa: E402
+
+BUCKET = "test-bucket"
+OBJECTS = {
+    "docs/a/notes.txt": "notes of a",
+    "docs/b/notes.txt": "notes of b",
+    "docs/c.txt": "c",
+    "docs/skipped.csv": "x,y",
+    "other/d.txt": "d",
+}
+
+
+@pytest.fixture()
+def s3_bucket(monkeypatch):
+    monkeypatch.setenv("AWS_ACCESS_KEY_ID", "testing")
+    monkeypatch.setenv("AWS_SECRET_ACCESS_KEY", "testing")
+    monkeypatch.setenv("AWS_DEFAULT_REGION", "us-east-1")
+    with moto.mock_aws():
+        s3 = boto3.client("s3")
+        s3.create_bucket(Bucket=BUCKET)
+        for key, body in OBJECTS.items():
+            s3.put_object(Bucket=BUCKET, Key=key, Body=body.encode())
+        yield s3
+
+
+def texts(documents):
+    return sorted(document.text for document in documents)
+
+
+def test_load_data_preserves_keys(s3_bucket):
+    reader = S3Reader(
+        bucket=BUCKET, prefix="docs/", required_exts=[".txt"], num_workers=2
+    )
+
+    documents = reader.load_data()
+
+    assert texts(documents) == ["c", "notes of a", "notes of b"]
+
+
+def test_load_data_single_key(s3_bucket):
+    reader = S3Reader(bucket=BUCKET, key="other/d.txt")
+
+    assert texts(reader.load_data()) == ["d"]
+
+
+def test_lazy_load_data_with_byte_budget(s3_bucket):
+    reader = S3Reader(
+        bucket=BUCKET,
+        prefix="docs/",
+        required_exts=[".txt"],
+        max_in_flight_bytes=1,
+    )
+
+    documents = list(reader.lazy_load_data())
+
+    assert texts(documents) == ["c", "notes of a", "notes of b"]
+
+
+def test_etag_manifest_skips_unchanged_objects(s3_bucket, tmp_path):
+    manifest_path = str(tmp_path / "etags.json")
+    reader = S3Reader(
+        bucket=BUCKET,
+        prefix="docs/",
+        required_exts=[".txt"],
+        etag_manifest_path=manifest_path,
+    )
+
+    assert len(list(reader.lazy_load_data())) == 3
+    assert os.path.exists(manifest_path)
+    assert list(reader.lazy_load_data()) == []
+
+    s3_bucket.put_object(Bucket=BUCKET, Key="docs/c.txt", Body=b"c changed")
+
+    assert texts(reader.load_data()) == ["c changed"]
+    assert reader.load_data() == []
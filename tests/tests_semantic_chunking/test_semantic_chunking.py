@@ -0,0 +1,172 @@
+import math
+from typing import List
+
+import numpy as np
+import pytest
+from llama_index.bridge.pydantic import Field
+from llama_index.embeddings.base import BaseEmbedding
+from llama_index.schema import Document
+
+from llama_hub.llama_packs.node_parser.semantic_chunking.base import (
+    SemanticChunker,
+    calculate_cosine_distances,
+    combine_sentences,
+)
+
+TOPICS = ["cat", "dog", "car"]
+
+
+class CountingEmbedding(BaseEmbedding):
+    """Embeds a text as the counts of a few topic words, recording each batch."""
+
+    batch_sizes: List[int] = Field(default_factory=list)
+
+    @classmethod
+    def class_name(cls) -> str:
+        return "CountingEmbedding"
+
+    def _embed(self, text: str) -> List[float]:
+        words = text.lower().replace(".", "").split()
+        return [float(words.count(topic)) for topic in TOPICS] + [0.1]
+
+    def _get_query_embedding(self, query: str) -> List[float]:
+        return self._embed(query)
+
+    async def _aget_query_embedding(self, query: str) -> List[float]:
+        return self._embed(query)
+
+    def _get_text_embedding(self, text: str) -> List[float]:
+        return self._embed(text)
+
+    def _get_text_embeddings(self, texts: List[str]) -> List[List[float]]:
+        self.batch_sizes.append(len(texts))
+        return [self._embed(text) for text in texts]
+
+    async def _aget_text_embeddings(self, texts: List[str]) -> List[List[float]]:
+        return self._get_text_embeddings(texts)
+
+
+CAT_DOG_TEXT = "The cat sat. A cat purrs. A dog barks. The dog runs. A car drives."
+
+
+@pytest.mark.parametrize(
+    "buffer_size,expected",
+    [
+        (0, ["a", "b", "c"]),
+        (1, ["a b", "a b c", "b c"]),
+        (2, ["a b c", "a b c", "a b c"]),
+        (5, ["a b c", "a b c", "a b c"]),
+    ],
+)
+def test_combine_sentences(buffer_size, expected):
+    assert combine_sentences(["a", "b", "c"], buffer_size) == expected
+
+
+def test_combine_sentences_single_and_no_sentence():
+    assert combine_sentences(["a"], buffer_size=1) == ["a"]
+    assert combine_sentences([], buffer_size=1) == []
+
+
+def test_calculate_cosine_distances():
+    embeddings = np.array([[1.0, 0.0], [0.0, 1.0], [1.0, 1.0], [-2.0, -2.0]])
+
+    distances = calculate_cosine_distances(embeddings)
+
+    # 1 - cos: orthogonal, 45 degrees apart, opposite, then 0 for the last one
+    np.testing.assert_allclose(
+        distances, [1.0, 1.0 - 1.0 / math.sqrt(2.0), 2.0, 0.0], atol=1e-6
+    )
+
+
+def test_calculate_cosine_distances_ignores_norms():
+    embeddings = np.array([[3.0, 4.0], [6.0, 8.0], [0.3, 0.4]])
+
+    np.testing.assert_allclose(
+        calculate_cosine_distances(embeddings), [0.0, 0.0, 0.0], atol=1e-6
+    )
+
+
+def test_calculate_cosine_distances_single_and_no_sentence():
+    np.testing.assert_array_equal(
+        calculate_cosine_distances(np.array([[1.0, 2.0]])), [0.0]
+    )
+    assert calculate_cosine_distances(np.zeros((0, 2))).shape == (0,)
+
+
+def test_calculate_cosine_distances_zero_norm():
+    embeddings = np.array([[0.0, 0.0], [1.0, 0.0], [0.0, 0.0]])
+
+    distances = calculate_cosine_distances(embeddings)
+
+    # a zero embedding is similar to nothing, rather than a division by zero
+    assert not np.isnan(distances).any()
+    np.testing.assert_allclose(distances, [1.0, 1.0, 0.0], atol=1e-6)
+
+
+def test_semantic_chunker_embeds_in_batches():
+    embed_model = CountingEmbedding(embed_batch_size=2)
+    chunker = SemanticChunker(
+        buffer_size=0, embed_model=embed_model, breakpoint_percentile_threshold=50
+    )
+
+    chunks = chunker.split_text(CAT_DOG_TEXT)
+
+    assert chunks == [
+        "The cat sat. A cat purrs.",
+        "A dog barks. The dog runs.",
+        "A car drives.",
+    ]
+    assert embed_model.batch_sizes == [2, 2, 1]
+
+
+def test_semantic_chunker_embedding_cache():
+    embed_model = CountingEmbedding(embed_batch_size=10)
+    cache = {}
+    chunker = SemanticChunker(
+        buffer_size=0, embed_model=embed_model, embedding_cache=cache
+    )
+
+    # repeated windows are only embedded once
+    chunker.split_text("A cat. A cat. A dog.")
+    assert embed_model.batch_sizes == [2]
+    assert len(cache) == 2
+
+    # a second run, or another chunker sharing the cache, hits the cache
+    chunks = chunker.split_text("A cat. A cat. A dog.")
+    other_chunker = SemanticChunker(
+        buffer_size=0, embed_model=embed_model, embedding_cache=cache
+    )
+    assert other_chunker.split_text("A cat. A cat. A dog.") == chunks
+    assert embed_model.batch_sizes == [2]
+
+    # only the new windows are embedded
+    chunker.split_text("A dog. A car.")
+    assert embed_model.batch_sizes == [2, 1]
+
+
+def test_semantic_chunker_async_nodes_match_sync_split():
+    documents = [
+        Document(text=CAT_DOG_TEXT),
+        Document(text="A car drives. The car stops. A cat watches. The cat leaves."),
+    ]
+    embed_model = CountingEmbedding(embed_batch_size=4)
+    chunker = SemanticChunker(
+        buffer_size=1, embed_model=embed_model, breakpoint_percentile_threshold=50
+    )
+
+    nodes = chunker.get_nodes_from_documents(documents)
+
+    # the windows of both documents are embedded together
+    assert embed_model.batch_sizes == [4, 4, 1]
+
+    sync_chunker = SemanticChunker(
+        buffer_size=1,
+        embed_model=CountingEmbedding(embed_batch_size=4),
+        breakpoint_percentile_threshold=50,
+    )
+    expected = [
+        (document.doc_id, chunk)
+        for document in documents
+        for chunk in sync_chunker.split_text(document.text)
+    ]
+    assert [(node.ref_doc_id, node.get_content()) for node in nodes] == expected
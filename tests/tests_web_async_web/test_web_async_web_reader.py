@@ -1,3 +1,4 @@
+import asyncio
 import unittest
 
 import pytest
@@ -14,6 +15,7 @@ def httpserver_listen_address():
 TEST_URL = "http://localhost:8888/primary.xml"
 TEST_URL_OTHER = "http://localhost:8888/other.xml"
 TEST_URL_ERROR = "http://localhost:8888/failme"
+TEST_URL_HTML = "http://localhost:8888/page.html"
 
 
 class TestAsyncWebPageReader(unittest.TestCase):
@@ -31,6 +33,10 @@ class TestAsyncWebPageReader(unittest.TestCase):
         httpserver.expect_request("/primary.xml", method="GET").respond_with_data(
             "Some big data chunk!"
         )
+        httpserver.expect_request("/page.html", method="GET").respond_with_data(
+            "<html><body><h1>Title</h1><p>Some text.</p></body></html>",
+            content_type="text/html",
+        )
 
     def test_async_web_reader_init(self):
         # test w/o args
@@ -86,3 +92,26 @@ class TestAsyncWebPageReader(unittest.TestCase):
         assert documents[0].extra_info["Source"] == "http://localhost:8888/primary.xml"
         assert documents[1].text == "Some big data chunk!"
         assert documents[1].extra_info["Source"] == "http://localhost:8888/other.xml"
+
+    def test_async_web_reader_alazy_load_data(self):
+        reader = AsyncWebPageReader(limit=1, max_in_flight_bytes=1)
+
+        async def collect():
+            urls = (url for url in [TEST_URL, TEST_URL_ERROR, TEST_URL_OTHER])
+            return [document async for document in reader.alazy_load_data(urls)]
+
+        documents = asyncio.run(collect())
+
+        assert [document.extra_info["Source"] for document in documents] == [
+            TEST_URL,
+            TEST_URL_OTHER,
+        ]
+
+    def test_async_web_reader_html_to_text_workers(self):
+        reader = AsyncWebPageReader(html_to_text=True, num_workers=2)
+
+        documents = reader.load_data(urls=[TEST_URL_HTML, TEST_URL])
+
+        assert len(documents) == 2
+        assert documents[0].text.strip() == "# Title\n\nSome text."
+        assert documents[1].text.strip() == "Some big data chunk!"
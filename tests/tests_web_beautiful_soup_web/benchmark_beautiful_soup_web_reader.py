@@ -0,0 +1,86 @@
+"""Benchmark BeautifulSoupWebReader over a local fixture site.
+
+Serves generated pages from a local HTTP server, with a simulated network
+latency, and prints the pages per second of several reader configurations.
+
+Usage:
+    python tests/tests_web_beautiful_soup_web/benchmark_beautiful_soup_web_reader.py
+"""
+
+import argparse
+import threading
+import time
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+
+from llama_hub.web.beautiful_soup_web.base import BeautifulSoupWebReader
+
+PARAGRAPH = "<p>" + "Lorem ipsum dolor sit amet, consectetur adipiscing. " * 20 + "</p>"
+
+
+def make_handler(latency: float, paragraphs: int) -> type:
+    page = f"<html><body><h1>Title</h1>{PARAGRAPH * paragraphs}</body></html>"
+    body = page.encode()
+
+    class Handler(BaseHTTPRequestHandler):
+        protocol_version = "HTTP/1.1"
+
+        def do_GET(self) -> None:
+            time.sleep(latency)
+            self.send_response(200)
+            self.send_header("Content-Type", "text/html")
+            self.send_header("Content-Length", str(len(body)))
+            self.end_headers()
+            self.wfile.write(body)
+
+        def log_message(self, *args) -> None:
+            pass
+
+    return Handler
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--pages", type=int, default=200)
+    parser.add_argument("--latency", type=float, default=0.02)
+    parser.add_argument("--paragraphs", type=int, default=50)
+    args = parser.parse_args()
+
+    server = ThreadingHTTPServer(
+        ("127.0.0.1", 0), make_handler(args.latency, args.paragraphs)
+    )
+    threading.Thread(target=server.serve_forever, daemon=True).start()
+    urls = [
+        f"http://127.0.0.1:{server.server_port}/page{i}.html" for i in range(args.pages)
+    ]
+
+    configurations = {
+        "serial": {"num_workers": 1},
+        "16 fetch threads": {"num_workers": 16},
+        "16 fetch threads, 4 parse processes": {
+            "num_workers": 16,
+            "num_parse_workers": 4,
+        },
+    }
+    try:
+        import lxml  # noqa: F401
+
+        configurations["16 fetch threads, lxml"] = {
+            "num_workers": 16,
+            "parser": "lxml",
+        }
+    except ImportError:
+        pass
+
+    for name, kwargs in configurations.items():
+        reader = BeautifulSoupWebReader(**kwargs)
+        start = time.perf_counter()
+        documents = reader.load_data(urls)
+        elapsed = time.perf_counter() - start
+        assert len(documents) == len(urls)
+        print(f"{name:40} {len(urls) / elapsed:8.1f} pages/s")
+
+    server.shutdown()
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,92 @@
+import threading
+from unittest.mock import patch
+
+import pytest
+
+from llama_hub.web.beautiful_soup_web.base import (
+    BeautifulSoupWebReader,
+    _SessionPerThread,
+)
+
+PAGE = "<html><body><h1>Page {i}</h1><p>Text of page {i}.</p></body></html>"
+DOCS_INDEX = """<html><body>
+<a class="reference internal" href="/docs/one.html">One</a>
+<a class="reference internal" href="/docs/two.html">Two</a>
+</body></html>"""
+DOCS_PAGE = '<html><body><div role="main"><p>{name} docs</p></div></body></html>'
+
+
+@pytest.fixture()
+def site(httpserver):
+    for i in range(6):
+        httpserver.expect_request(f"/page{i}.html").respond_with_data(
+            PAGE.format(i=i), content_type="text/html"
+        )
+    httpserver.expect_request("/docs/index.html").respond_with_data(
+        DOCS_INDEX, content_type="text/html"
+    )
+    for name in ["one", "two"]:
+        httpserver.expect_request(f"/docs/{name}.html").respond_with_data(
+            DOCS_PAGE.format(name=name), content_type="text/html"
+        )
+    return httpserver
+
+
+@pytest.mark.parametrize("num_parse_workers", [0, 2])
+def test_load_data_concurrently(site, num_parse_workers):
+    urls = [site.url_for(f"/page{i}.html") for i in range(6)]
+    reader = BeautifulSoupWebReader(num_workers=3, num_parse_workers=num_parse_workers)
+
+    documents = reader.load_data(urls)
+
+    assert [document.extra_info["URL"] for document in documents] == urls
+    assert [document.text for document in documents] == [
+        f"Page {i}Text of page {i}." for i in range(6)
+    ]
+
+
+def test_load_data_readthedocs_subpages(site):
+    reader = BeautifulSoupWebReader()
+
+    documents = reader.load_data(
+        [site.url_for("/docs/index.html")], custom_hostname="readthedocs.io"
+    )
+
+    assert len(documents) == 1
+    assert documents[0].text == "one docs\ntwo docs"
+
+
+def test_lxml_parser(site):
+    pytest.importorskip("lxml")
+    reader = BeautifulSoupWebReader(parser="lxml")
+
+    documents = reader.load_data([site.url_for("/page0.html")])
+
+    assert documents[0].text == "Page 0Text of page 0."
+
+
+def test_invalid_url():
+    reader = BeautifulSoupWebReader()
+
+    with pytest.raises(ValueError, match="One of the inputs is not a valid url"):
+        reader.load_data(["not a url"])
+
+
+def test_session_per_thread():
+    with patch("requests.Session.close", autospec=True) as close:
+        with _SessionPerThread() as sessions:
+            main_session = sessions.get()
+            assert sessions.get() is main_session
+
+            thread_sessions = []
+            thread = threading.Thread(
+                target=lambda: thread_sessions.append(sessions.get())
+            )
+            thread.start()
+            thread.join()
+            assert thread_sessions[0] is not main_session
+            close.assert_not_called()
+
+    assert sorted(map(id, (call.args[0] for call in close.call_args_list))) == sorted(
+        [id(main_session), id(thread_sessions[0])]
+    )
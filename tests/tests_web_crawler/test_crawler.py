@@ -0,0 +1,122 @@
+import asyncio
+from collections import Counter
+
+import pytest
+
+from llama_hub.web.crawler import CrawlFrontier, normalize_url, run_sync
+
+SITE = {
+    "http://example.com/": ["/a", "b#section", "http://other.com/"],
+    "http://example.com/a": ["/", "/b", "/a/deep"],
+    "http://example.com/b": ["/a?x=1", "/private/page"],
+    "http://example.com/a/deep": ["/a/deeper"],
+}
+
+
+def crawl(frontier, start_urls, links=SITE):
+    fetched = Counter()
+
+    async def fetch(url):
+        fetched[url] += 1
+        await asyncio.sleep(0)
+        return url.upper(), links.get(url, [])
+
+    async def run():
+        return [page async for page in frontier.crawl(start_urls, fetch)]
+
+    return asyncio.run(run()), fetched
+
+
+def test_normalize_url():
+    assert normalize_url("HTTP://Example.COM:80") == "http://example.com/"
+    assert normalize_url("https://example.com:443/a#b") == "https://example.com/a"
+    assert normalize_url("https://example.com:8443/a") == "https://example.com:8443/a"
+    assert normalize_url("../c?q=1", "http://example.com/a/b") == (
+        "http://example.com/c?q=1"
+    )
+    assert normalize_url("/c?q=1", "http://example.com/", strip_query=True) == (
+        "http://example.com/c"
+    )
+
+
+def test_crawl_breadth_first_and_dedupe():
+    frontier = CrawlFrontier(
+        max_depth=2,
+        allow_url=lambda url: url.startswith("http://example.com/"),
+        respect_robots=False,
+    )
+
+    pages, fetched = crawl(frontier, ["http://example.com"])
+
+    assert set(fetched.values()) == {1}
+    ordered = sorted(pages, key=lambda page: page.index)
+    assert [(page.url, page.depth) for page in ordered] == [
+        ("http://example.com/", 0),
+        ("http://example.com/a", 1),
+        ("http://example.com/b", 1),
+        ("http://example.com/a/deep", 2),
+        ("http://example.com/a?x=1", 2),
+        ("http://example.com/private/page", 2),
+    ]
+    assert ordered[1].content == "HTTP://EXAMPLE.COM/A"
+
+
+def test_crawl_per_domain_concurrency():
+    links = {"http://example.com/": [f"/{i}" for i in range(10)]}
+    running = Counter()
+    max_running = Counter()
+
+    async def fetch(url):
+        domain = url.split("/")[2]
+        running[domain] += 1
+        max_running[domain] = max(max_running[domain], running[domain])
+        await asyncio.sleep(0.01)
+        running[domain] -= 1
+        return None, links.get(url, [])
+
+    async def run():
+        frontier = CrawlFrontier(
+            max_concurrency=8, max_per_domain=3, respect_robots=False
+        )
+        return [page async for page in frontier.crawl(["http://example.com/"], fetch)]
+
+    pages = asyncio.run(run())
+
+    assert len(pages) == 11
+    assert max_running["example.com"] == 3
+
+
+@pytest.fixture()
+def robots_site(httpserver):
+    httpserver.expect_request("/robots.txt").respond_with_data(
+        "User-agent: *\nDisallow: /private/\n"
+    )
+    base = httpserver.url_for("/")
+    return base, {
+        base: ["/public", "/private/page"],
+    }
+
+
+def test_crawl_respects_robots(robots_site):
+    base, links = robots_site
+    frontier = CrawlFrontier(max_depth=1)
+
+    pages, fetched = crawl(frontier, [base], links)
+
+    assert sorted(page.url for page in pages) == [base, base + "public"]
+    assert base + "private/page" not in fetched
+
+
+async def double(value):
+    await asyncio.sleep(0)
+    return 2 * value
+
+
+def test_run_sync():
+    assert run_sync(double(21)) == 42
+
+
+@pytest.mark.asyncio
+async def test_run_sync_inside_running_loop():
+    # asyncio.run would fail here, the coroutine runs in a worker thread
+    assert run_sync(double(21)) == 42
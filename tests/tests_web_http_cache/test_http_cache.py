@@ -0,0 +1,141 @@
+import asyncio
+import os
+import threading
+
+import pytest
+from werkzeug.wrappers import Request, Response
+
+from llama_hub.web.http_cache import HTTPResponseCache
+from llama_hub.web.simple_web.base import SimpleWebPageReader
+
+
+def etag_handler(request: Request) -> Response:
+    if request.headers.get("If-None-Match") == '"v1"':
+        return Response(status=304)
+    return Response(
+        "<p>Page</p>", content_type="text/html; charset=utf-8", headers={"ETag": '"v1"'}
+    )
+
+
+@pytest.fixture()
+def site(httpserver):
+    httpserver.expect_request("/etag").respond_with_handler(etag_handler)
+    for name in ["a", "b", "c", "same"]:
+        httpserver.expect_request(f"/{name}").respond_with_data(
+            "x" * 100 if name != "same" else "<p>Page</p>"
+        )
+    httpserver.expect_request("/missing").respond_with_data("Not found", status=404)
+    return httpserver
+
+
+def request_count(httpserver, path):
+    return sum(1 for request, _ in httpserver.log if request.path == path)
+
+
+def test_revalidates_with_etag(site, tmp_path):
+    cache = HTTPResponseCache(str(tmp_path))
+    url = site.url_for("/etag")
+
+    first = cache.get(url)
+    second = cache.get(url)
+
+    assert not first.from_cache
+    assert second.from_cache
+    assert second.text == first.text == "<p>Page</p>"
+    assert second.encoding == "utf-8"
+    assert [response.status_code for _, response in site.log] == [200, 304]
+
+
+def test_ttl_serves_without_network(site, tmp_path):
+    cache = HTTPResponseCache(str(tmp_path), ttl=3600)
+    url = site.url_for("/a")
+
+    cache.get(url)
+    response = cache.get(url)
+
+    assert response.from_cache
+    assert request_count(site, "/a") == 1
+
+
+def test_errors_are_not_cached(site, tmp_path):
+    cache = HTTPResponseCache(str(tmp_path), ttl=3600)
+    url = site.url_for("/missing")
+
+    assert cache.get(url).status == 404
+    assert cache.get(url).status == 404
+    assert cache.lookup(url) is None
+    assert request_count(site, "/missing") == 2
+
+
+def test_bodies_are_content_addressed(site, tmp_path):
+    cache = HTTPResponseCache(str(tmp_path))
+
+    cache.get(site.url_for("/etag"))
+    cache.get(site.url_for("/same"))
+
+    bodies = [files for _, _, files in os.walk(tmp_path / "bodies") if files]
+    assert len(bodies) == 1 and len(bodies[0]) == 1
+
+
+def test_evicts_least_recently_used(site, tmp_path):
+    cache = HTTPResponseCache(str(tmp_path), ttl=3600, max_size_bytes=250)
+
+    cache.get(site.url_for("/a"))
+    cache.get(site.url_for("/b"))
+    cache.get(site.url_for("/a"))
+    cache.get(site.url_for("/c"))
+
+    assert cache.lookup(site.url_for("/b")) is None
+    assert cache.lookup(site.url_for("/a")) is not None
+    assert cache.lookup(site.url_for("/c")) is not None
+
+
+def test_async_get(site, tmp_path):
+    aiohttp = pytest.importorskip("aiohttp")
+    cache = HTTPResponseCache(str(tmp_path))
+    url = site.url_for("/etag")
+
+    async def get_twice():
+        async with aiohttp.ClientSession() as session:
+            return [await cache.aget(url, session) for _ in range(2)]
+
+    first, second = asyncio.run(get_twice())
+
+    assert not first.from_cache
+    assert second.from_cache
+    assert second.text == "<p>Page</p>"
+    assert [response.status_code for _, response in site.log] == [200, 304]
+
+
+def test_async_get_does_not_block_event_loop(site, tmp_path, monkeypatch):
+    aiohttp = pytest.importorskip("aiohttp")
+    cache = HTTPResponseCache(str(tmp_path))
+    threads = []
+    for name in ["_lookup", "_touch", "store"]:
+        method = getattr(cache, name)
+
+        def record(*args, method=method, **kwargs):
+            threads.append(threading.get_ident())
+            return method(*args, **kwargs)
+
+        monkeypatch.setattr(cache, name, record)
+
+    async def get_twice():
+        async with aiohttp.ClientSession() as session:
+            return [await cache.aget(site.url_for("/etag"), session) for _ in range(2)]
+
+    asyncio.run(get_twice())
+
+    # lookup, store, then lookup and touch after the 304
+    assert len(threads) == 4
+    assert threading.get_ident() not in threads
+
+
+def test_simple_web_page_reader_with_cache(site, tmp_path):
+    reader = SimpleWebPageReader(cache=HTTPResponseCache(str(tmp_path), ttl=3600))
+
+    reader.load_data([site.url_for("/a")])
+    documents = reader.load_data([site.url_for("/a")])
+
+    assert documents[0].text == "x" * 100
+    assert request_count(site, "/a") == 1
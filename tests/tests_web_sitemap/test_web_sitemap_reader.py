@@ -1,3 +1,8 @@
+import gzip
+import io
+import json
+import os
+import tempfile
 import unittest
 from unittest.mock import patch
 
@@ -8,18 +13,55 @@ from llama_hub.web.sitemap.base import SitemapReader
 
 MOCK_URL = "https://gpt-index.readthedocs.io/sitemap.xml"
 
+SITEMAP_INDEX = """<?xml version="1.0" encoding="UTF-8"?>
+<sitemapindex xmlns="http://www.sitemaps.org/schemas/sitemap/0.9">
+  <sitemap>
+    <loc>https://example.com/pages.xml.gz</loc>
+    <lastmod>2023-03-02</lastmod>
+  </sitemap>
+  <sitemap>
+    <loc>https://example.com/old.xml</loc>
+    <lastmod>2023-01-01</lastmod>
+  </sitemap>
+</sitemapindex>
+"""
+
+PAGES_SITEMAP = """<?xml version="1.0" encoding="UTF-8"?>
+<urlset xmlns="http://www.sitemaps.org/schemas/sitemap/0.9">
+  <url>
+    <loc>https://example.com/a</loc>
+    <lastmod>2023-01-15T00:00:00Z</lastmod>
+  </url>
+  <url>
+    <loc>https://example.com/b</loc>
+    <lastmod>2023-03-01T12:00:00+00:00</lastmod>
+  </url>
+  <url>
+    <loc>https://example.com/c</loc>
+  </url>
+</urlset>
+"""
+
 
 def get_sitemapdata():
     f = open("tests/tests_web_sitemap/test_sitemap.xml", "r")
     return f.read()
 
 
-def dummy_load_pages(urls: str):
-    documents = []
-    for u in urls:
-        doc = Document(text="Bla", extra_info={"Source": u})
-        documents.append(doc)
-    return documents
+async def dummy_load_pages(urls, failing=(), redirects={}):
+    if not hasattr(urls, "__aiter__"):
+        urls = aiter_list(urls)
+    index = 0
+    async for u in urls:
+        if u not in failing:
+            source = redirects.get(u, u)
+            yield index, u, Document(text="Bla", extra_info={"Source": source})
+        index += 1
+
+
+async def aiter_list(items):
+    for item in items:
+        yield item
 
 
 class TestSitemapReader(unittest.TestCase):
@@ -39,14 +81,13 @@ class TestSitemapReader(unittest.TestCase):
         ):
             sitemap_reader.load_data()
 
-    @patch("llama_hub.web.async_web.base.AsyncWebPageReader.load_data")
+    @patch("llama_hub.web.async_web.base.AsyncWebPageReader.alazy_load_data_with_urls")
     def test_sitemap_reader_load_data(self, mock_load_data):
         with patch("urllib.request.urlopen") as mock_urlopen:
             sitemap_reader = SitemapReader()
 
             # mock sitemap call
-            mock_response = mock_urlopen.return_value
-            mock_response.read.return_value = get_sitemapdata()
+            mock_urlopen.return_value = io.BytesIO(get_sitemapdata().encode())
 
             mock_load_data.side_effect = dummy_load_pages
 
@@ -55,18 +96,16 @@ class TestSitemapReader(unittest.TestCase):
             mock_urlopen.assert_called_once_with(
                 "https://gpt-index.readthedocs.io/sitemap.xml"
             )
-            mock_response.read.assert_called_once()
             assert mock_load_data.call_count == 1
             assert len(documents) == 38
 
-    @patch("llama_hub.web.async_web.base.AsyncWebPageReader.load_data")
+    @patch("llama_hub.web.async_web.base.AsyncWebPageReader.alazy_load_data_with_urls")
     def test_sitemap_reader_load_data_with_filter(self, mock_load_data):
         with patch("urllib.request.urlopen") as mock_urlopen:
             sitemap_reader = SitemapReader()
 
             # mock sitemap call
-            mock_response = mock_urlopen.return_value
-            mock_response.read.return_value = get_sitemapdata()
+            mock_urlopen.return_value = io.BytesIO(get_sitemapdata().encode())
 
             mock_load_data.side_effect = dummy_load_pages
 
@@ -78,10 +117,192 @@ class TestSitemapReader(unittest.TestCase):
             mock_urlopen.assert_called_once_with(
                 "https://gpt-index.readthedocs.io/sitemap.xml"
             )
-            mock_response.read.assert_called_once()
             assert mock_load_data.call_count == 1
             assert len(documents) == 1
             assert (
                 documents[0].extra_info["Source"]
                 == "https://gpt-index.readthedocs.io/en/latest/"
             )
+
+    @patch("llama_hub.web.async_web.base.AsyncWebPageReader.alazy_load_data_with_urls")
+    def test_sitemap_reader_load_data_sitemap_index(self, mock_load_data):
+        sitemaps = {
+            "https://example.com/sitemap.xml": SITEMAP_INDEX.encode(),
+            "https://example.com/pages.xml.gz": gzip.compress(PAGES_SITEMAP.encode()),
+            "https://example.com/old.xml": PAGES_SITEMAP.encode(),
+        }
+        with patch("urllib.request.urlopen") as mock_urlopen:
+            mock_urlopen.side_effect = lambda url: io.BytesIO(sitemaps[url])
+            mock_load_data.side_effect = dummy_load_pages
+
+            documents = SitemapReader().load_data(
+                sitemap_url="https://example.com/sitemap.xml"
+            )
+
+        assert [document.extra_info["Source"] for document in documents] == [
+            "https://example.com/a",
+            "https://example.com/b",
+            "https://example.com/c",
+        ] * 2
+
+    @patch("llama_hub.web.async_web.base.AsyncWebPageReader.alazy_load_data_with_urls")
+    def test_sitemap_reader_load_data_watermark(self, mock_load_data):
+        sitemaps = {
+            "https://example.com/sitemap.xml": SITEMAP_INDEX.encode(),
+            "https://example.com/pages.xml.gz": gzip.compress(PAGES_SITEMAP.encode()),
+            "https://example.com/old.xml": PAGES_SITEMAP.encode(),
+        }
+        with tempfile.TemporaryDirectory() as tmp_dir, patch(
+            "urllib.request.urlopen"
+        ) as mock_urlopen:
+            watermark_path = os.path.join(tmp_dir, "watermark.json")
+            with open(watermark_path, "w") as f:
+                json.dump({"https://example.com/sitemap.xml": "2023-02-01"}, f)
+            mock_urlopen.side_effect = lambda url: io.BytesIO(sitemaps[url])
+            mock_load_data.side_effect = dummy_load_pages
+            sitemap_reader = SitemapReader(watermark_path=watermark_path)
+
+            documents = sitemap_reader.load_data(
+                sitemap_url="https://example.com/sitemap.xml"
+            )
+
+            # old.xml was not modified since the watermark, page a neither
+            assert [document.extra_info["Source"] for document in documents] == [
+                "https://example.com/b",
+                "https://example.com/c",
+            ]
+            with open(watermark_path) as f:
+                assert json.load(f) == {
+                    "https://example.com/sitemap.xml": "2023-03-01T12:00:00+00:00"
+                }
+
+            documents = sitemap_reader.load_data(
+                sitemap_url="https://example.com/sitemap.xml"
+            )
+
+            # only pages without lastmod are loaded again
+            assert [document.extra_info["Source"] for document in documents] == [
+                "https://example.com/c",
+            ]
+
+    @patch("llama_hub.web.async_web.base.AsyncWebPageReader.alazy_load_data_with_urls")
+    def test_sitemap_reader_load_data_watermark_failed_page(self, mock_load_data):
+        sitemaps = {
+            "https://example.com/sitemap.xml": SITEMAP_INDEX.encode(),
+            "https://example.com/pages.xml.gz": gzip.compress(PAGES_SITEMAP.encode()),
+            "https://example.com/old.xml": PAGES_SITEMAP.encode(),
+        }
+        with tempfile.TemporaryDirectory() as tmp_dir, patch(
+            "urllib.request.urlopen"
+        ) as mock_urlopen:
+            watermark_path = os.path.join(tmp_dir, "watermark.json")
+            mock_urlopen.side_effect = lambda url: io.BytesIO(sitemaps[url])
+            # page b, modified last, fails to load
+            mock_load_data.side_effect = lambda urls: dummy_load_pages(
+                urls, failing=["https://example.com/b"]
+            )
+            sitemap_reader = SitemapReader(watermark_path=watermark_path)
+
+            sitemap_reader.load_data(sitemap_url="https://example.com/sitemap.xml")
+
+            # the watermark stays before page b
+            with open(watermark_path) as f:
+                assert json.load(f) == {
+                    "https://example.com/sitemap.xml": "2023-01-15T00:00:00+00:00"
+                }
+
+            mock_load_data.side_effect = dummy_load_pages
+            documents = sitemap_reader.load_data(
+                sitemap_url="https://example.com/sitemap.xml"
+            )
+
+            assert [document.extra_info["Source"] for document in documents] == [
+                "https://example.com/b",
+                "https://example.com/c",
+            ]
+            with open(watermark_path) as f:
+                assert json.load(f) == {
+                    "https://example.com/sitemap.xml": "2023-03-01T12:00:00+00:00"
+                }
+
+
+@pytest.mark.asyncio
+async def test_sitemap_reader_alazy_load_data_watermark_failed_page(tmp_path):
+    sitemaps = {"https://example.com/pages.xml": PAGES_SITEMAP.encode()}
+    watermark_path = str(tmp_path / "watermark.json")
+
+    with patch("urllib.request.urlopen") as mock_urlopen, patch(
+        "llama_hub.web.async_web.base.AsyncWebPageReader.alazy_load_data_with_urls"
+    ) as mock_load_data:
+        mock_urlopen.side_effect = lambda url: io.BytesIO(sitemaps[url])
+        mock_load_data.side_effect = lambda urls: dummy_load_pages(
+            urls, failing=["https://example.com/b"]
+        )
+        sitemap_reader = SitemapReader(watermark_path=watermark_path)
+
+        documents = [
+            document
+            async for document in sitemap_reader.alazy_load_data(
+                "https://example.com/pages.xml"
+            )
+        ]
+
+    assert [document.extra_info["Source"] for document in documents] == [
+        "https://example.com/a",
+        "https://example.com/c",
+    ]
+    with open(watermark_path) as f:
+        assert json.load(f) == {
+            "https://example.com/pages.xml": "2023-01-15T00:00:00+00:00"
+        }
+
+
+def test_sitemap_reader_watermark_redirected_location(tmp_path):
+    sitemaps = {"https://example.com/pages.xml": PAGES_SITEMAP.encode()}
+    watermark_path = str(tmp_path / "watermark.json")
+
+    with patch("urllib.request.urlopen") as mock_urlopen, patch(
+        "llama_hub.web.async_web.base.AsyncWebPageReader.alazy_load_data_with_urls"
+    ) as mock_load_data:
+        mock_urlopen.side_effect = lambda url: io.BytesIO(sitemaps[url])
+        # page b, modified last, redirects to a trailing slash
+        mock_load_data.side_effect = lambda urls: dummy_load_pages(
+            urls, redirects={"https://example.com/b": "https://example.com/b/"}
+        )
+        sitemap_reader = SitemapReader(watermark_path=watermark_path)
+
+        documents = sitemap_reader.load_data("https://example.com/pages.xml")
+
+    assert [document.extra_info["Source"] for document in documents] == [
+        "https://example.com/a",
+        "https://example.com/b/",
+        "https://example.com/c",
+    ]
+    # the redirected page counts as loaded
+    with open(watermark_path) as f:
+        assert json.load(f) == {
+            "https://example.com/pages.xml": "2023-03-01T12:00:00+00:00"
+        }
+
+
+def test_sitemap_reader_closes_gzipped_sitemap():
+    responses = []
+    buffered_readers = []
+    buffered_reader = io.BufferedReader
+
+    def urlopen(url):
+        responses.append(io.BytesIO(gzip.compress(PAGES_SITEMAP.encode())))
+        return responses[-1]
+
+    def keep_buffered_reader(raw, *args):
+        # keep the wrappers alive, so that collecting them closes nothing
+        buffered_readers.append(buffered_reader(raw, *args))
+        return buffered_readers[-1]
+
+    with patch("urllib.request.urlopen", side_effect=urlopen), patch(
+        "io.BufferedReader", side_effect=keep_buffered_reader
+    ):
+        entries = list(SitemapReader()._iter_sitemap_urls("https://example.com/a.xml"))
+
+    assert len(entries) == 3
+    assert responses[0].closed